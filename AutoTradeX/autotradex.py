@@ -8,23 +8,50 @@ import os
 import asyncio
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+import hashlib
 import uuid
 
 # Core dependencies
 import numpy as np
 import pandas as pd
-from groq import Groq
+from groq import AsyncGroq
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from qdrant_client import QdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance, VectorParams, SearchRequest, SearchParams,
+    ScalarQuantization, ScalarQuantizationConfig, ScalarType, QuantizationSearchParams
+)
+try:
+    from fastembed import TextEmbedding
+except ImportError:  # optional; QdrantMemory falls back to hash-seeded vectors
+    TextEmbedding = None
 import websockets
 import asyncio
 from fastapi import FastAPI, WebSocket
+from fastapi.responses import JSONResponse
 import uvicorn
 
+try:
+    import orjson
+except ImportError:  # optional; JSON falls back to the stdlib module
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+from backend.utils.indicators import mean_and_volatility, rsi
+
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
@@ -33,6 +60,19 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Parses str or bytes; orjson decodes LLM and CoinGecko payloads several times faster
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def json_dumps(obj: Any) -> str:
+    """Compact JSON with sorted keys, so equal inputs always serialize to the same bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"))
+
+# Trade actions in vote order; the index of each is its bin when combining agent votes
+ACTIONS = ("BUY", "SELL", "HOLD")
+ACTION_INDEX = {action: i for i, action in enumerate(ACTIONS)}
+
 @dataclass
 class TradeOutcome:
     """Store trade outcome with context for learning"""
@@ -42,7 +82,7 @@ class TradeOutcome:
     exit_price: float
     roi: float
     market_conditions: Dict
-    timestamp: str
+    timestamp: float  # Unix time; formatted as ISO 8601 only when serialized
     lessons_learned: List[str]
     agent_reasoning: str
 
@@ -56,68 +96,79 @@ class MarketData:
     rsi: float
     moving_avg_20: float
     sentiment_score: float
-    timestamp: str
+    timestamp: float  # Unix time; formatted as ISO 8601 only when serialized
+
+def _with_iso_timestamp(record: Dict) -> Dict:
+    """Copy of `record` with its Unix `timestamp`, if any, formatted as local ISO 8601"""
+    if "timestamp" not in record:
+        return record
+    return {**record, "timestamp": datetime.fromtimestamp(record["timestamp"]).isoformat()}
+
+def _as_record(obj: Any) -> Dict:
+    """Dataclass as a response dict, with its timestamp formatted for display"""
+    return _with_iso_timestamp(asdict(obj))
+
+# Static instructions sent as the system message. Keeping them identical across
+# calls, ahead of the per-call market data, lets Groq cache the prompt prefix
+STRATEGY_SYSTEM_PROMPT = """You are an expert {agent_type} trading agent. Analyze the market data and previous learning provided by the user and generate a trading strategy.
+
+Market data fields: symbol, price_usd, volume, volatility, rsi, moving_avg_20_usd (20-period moving average) and sentiment_score (-1 to 1).
+
+Generate a trading decision with:
+1. Action: BUY, SELL, or HOLD
+2. Confidence: 0-1 scale
+3. Position Size: percentage of portfolio (0-100%)
+4. Stop Loss: percentage below entry
+5. Take Profit: percentage above entry
+6. Reasoning: Why this decision
+
+Respond ONLY as a JSON object with keys: action, confidence, position_size, stop_loss, take_profit, reasoning."""
 
 class GroqAgent:
     """Base AI agent using Groq for strategy generation"""
     
     def __init__(self, agent_type: str, model: str = "llama3-70b-8192"):
-        self.client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+        self.client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
         self.agent_type = agent_type
         self.model = model
         self.memory = []
+        self._system_prompt = STRATEGY_SYSTEM_PROMPT.format(agent_type=agent_type)
         
-    def generate_strategy(self, market_data: MarketData, memory_context: List[Dict]) -> Dict:
+    async def generate_strategy(self, market_data: MarketData, memory_context: List[Dict]) -> Dict:
         """Generate trading strategy using Groq"""
         
-        # Create context from memory
-        memory_summary = self._summarize_memory(memory_context)
-        
-        prompt = f"""
-        You are an expert {self.agent_type} trading agent. Analyze the current market data and generate a trading strategy.
-        
-        Current Market Data:
-        - Symbol: {market_data.symbol}
-        - Price: ${market_data.price}
-        - Volume: {market_data.volume}
-        - Volatility: {market_data.volatility}
-        - RSI: {market_data.rsi}
-        - 20-day MA: ${market_data.moving_avg_20}
-        - Sentiment Score: {market_data.sentiment_score} (-1 to 1)
-        
-        Previous Learning:
-        {memory_summary}
-        
-        Generate a trading decision with:
-        1. Action: BUY, SELL, or HOLD
-        2. Confidence: 0-1 scale
-        3. Position Size: percentage of portfolio (0-100%)
-        4. Stop Loss: percentage below entry
-        5. Take Profit: percentage above entry
-        6. Reasoning: Why this decision
-        
-        Respond in JSON format only.
-        """
+        # Only this block varies between calls; the system prompt stays byte-identical
+        # so the provider can reuse its cached prefix
+        market_block = json_dumps({
+            "symbol": market_data.symbol,
+            "price_usd": market_data.price,
+            "volume": market_data.volume,
+            "volatility": market_data.volatility,
+            "rsi": market_data.rsi,
+            "moving_avg_20_usd": market_data.moving_avg_20,
+            "sentiment_score": market_data.sentiment_score
+        })
+        prompt = (
+            f"Current Market Data:\n{market_block}\n\n"
+            f"Previous Learning:\n{self._summarize_memory(memory_context)}"
+        )
         
         try:
-            response = self.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
+            response = await self.client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": self._system_prompt},
+                    {"role": "user", "content": prompt}
+                ],
                 model=self.model,
                 temperature=0.3,
-                max_tokens=1000
+                max_tokens=1000,
+                # JSON mode: the reply is always a bare JSON object, never fenced markdown
+                response_format={"type": "json_object"}
             )
             
-            # Parse JSON response
-            strategy_text = response.choices[0].message.content
-            # Clean potential markdown formatting
-            if "```json" in strategy_text:
-                strategy_text = strategy_text.split("```json")[1].split("```")[0]
-            elif "```" in strategy_text:
-                strategy_text = strategy_text.split("```")[1]
-                
-            strategy = json.loads(strategy_text.strip())
+            strategy = json_loads(response.choices[0].message.content)
             strategy['agent_type'] = self.agent_type
-            strategy['timestamp'] = datetime.now().isoformat()
+            strategy['timestamp'] = time.time()
             
             return strategy
             
@@ -147,15 +198,95 @@ class GroqAgent:
         
         return summary
 
+# 384-d sentence embedder, matching the memory collection's vector size
+EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+EMBEDDING_SIZE = 384
+EMBED_BATCH_SIZE = 32
+
+# Search the quantized vectors for 2x the hits, then rescore those with the originals
+QUANTIZED_SEARCH = SearchParams(
+    quantization=QuantizationSearchParams(ignore=False, rescore=True, oversampling=2.0)
+)
+
+class QueryCache:
+    """Thread-safe LRU + TTL cache of memory search results.
+    A lookup hits any unexpired entry whose query vector has cosine
+    similarity >= sim_threshold with the new query, so near-identical
+    market conditions in successive cycles skip the Qdrant round trip."""
+    
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 300.0, sim_threshold: float = 0.98):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.sim_threshold = sim_threshold
+        self._lock = threading.RLock()
+        # One row per slot, allocated on the first put once the dimension is known
+        self._vectors: Optional[np.ndarray] = None
+        self._expires = np.full(max_size, -np.inf)
+        self._limits = np.zeros(max_size, dtype=np.int64)
+        self._results: List[Optional[List[Dict]]] = [None] * max_size
+        # Occupied slots, least recently used first
+        self._lru: "OrderedDict[int, None]" = OrderedDict()
+    
+    def get(self, query_vector: np.ndarray, limit: int) -> Optional[List[Dict]]:
+        """Cached results for a similar query asked with at least `limit`, or None"""
+        query = query_vector / np.linalg.norm(query_vector)
+        with self._lock:
+            if self._vectors is None:
+                return None
+            
+            sims = self._vectors @ query
+            sims[(self._expires < time.monotonic()) | (self._limits < limit)] = -np.inf
+            slot = int(np.argmax(sims))
+            if sims[slot] < self.sim_threshold:
+                return None
+            
+            self._lru.move_to_end(slot)
+            return self._results[slot][:limit]
+    
+    def put(self, query_vector: np.ndarray, limit: int, results: List[Dict]):
+        query = query_vector / np.linalg.norm(query_vector)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_size, query.shape[0]), dtype=np.float32)
+            
+            if len(self._lru) < self.max_size:
+                slot = len(self._lru)
+            else:
+                slot, _ = self._lru.popitem(last=False)
+            
+            self._vectors[slot] = query
+            self._expires[slot] = time.monotonic() + self.ttl_seconds
+            self._limits[slot] = limit
+            self._results[slot] = list(results)
+            self._lru[slot] = None
+    
+    def clear(self):
+        with self._lock:
+            self._expires[:] = -np.inf
+            self._results = [None] * self.max_size
+            self._lru.clear()
+
 class QdrantMemory:
     """Vector memory storage using Qdrant"""
     
     def __init__(self):
+        # gRPC sends vectors as packed protobuf floats instead of JSON arrays
         self.client = QdrantClient(
             url=os.getenv("QDRANT_URL"),
-            api_key=os.getenv("QDRANT_API_KEY")
+            api_key=os.getenv("QDRANT_API_KEY"),
+            prefer_grpc=True,
+            grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+            timeout=10
         )
         self.collection_name = "autotradex_memory"
+        if TextEmbedding is not None:
+            self.embedder = TextEmbedding(EMBEDDING_MODEL)
+        else:
+            self.embedder = None
+            logger.warning("fastembed not installed; memory search uses hash-based vectors")
+        # Recent query/outcome texts repeat, so keep their embeddings
+        self._cached_embedding = lru_cache(maxsize=4096)(self._embed_one)
+        self.query_cache = QueryCache()
         self._initialize_collection()
     
     def _initialize_collection(self):
@@ -163,64 +294,106 @@ class QdrantMemory:
         try:
             collections = self.client.get_collections().collections
             if not any(col.name == self.collection_name for col in collections):
+                # int8 copies of the vectors stay in RAM for search; the float32
+                # originals live on disk and are only read to rescore the top hits
                 self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+                    vectors_config=VectorParams(size=EMBEDDING_SIZE, distance=Distance.COSINE, on_disk=True),
+                    quantization_config=ScalarQuantization(
+                        scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+                    )
                 )
                 logger.info(f"Created collection: {self.collection_name}")
         except Exception as e:
             logger.error(f"Error initializing Qdrant: {e}")
     
+    @staticmethod
+    def _outcome_text(outcome: TradeOutcome) -> str:
+        return f"Strategy: {outcome.strategy_id}, ROI: {outcome.roi:.2%}, Conditions: {outcome.market_conditions}, Lessons: {outcome.lessons_learned}"
+    
     def store_outcome(self, outcome: TradeOutcome):
         """Store trade outcome in vector memory"""
+        self.store_outcomes([outcome])
+    
+    def store_outcomes(self, outcomes: List[TradeOutcome]):
+        """Store several trade outcomes with one embedding pass and one upsert"""
+        if not outcomes:
+            return
+        
         try:
-            # Create embedding from outcome data
-            text_data = f"Strategy: {outcome.strategy_id}, ROI: {outcome.roi:.2%}, Conditions: {outcome.market_conditions}, Lessons: {outcome.lessons_learned}"
+            vectors = self._embed_batch([self._outcome_text(outcome) for outcome in outcomes])
             
-            # Simple embedding (in production, use proper embedding model)
-            vector = self._create_simple_embedding(text_data)
-            
-            point = PointStruct(
-                id=str(uuid.uuid4()),
-                vector=vector,
-                payload=asdict(outcome)
-            )
-            
-            self.client.upsert(
+            # The float32 matrix goes to the client as is; no per-point Python float lists
+            # Don't wait for indexing; the trading cycle never reads its own writes back
+            self.client.upload_collection(
                 collection_name=self.collection_name,
-                points=[point]
+                vectors=vectors,
+                payload=[asdict(outcome) for outcome in outcomes],
+                ids=[str(uuid.uuid4()) for _ in outcomes],
+                wait=False
             )
+            # Cached searches may now be missing the new outcomes
+            self.query_cache.clear()
             
-            logger.info(f"Stored outcome: {outcome.strategy_id} with ROI {outcome.roi:.2%}")
+            for outcome in outcomes:
+                logger.info(f"Stored outcome: {outcome.strategy_id} with ROI {outcome.roi:.2%}")
             
         except Exception as e:
             logger.error(f"Error storing outcome: {e}")
     
     def retrieve_similar_outcomes(self, market_conditions: Dict, limit: int = 10) -> List[Dict]:
         """Retrieve similar trading outcomes"""
+        return self.retrieve_similar_batch([market_conditions], limit)[0]
+    
+    def retrieve_similar_batch(self, conditions_list: List[Dict], limit: int = 10) -> List[List[Dict]]:
+        """Retrieve similar outcomes for several market conditions in one Qdrant request"""
         try:
-            # Create query vector from current conditions
-            query_text = f"Market conditions: {market_conditions}"
-            query_vector = self._create_simple_embedding(query_text)
+            # Create query vectors from the conditions
+            vectors = [
+                self._cached_embedding(f"Market conditions: {conditions}") for conditions in conditions_list
+            ]
             
-            results = self.client.search(
-                collection_name=self.collection_name,
-                query_vector=query_vector,
-                limit=limit
-            )
+            results: List[Optional[List[Dict]]] = [self.query_cache.get(vector, limit) for vector in vectors]
+            misses = [i for i, cached in enumerate(results) if cached is None]
+            if misses:
+                batches = self.client.search_batch(
+                    collection_name=self.collection_name,
+                    requests=[
+                        SearchRequest(
+                            vector=vectors[i].tolist(), limit=limit, with_payload=True, params=QUANTIZED_SEARCH
+                        )
+                        for i in misses
+                    ]
+                )
+                for i, points in zip(misses, batches):
+                    results[i] = [point.payload for point in points]
+                    self.query_cache.put(vectors[i], limit, results[i])
             
-            return [result.payload for result in results]
+            return results
             
         except Exception as e:
             logger.error(f"Error retrieving outcomes: {e}")
-            return []
+            return [[] for _ in conditions_list]
+    
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in batches of EMBED_BATCH_SIZE; one float32 row per text"""
+        if self.embedder is None:
+            return np.stack([self._hash_embedding(text) for text in texts])
+        return np.asarray(list(self.embedder.embed(texts, batch_size=EMBED_BATCH_SIZE)), dtype=np.float32)
+    
+    def _embed_one(self, text: str) -> np.ndarray:
+        vector = self._embed_batch([text])[0]
+        # Read-only, so the cached array can't be mutated by a caller
+        vector.flags.writeable = False
+        return vector
     
-    def _create_simple_embedding(self, text: str, size: int = 384) -> List[float]:
-        """Create simple hash-based embedding (replace with proper model in production)"""
-        # Simple hash-based embedding for demo
-        hash_val = hash(text)
-        np.random.seed(abs(hash_val) % (2**32))
-        return np.random.normal(0, 1, size).tolist()
+    @staticmethod
+    def _hash_embedding(text: str) -> np.ndarray:
+        """Deterministic placeholder vector when fastembed is unavailable.
+        Seeded from a stable digest with a local generator, so it neither
+        depends on PYTHONHASHSEED nor reseeds NumPy's global RNG."""
+        seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+        return np.random.default_rng(seed).standard_normal(EMBEDDING_SIZE, dtype=np.float32)
 
 class MarketDataProvider:
     """Fetch real-time market data from CoinGecko"""
@@ -228,56 +401,26 @@ class MarketDataProvider:
     def __init__(self):
         self.base_url = "https://api.coingecko.com/api/v3"
         self.session = requests.Session()
+        # Keep connections to CoinGecko alive and retry rate limits / transient errors
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        # symbol -> (minute fetched, data); market data is reused for the rest of the minute
+        self._market_cache: Dict[str, Tuple[int, MarketData]] = {}
     
-    def get_market_data(self, symbol: str = "bitcoin") -> MarketData:
+    async def get_market_data(self, symbol: str = "bitcoin") -> MarketData:
         """Fetch current market data"""
+        minute = int(time.time() // 60)
+        cached = self._market_cache.get(symbol)
+        if cached is not None and cached[0] == minute:
+            return cached[1]
+        
         try:
-            # Get price data
-            price_url = f"{self.base_url}/simple/price"
-            price_params = {
-                "ids": symbol,
-                "vs_currencies": "usd",
-                "include_24hr_vol": "true",
-                "include_24hr_change": "true"
-            }
-            
-            price_response = self.session.get(price_url, params=price_params)
-            price_data = price_response.json()
-            
-            # Get historical data for technical indicators
-            history_url = f"{self.base_url}/coins/{symbol}/market_chart"
-            history_params = {
-                "vs_currency": "usd",
-                "days": "30",
-                "interval": "daily"
-            }
-            
-            history_response = self.session.get(history_url, params=history_params)
-            history_data = history_response.json()
-            
-            # Calculate technical indicators
-            prices = [point[1] for point in history_data["prices"]]
-            volumes = [point[1] for point in history_data["total_volumes"]]
-            
-            current_price = price_data[symbol]["usd"]
-            volatility = np.std(prices[-20:]) / np.mean(prices[-20:]) if len(prices) >= 20 else 0.1
-            rsi = self._calculate_rsi(prices)
-            moving_avg_20 = np.mean(prices[-20:]) if len(prices) >= 20 else current_price
-            
-            # Simple sentiment score based on 24h change
-            change_24h = price_data[symbol].get("usd_24h_change", 0)
-            sentiment_score = max(-1, min(1, change_24h / 10))  # Normalize to -1 to 1
-            
-            return MarketData(
-                symbol=symbol,
-                price=current_price,
-                volume=volumes[-1] if volumes else 0,
-                volatility=volatility,
-                rsi=rsi,
-                moving_avg_20=moving_avg_20,
-                sentiment_score=sentiment_score,
-                timestamp=datetime.now().isoformat()
-            )
+            market_data = await self._fetch_market_data(symbol)
+            self._market_cache[symbol] = (minute, market_data)
+            return market_data
             
         except Exception as e:
             logger.error(f"Error fetching market data: {e}")
@@ -290,27 +433,64 @@ class MarketDataProvider:
                 rsi=50.0,
                 moving_avg_20=49000.0,
                 sentiment_score=0.0,
-                timestamp=datetime.now().isoformat()
+                timestamp=time.time()
             )
     
-    def _calculate_rsi(self, prices: List[float], period: int = 14) -> float:
-        """Calculate RSI indicator"""
-        if len(prices) < period + 1:
-            return 50.0  # Neutral RSI
-        
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [delta if delta > 0 else 0 for delta in deltas[-period:]]
-        losses = [-delta if delta < 0 else 0 for delta in deltas[-period:]]
+    def _get_json(self, url: str, params: Dict) -> Dict:
+        response = self.session.get(url, params=params)
+        response.raise_for_status()
+        return json_loads(response.content)
+    
+    async def _fetch_market_data(self, symbol: str) -> MarketData:
+        """Query CoinGecko; errors propagate so a failed fetch is never cached"""
+        # Price data
+        price_url = f"{self.base_url}/simple/price"
+        price_params = {
+            "ids": symbol,
+            "vs_currencies": "usd",
+            "include_24hr_vol": "true",
+            "include_24hr_change": "true"
+        }
         
-        avg_gain = np.mean(gains)
-        avg_loss = np.mean(losses)
+        # Historical data for technical indicators
+        history_url = f"{self.base_url}/coins/{symbol}/market_chart"
+        history_params = {
+            "vs_currency": "usd",
+            "days": "30",
+            "interval": "daily"
+        }
         
-        if avg_loss == 0:
-            return 100.0
+        # Both requests at once; the blocking session calls run in worker threads
+        price_data, history_data = await asyncio.gather(
+            asyncio.to_thread(self._get_json, price_url, price_params),
+            asyncio.to_thread(self._get_json, history_url, history_params)
+        )
         
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        # Calculate technical indicators
+        prices = np.asarray([point[1] for point in history_data["prices"]], dtype=np.float64)
+        volumes = history_data["total_volumes"]
+        
+        current_price = price_data[symbol]["usd"]
+        if len(prices) >= 20:
+            moving_avg_20, volatility = mean_and_volatility(prices, 20)
+        else:
+            volatility = 0.1
+            moving_avg_20 = current_price
+        
+        # Simple sentiment score based on 24h change
+        change_24h = price_data[symbol].get("usd_24h_change", 0)
+        sentiment_score = max(-1, min(1, change_24h / 10))  # Normalize to -1 to 1
+        
+        return MarketData(
+            symbol=symbol,
+            price=current_price,
+            volume=volumes[-1][1] if volumes else 0,
+            volatility=volatility,
+            rsi=rsi(prices),
+            moving_avg_20=moving_avg_20,
+            sentiment_score=sentiment_score,
+            timestamp=time.time()
+        )
 
 class AutoTradeXSystem:
     """Main AutoTradeX orchestration system"""
@@ -332,70 +512,103 @@ class AutoTradeXSystem:
             "total_roi": 0.0,
             "weekly_improvement": []
         }
+        # Bumped on every stats change; waiters on the current event are woken, then it is replaced
+        self.metrics_version = 0
+        self._metrics_changed = asyncio.Event()
     
     async def run_trading_cycle(self, symbol: str = "bitcoin"):
         """Execute one complete trading cycle"""
-        logger.info(f"Starting trading cycle for {symbol}")
+        return (await self.run_trading_round([symbol]))[0]
+    
+    async def run_trading_round(self, symbols: List[str]) -> List[Dict]:
+        """Execute one trading cycle per symbol, sharing one memory search and one memory write"""
+        for symbol in symbols:
+            logger.info(f"Starting trading cycle for {symbol}")
         
         # 1. Fetch market data
-        market_data = self.market_data_provider.get_market_data(symbol)
-        logger.info(f"Market data: {symbol} @ ${market_data.price}")
+        market_data_list = await asyncio.gather(*[
+            self.market_data_provider.get_market_data(symbol) for symbol in symbols
+        ])
+        for market_data in market_data_list:
+            logger.info(f"Market data: {market_data.symbol} @ ${market_data.price}")
         
         # 2. Get relevant memory
-        memory_context = self.memory.retrieve_similar_outcomes(
-            {"volatility": market_data.volatility, "rsi": market_data.rsi}
-        )
-        
-        # 3. Generate strategies from multiple agents
-        strategies = {}
-        for agent_name, agent in self.agents.items():
-            strategy = agent.generate_strategy(market_data, memory_context)
-            strategies[agent_name] = strategy
-            logger.info(f"{agent_name} agent decision: {strategy.get('action', 'HOLD')}")
-        
-        # 4. Combine strategies (simple voting mechanism)
-        final_decision = self._combine_strategies(strategies)
-        
-        # 5. Execute trade (simulation)
-        trade_outcome = self._execute_trade(final_decision, market_data)
+        memory_contexts = self.memory.retrieve_similar_batch([
+            self._memory_conditions(market_data) for market_data in market_data_list
+        ])
+        
+        # 3. Generate strategies from multiple agents, with all Groq calls in flight together
+        strategies_list = await asyncio.gather(*[
+            self._generate_strategies(market_data, memory_context)
+            for market_data, memory_context in zip(market_data_list, memory_contexts)
+        ])
+        
+        results = []
+        outcomes = []
+        for market_data, strategies in zip(market_data_list, strategies_list):
+            # 4. Combine strategies (simple voting mechanism)
+            final_decision = self._combine_strategies(strategies)
+            
+            # 5. Execute trade (simulation)
+            trade_outcome = self._execute_trade(final_decision, market_data)
+            if trade_outcome:
+                outcomes.append(trade_outcome)
+                self._update_evolution_stats(trade_outcome)
+            
+            results.append({
+                "market_data": _as_record(market_data),
+                "strategies": {name: _with_iso_timestamp(s) for name, s in strategies.items()},
+                "final_decision": final_decision,
+                "trade_outcome": _as_record(trade_outcome) if trade_outcome else None,
+                "portfolio_value": self.portfolio_value
+            })
         
-        # 6. Store outcome in memory
-        if trade_outcome:
-            self.memory.store_outcome(trade_outcome)
-            self._update_evolution_stats(trade_outcome)
+        # 6. Store outcomes in memory
+        self.memory.store_outcomes(outcomes)
         
+        return results
+    
+    @staticmethod
+    def _memory_conditions(market_data: MarketData) -> Dict[str, float]:
+        """Market conditions for the memory query, bucketed so that nearby readings
+        give the same query text and reuse the cached embedding and search results"""
         return {
-            "market_data": asdict(market_data),
-            "strategies": strategies,
-            "final_decision": final_decision,
-            "trade_outcome": asdict(trade_outcome) if trade_outcome else None,
-            "portfolio_value": self.portfolio_value
+            "volatility": round(market_data.volatility, 2),
+            "rsi": 5 * round(market_data.rsi / 5),
+            "sentiment": round(market_data.sentiment_score, 1)
         }
     
+    async def _generate_strategies(self, market_data: MarketData, memory_context: List[Dict]) -> Dict[str, Dict]:
+        """Ask every agent for a strategy concurrently, keyed by agent name"""
+        results = await asyncio.gather(*[
+            agent.generate_strategy(market_data, memory_context) for agent in self.agents.values()
+        ])
+        strategies = dict(zip(self.agents, results))
+        for agent_name, strategy in strategies.items():
+            logger.info(f"{market_data.symbol} {agent_name} agent decision: {strategy.get('action', 'HOLD')}")
+        return strategies
+    
     def _combine_strategies(self, strategies: Dict) -> Dict:
         """Combine multiple agent strategies using weighted voting"""
-        actions = [s.get("action", "HOLD") for s in strategies.values()]
-        confidences = [s.get("confidence", 0.1) for s in strategies.values()]
+        # One pass over the agents: (action index, confidence, position size) per row
+        votes = np.array([
+            (ACTION_INDEX[s.get("action", "HOLD")], s.get("confidence", 0.1), s.get("position_size", 0))
+            for s in strategies.values()
+        ], dtype=np.float64)
+        confidences = votes[:, 1]
         
         # Weight votes by confidence
-        action_weights = {"BUY": 0, "SELL": 0, "HOLD": 0}
-        
-        for action, confidence in zip(actions, confidences):
-            action_weights[action] += confidence
+        weights = np.bincount(votes[:, 0].astype(np.intp), weights=confidences, minlength=len(ACTIONS))
         
-        # Choose action with highest weighted vote
-        final_action = max(action_weights, key=action_weights.get)
-        
-        # Average other parameters
-        avg_confidence = np.mean(confidences)
-        avg_position_size = np.mean([s.get("position_size", 0) for s in strategies.values()])
+        # Choose action with highest weighted vote (ties go to the earlier action, as before)
+        final_action = ACTIONS[int(weights.argmax())]
         
         return {
             "action": final_action,
-            "confidence": avg_confidence,
-            "position_size": min(avg_position_size, 10),  # Cap at 10% for safety
+            "confidence": float(confidences.mean()),
+            "position_size": min(float(votes[:, 2].mean()), 10),  # Cap at 10% for safety
             "reasoning": f"Combined decision from {len(strategies)} agents",
-            "vote_weights": action_weights
+            "vote_weights": dict(zip(ACTIONS, weights.tolist()))
         }
     
     def _execute_trade(self, decision: Dict, market_data: MarketData) -> Optional[TradeOutcome]:
@@ -442,7 +655,7 @@ class AutoTradeXSystem:
                     "rsi": market_data.rsi,
                     "sentiment": market_data.sentiment_score
                 },
-                timestamp=datetime.now().isoformat(),
+                timestamp=time.time(),
                 lessons_learned=self._extract_lessons(roi, market_data),
                 agent_reasoning=decision["reasoning"]
             )
@@ -492,6 +705,15 @@ class AutoTradeXSystem:
                 "avg_roi": avg_roi,
                 "total_trades": self.evolution_stats["total_trades"]
             })
+        
+        self.metrics_version += 1
+        self._metrics_changed.set()
+        self._metrics_changed = asyncio.Event()
+    
+    async def wait_for_metrics(self, seen_version: int):
+        """Return once the evolution metrics have changed since `seen_version`"""
+        if self.metrics_version == seen_version:
+            await self._metrics_changed.wait()
     
     def get_evolution_metrics(self) -> Dict:
         """Get current evolution metrics"""
@@ -512,7 +734,19 @@ class AutoTradeXSystem:
         }
 
 # FastAPI Web Interface
-app = FastAPI(title="AutoTradeX", description="Self-Evolving Crypto Trading Agents")
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by orjson in C, or the stdlib encoder without it"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+app = FastAPI(
+    title="AutoTradeX",
+    description="Self-Evolving Crypto Trading Agents",
+    default_response_class=FastJSONResponse
+)
 trading_system = None
 
 @app.on_event("startup")
@@ -546,18 +780,35 @@ async def get_metrics():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket for real-time updates"""
     await websocket.accept()
+    if not trading_system:
+        await websocket.close(code=1013)  # Try again later; startup hasn't created the system yet
+        return
     
+    # Listen for the client while waiting for trades, so a closed socket ends
+    # this handler at once instead of when the next trade is made
+    receive = asyncio.ensure_future(websocket.receive())
+    changed = None
     try:
         while True:
-            # Send periodic updates
-            if trading_system:
-                metrics = trading_system.get_evolution_metrics()
-                await websocket.send_json({"type": "metrics", "data": metrics})
+            # Push the metrics on connect and then only when a trade changes them
+            version = trading_system.metrics_version
+            metrics = trading_system.get_evolution_metrics()
+            await websocket.send_json({"type": "metrics", "data": metrics})
             
-            await asyncio.sleep(30)  # Update every 30 seconds
+            changed = asyncio.ensure_future(trading_system.wait_for_metrics(version))
+            while not changed.done():
+                await asyncio.wait({changed, receive}, return_when=asyncio.FIRST_COMPLETED)
+                if receive.done():
+                    if receive.result()["type"] == "websocket.disconnect":
+                        return
+                    receive = asyncio.ensure_future(websocket.receive())  # Client messages are ignored
             
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
+    finally:
+        receive.cancel()
+        if changed is not None:
+            changed.cancel()
 
 async def main():
     """Main execution function"""
@@ -572,14 +823,13 @@ async def main():
     for i in range(3):  # Run 3 cycles
         logger.info(f"\n--- Trading Cycle {i+1} ---")
         
-        for symbol in symbols:
-            try:
-                result = await system.run_trading_cycle(symbol)
-                logger.info(f"Cycle completed for {symbol}")
-                await asyncio.sleep(2)  # Small delay between trades
-                
-            except Exception as e:
-                logger.error(f"Error in trading cycle for {symbol}: {e}")
+        # Trade all symbols in one round
+        try:
+            await system.run_trading_round(symbols)
+            logger.info(f"Cycle completed for {', '.join(symbols)}")
+            
+        except Exception as e:
+            logger.error(f"Error in trading round for {', '.join(symbols)}: {e}")
         
         # Show metrics after each round
         metrics = system.get_evolution_metrics()
@@ -596,7 +846,11 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # main() also serves the API, so the whole process runs on this loop
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("AutoTradeX stopped by user")
     except Exception as e:
@@ -17,7 +17,7 @@ import os
 # Add the parent directory to sys.path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from backend.utils.config import get_config_value
+from backend.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +37,8 @@ class MCPStrategyAgent:
     
     def __init__(self):
         """Initialize the strategy agent with Groq LLM"""
-        api_key = get_config_value("groq.api_key")
-        model = get_config_value("groq.model", "llama3-70b-8192")
+        api_key = settings.groq_api_key
+        model = settings.groq_model
         
         logger.debug(f"Initializing MCPStrategyAgent with model: {model}")
         self.llm = ChatGroq(
@@ -26,7 +26,7 @@ from backend.mcp.protocol import ModelContextProtocol
 from backend.mcp.context import AgentContext
 from backend.mcp.memory import VectorMemory
 from backend.mcp.orchestrator import AgentOrchestrator
-from backend.utils.config import get_config_value
+from backend.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +51,8 @@ mcp = ModelContextProtocol()
 memory = VectorMemory(
     storage_type="qdrant",
     collection_name="autotradex_memories",
-    qdrant_url=get_config_value("qdrant.url", None),
-    qdrant_api_key=get_config_value("qdrant.api_key", None)
+    qdrant_url=settings.qdrant_url or None,
+    qdrant_api_key=settings.qdrant_api_key or None
 )
 # Initialize the orchestrator with default parameters
 orchestrator = AgentOrchestrator(use_langgraph=False)
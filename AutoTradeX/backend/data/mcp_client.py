@@ -16,6 +16,8 @@ import os
 # Add the parent directory to sys.path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+from backend.utils.config import settings
+
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +26,9 @@ class CoinGeckoMCPClient:
     
     def __init__(self):
         """Initialize the CoinGecko MCP client"""
-        self.base_url = get_config_value("coingecko.mcp_base_url", "https://mcp.api.coingecko.com")
-        self.api_key = get_config_value("coingecko.api_key", "")
-        self.environment = get_config_value("coingecko.environment", "")
+        self.base_url = settings.mcp_base_url
+        self.api_key = settings.coingecko_api_key
+        self.environment = settings.coingecko_environment
         
         # Set up headers based on environment
         self.headers = {"Content-Type": "application/json"}
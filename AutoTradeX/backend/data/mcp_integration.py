@@ -16,7 +16,7 @@ import os
 # Add the parent directory to sys.path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from backend.utils.config import get_config_value
+from backend.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +26,9 @@ class CoinGeckoMCP:
     def __init__(self):
         """Initialize the MCP integration"""
         # Default to the Public CoinGecko API
-        self.base_url = get_config_value("coingecko.base_url", "https://api.coingecko.com")
-        self.api_key = get_config_value("coingecko.api_key", "")
-        self.environment = get_config_value("coingecko.environment", "")
+        self.base_url = settings.coingecko_base_url
+        self.api_key = settings.coingecko_api_key
+        self.environment = settings.coingecko_environment
         
         # Set up headers based on environment
         self.headers = {"Content-Type": "application/json"}
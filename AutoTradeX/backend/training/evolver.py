@@ -17,7 +17,7 @@ import os
 # Add the parent directory to sys.path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from backend.utils.config import get_config_value
+from backend.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -27,12 +27,8 @@ class AgentEvolver:
     def __init__(self):
         """Initialize the agent evolution system"""
         self.memory = QdrantMemory()
-        self.evolution_threshold = get_config_value(
-            "evolution.improvement_threshold", 0.03
-        )
-        self.min_trades = get_config_value(
-            "evolution.min_trades_for_evolution", 50
-        )
+        self.evolution_threshold = settings.improvement_threshold
+        self.min_trades = settings.min_trades_for_evolution
         
         logger.debug(f"Initialized AgentEvolver with threshold: {self.evolution_threshold}")
     
@@ -20,7 +20,7 @@ import os
 # Add the parent directory to sys.path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from backend.utils.config import get_config_value
+from backend.utils.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -29,9 +29,9 @@ class QdrantMemory:
     
     def __init__(self):
         """Initialize the Qdrant memory system"""
-        self.url = get_config_value("qdrant.url")
-        self.api_key = get_config_value("qdrant.api_key")
-        self.collection_name = get_config_value("qdrant.collection_name", "autotradex_memory")
+        self.url = settings.qdrant_url
+        self.api_key = settings.qdrant_api_key
+        self.collection_name = settings.qdrant_collection_name
         self.vector_size = 1536  # Default for embedding models
         
         logger.debug(f"Initializing QdrantMemory with URL: {self.url}")
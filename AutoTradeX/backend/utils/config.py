@@ -2,44 +2,77 @@
 Configuration utilities for AutoTradeX
 """
 
-import os
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables
-load_dotenv()
+class Settings(BaseSettings):
+    """Typed configuration read once from the environment and .env.
+    Each field is filled from the upper-cased env var of the same name."""
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    
+    # API
+    api_host: str = "127.0.0.1"
+    api_port: int = 8000
+    api_debug: bool = False
+    
+    # Trading
+    max_position_size: float = 0.1
+    risk_factor: float = 0.03
+    default_symbol: str = "bitcoin"
+    
+    # Groq
+    groq_api_key: str = ""
+    groq_model: str = "llama3-70b-8192"
+    
+    # Qdrant
+    qdrant_url: str = ""
+    qdrant_api_key: str = ""
+    qdrant_collection_name: str = "autotradex_memory"
+    
+    # CoinGecko
+    coingecko_api_key: str = ""
+    coingecko_base_url: str = "https://api.coingecko.com"
+    coingecko_environment: str = ""
+    mcp_base_url: str = "https://api.coingecko.com/mcp"
+    
+    # Evolution
+    evolution_cycle_days: int = 7
+    min_trades_for_evolution: int = 50
+    improvement_threshold: float = 0.03
+
+settings = Settings()
 
 # Default configuration
 DEFAULT_CONFIG = {
     "api": {
-        "host": "127.0.0.1",
-        "port": 8000,
-        "debug": False
+        "host": settings.api_host,
+        "port": settings.api_port,
+        "debug": settings.api_debug
     },
     "trading": {
-        "max_position_size": float(os.getenv("MAX_POSITION_SIZE", 0.1)),
-        "risk_factor": float(os.getenv("RISK_FACTOR", 0.03)),
-        "default_symbol": "bitcoin"
+        "max_position_size": settings.max_position_size,
+        "risk_factor": settings.risk_factor,
+        "default_symbol": settings.default_symbol
     },
     "groq": {
-        "api_key": os.getenv("GROQ_API_KEY", ""),
-        "model": os.getenv("GROQ_MODEL", "llama3-70b-8192")
+        "api_key": settings.groq_api_key,
+        "model": settings.groq_model
     },
     "qdrant": {
-        "url": os.getenv("QDRANT_URL", ""),
-        "api_key": os.getenv("QDRANT_API_KEY", ""),
-        "collection_name": "autotradex_memory"
+        "url": settings.qdrant_url,
+        "api_key": settings.qdrant_api_key,
+        "collection_name": settings.qdrant_collection_name
     },
     "coingecko": {
-        "api_key": os.getenv("COINGECKO_API_KEY", ""),
-        "mcp_base_url": os.getenv("MCP_BASE_URL", "https://api.coingecko.com/mcp")
+        "api_key": settings.coingecko_api_key,
+        "mcp_base_url": settings.mcp_base_url
     },
     "evolution": {
-        "cycle_days": 7,
-        "min_trades_for_evolution": 50,
-        "improvement_threshold": 0.03
+        "cycle_days": settings.evolution_cycle_days,
+        "min_trades_for_evolution": settings.min_trades_for_evolution,
+        "improvement_threshold": settings.improvement_threshold
     }
 }
 
@@ -49,21 +82,32 @@ def get_config_path() -> Path:
     config_dir.mkdir(exist_ok=True)
     return config_dir / "config.json"
 
+# Parsed config file, reused until the file's mtime changes
+_CACHE: Dict[str, Any] = {"mtime": 0, "config": None}
+
 def load_config() -> Dict[str, Any]:
     """Load configuration from file or create default"""
     config_path = get_config_path()
     
-    if config_path.exists():
-        try:
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except Exception:
-            # If loading fails, return default config
-            return DEFAULT_CONFIG
-    else:
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         # Create default config file
         save_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG
+    
+    if _CACHE["config"] is not None and mtime == _CACHE["mtime"]:
+        return _CACHE["config"]
+    
+    try:
+        with open(config_path, "r") as f:
+            config = json.load(f)
+    except Exception:
+        # If loading fails, return default config
+        return DEFAULT_CONFIG
+    
+    _CACHE.update(mtime=mtime, config=config)
+    return config
 
 def save_config(config: Dict[str, Any]) -> None:
     """Save configuration to file"""
@@ -71,6 +115,8 @@ def save_config(config: Dict[str, Any]) -> None:
     
     with open(config_path, "w") as f:
         json.dump(config, f, indent=2)
+    
+    _CACHE.update(mtime=config_path.stat().st_mtime_ns, config=config)
 
 def get_config_value(key_path: str, default: Optional[Any] = None) -> Any:
     """
@@ -0,0 +1,84 @@
+"""
+Technical indicators for AutoTradeX
+Numeric kernels compiled with Numba when it is installed, NumPy otherwise
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+except Exception:  # optional; numba also fails at import against an incompatible NumPy
+    numba = None
+
+logger = logging.getLogger(__name__)
+
+
+def _rsi_numpy(prices: np.ndarray, period: int) -> float:
+    """RSI from the simple average of the last `period` gains and losses"""
+    deltas = np.diff(prices[-(period + 1):])
+    avg_gain = np.clip(deltas, 0, None).mean()
+    avg_loss = np.clip(-deltas, 0, None).mean()
+
+    if avg_loss == 0:
+        return 100.0
+    return float(100 - (100 / (1 + avg_gain / avg_loss)))
+
+
+def _mean_cv_numpy(prices: np.ndarray, window: int) -> Tuple[float, float]:
+    """Mean and coefficient of variation (std / mean) of the last `window` prices"""
+    recent = prices[-window:]
+    mean = float(recent.mean())
+    return mean, float(recent.std()) / mean
+
+
+if numba is not None:
+    # Compiled eagerly for float64 price arrays, so the first trading cycle
+    # doesn't pay for JIT compilation
+    @numba.njit("float64(float64[:], int64)", cache=True)
+    def _rsi(prices, period):
+        gains = 0.0
+        losses = 0.0
+        start = prices.shape[0] - period
+        for i in range(start, prices.shape[0]):
+            delta = prices[i] - prices[i - 1]
+            if delta > 0:
+                gains += delta
+            else:
+                losses -= delta
+
+        if losses == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + gains / losses)
+
+    @numba.njit("UniTuple(float64, 2)(float64[:], int64)", cache=True)
+    def _mean_cv(prices, window):
+        start = prices.shape[0] - window
+        total = 0.0
+        for i in range(start, prices.shape[0]):
+            total += prices[i]
+        mean = total / window
+
+        squares = 0.0
+        for i in range(start, prices.shape[0]):
+            squares += (prices[i] - mean) ** 2
+        return mean, np.sqrt(squares / window) / mean
+else:
+    _rsi = _rsi_numpy
+    _mean_cv = _mean_cv_numpy
+
+
+def rsi(prices: np.ndarray, period: int = 14) -> float:
+    """Relative Strength Index over the last `period` price changes"""
+    if len(prices) < period + 1:
+        return 50.0  # Neutral RSI
+    return float(_rsi(np.ascontiguousarray(prices, dtype=np.float64), period))
+
+
+def mean_and_volatility(prices: np.ndarray, window: int = 20) -> Tuple[float, float]:
+    """Moving average and volatility (std / mean) of the last `window` prices.
+    Requires at least `window` prices."""
+    mean, volatility = _mean_cv(np.ascontiguousarray(prices, dtype=np.float64), window)
+    return float(mean), float(volatility)
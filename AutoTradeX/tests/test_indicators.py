@@ -0,0 +1,63 @@
+"""
+Tests for the technical indicator kernels
+"""
+
+import pytest
+
+import sys
+import os
+
+import numpy as np
+
+# Add the AutoTradeX directory to sys.path so backend.utils imports as a package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.utils.indicators import _mean_cv_numpy, _rsi_numpy, mean_and_volatility, rsi
+
+
+@pytest.fixture
+def prices():
+    """A seeded random walk around 100"""
+    rng = np.random.default_rng(7)
+    return 100 + np.cumsum(rng.normal(0, 1.5, 200))
+
+
+class TestIndicators:
+    """Compiled kernels (when numba is installed) match the NumPy reference"""
+
+    @pytest.mark.parametrize("period", [2, 14, 50])
+    def test_rsi_matches_numpy_reference(self, prices, period):
+        for end in (period + 1, 60, len(prices)):
+            assert rsi(prices[:end], period) == pytest.approx(_rsi_numpy(prices[:end], period), rel=1e-12)
+
+    def test_rsi_all_gains(self):
+        prices = np.arange(1.0, 31.0)
+        assert rsi(prices) == 100.0
+        assert _rsi_numpy(prices, 14) == 100.0
+
+    def test_rsi_all_losses(self):
+        prices = np.arange(30.0, 0.0, -1.0)
+        assert rsi(prices) == pytest.approx(0.0)
+        assert _rsi_numpy(prices, 14) == pytest.approx(0.0)
+
+    def test_rsi_too_few_prices_is_neutral(self):
+        assert rsi(np.arange(1.0, 15.0), 14) == 50.0
+        assert rsi(np.array([]), 14) == 50.0
+
+    def test_rsi_accepts_integer_prices(self):
+        prices = np.array([10, 11, 10, 12, 13, 12, 14, 15, 14, 16, 15, 17, 18, 17, 19])
+        assert rsi(prices) == pytest.approx(_rsi_numpy(prices.astype(np.float64), 14), rel=1e-12)
+
+    @pytest.mark.parametrize("window", [1, 20, 200])
+    def test_mean_and_volatility_matches_numpy_reference(self, prices, window):
+        mean, volatility = mean_and_volatility(prices, window)
+        ref_mean, ref_volatility = _mean_cv_numpy(prices, window)
+        assert mean == pytest.approx(ref_mean, rel=1e-12)
+        assert volatility == pytest.approx(ref_volatility, rel=1e-9, abs=1e-15)
+
+    def test_mean_and_volatility_flat_prices(self):
+        assert mean_and_volatility(np.full(20, 42.0)) == (42.0, 0.0)
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
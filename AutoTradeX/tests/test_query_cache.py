@@ -0,0 +1,96 @@
+"""
+Tests for the memory search QueryCache
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+
+import numpy as np
+
+# Add the AutoTradeX directory to sys.path so autotradex.py imports as a module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from autotradex import QueryCache
+
+
+RESULTS = [{"id": i, "score": 1.0 - i / 10} for i in range(5)]
+
+
+def vec(*values):
+    return np.array(values, dtype=np.float32)
+
+
+class TestQueryCache:
+    """Test suite for QueryCache"""
+
+    def test_empty_cache_misses(self):
+        cache = QueryCache()
+        assert cache.get(vec(1, 0, 0), 3) is None
+
+    def test_hit_above_similarity_threshold(self):
+        cache = QueryCache(sim_threshold=0.98)
+        cache.put(vec(1, 0, 0), 5, RESULTS)
+
+        # cos ~= 0.9999 for a slightly nudged (and rescaled) query
+        assert cache.get(vec(2, 0.02, 0), 5) == RESULTS
+        # cos ~= 0.707 is well under the threshold
+        assert cache.get(vec(1, 1, 0), 5) is None
+
+    def test_hit_is_truncated_to_requested_limit(self):
+        cache = QueryCache()
+        cache.put(vec(1, 0, 0), 5, RESULTS)
+        assert cache.get(vec(1, 0, 0), 2) == RESULTS[:2]
+
+    def test_limit_larger_than_cached_limit_misses(self):
+        cache = QueryCache()
+        cache.put(vec(1, 0, 0), 3, RESULTS[:3])
+        assert cache.get(vec(1, 0, 0), 5) is None
+
+        # A wider entry for the same query then serves both limits
+        cache.put(vec(1, 0, 0), 5, RESULTS)
+        assert cache.get(vec(1, 0, 0), 5) == RESULTS
+        assert cache.get(vec(1, 0, 0), 3) == RESULTS[:3]
+
+    def test_entries_expire_after_ttl(self):
+        cache = QueryCache(ttl_seconds=10.0)
+        with patch("autotradex.time.monotonic", return_value=100.0):
+            cache.put(vec(1, 0, 0), 5, RESULTS)
+
+        with patch("autotradex.time.monotonic", return_value=109.0):
+            assert cache.get(vec(1, 0, 0), 5) == RESULTS
+        with patch("autotradex.time.monotonic", return_value=111.0):
+            assert cache.get(vec(1, 0, 0), 5) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = QueryCache(max_size=2)
+        cache.put(vec(1, 0, 0), 1, [{"id": "a"}])
+        cache.put(vec(0, 1, 0), 1, [{"id": "b"}])
+
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get(vec(1, 0, 0), 1) == [{"id": "a"}]
+        cache.put(vec(0, 0, 1), 1, [{"id": "c"}])
+
+        assert cache.get(vec(0, 1, 0), 1) is None
+        assert cache.get(vec(1, 0, 0), 1) == [{"id": "a"}]
+        assert cache.get(vec(0, 0, 1), 1) == [{"id": "c"}]
+
+    def test_clear_drops_every_entry(self):
+        cache = QueryCache(max_size=2)
+        cache.put(vec(1, 0, 0), 1, [{"id": "a"}])
+        cache.put(vec(0, 1, 0), 1, [{"id": "b"}])
+        cache.clear()
+
+        assert cache.get(vec(1, 0, 0), 1) is None
+        assert cache.get(vec(0, 1, 0), 1) is None
+
+        # Slots are reused from the start after a clear
+        cache.put(vec(0, 0, 1), 1, [{"id": "c"}])
+        assert cache.get(vec(0, 0, 1), 1) == [{"id": "c"}]
+        assert cache.get(vec(1, 0, 0), 1) is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
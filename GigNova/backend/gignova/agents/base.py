@@ -7,7 +7,8 @@ Enhanced with MCP integration
 import uuid
 import logging
 import asyncio
-from typing import Dict, List, Any
+from collections import deque
+from typing import Dict, List, Any, Optional
 
 from gignova.models.base import AgentType, AgentConfig
 from gignova.database.vector_manager_mcp import VectorManager
@@ -16,13 +17,18 @@ from gignova.mcp.client import mcp_manager
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Recent outcomes kept in process; the vector store holds the full history
+MEMORY_SIZE = 1024
+
 
 class BaseAgent:
-    def __init__(self, agent_type: AgentType, config: AgentConfig):
+    def __init__(self, agent_type: AgentType, config: AgentConfig,
+                 vector_manager: Optional[VectorManager] = None):
         self.agent_type = agent_type
         self.config = config
-        self.vector_manager = VectorManager()
-        self.memory = []
+        # Pass a shared manager so agents don't each load their own encoder
+        self.vector_manager = vector_manager or VectorManager()
+        self.memory = deque(maxlen=MEMORY_SIZE)
         self.agent_id = str(uuid.uuid4())
         logger.info(f"Initialized {agent_type.value} agent with ID: {self.agent_id}")
         
@@ -35,7 +41,7 @@ class BaseAgent:
             "timestamp": outcome.get("timestamp", 0)
         })
         
-        # Store in memory
+        # Keep in the bounded recent-outcome cache
         self.memory.append(outcome)
         
         # Store in vector database via MCP
@@ -5,10 +5,11 @@ GigNova: Matching Agent
 
 import uuid
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 from gignova.models.base import AgentType, AgentConfig, JobPost, JobMatch
 from gignova.agents.base import BaseAgent
+from gignova.database.vector_manager_mcp import VectorManager
 from gignova.utils.service_factory import service_factory
 from gignova.utils.analytics import analytics_logger
 
@@ -17,13 +18,15 @@ logger = logging.getLogger(__name__)
 
 
 class MatchingAgent(BaseAgent):
-    def __init__(self, config: AgentConfig):
-        super().__init__(AgentType.MATCHING, config)
+    def __init__(self, config: AgentConfig, vector_manager: Optional[VectorManager] = None):
+        super().__init__(AgentType.MATCHING, config, vector_manager)
         
-    async def find_matches(self, job_post: JobPost) -> List[JobMatch]:
-        """Find matching freelancers for a job"""
-        job_text = f"{job_post.title} {job_post.description} {' '.join(job_post.skills)}"
+    async def embed_job(self, job_post: JobPost) -> List[float]:
+        """Embed a job's title, description and skills for matching"""
+        return await service_factory.get_vector_manager().generate_embedding(job_post.job_text)
         
+    async def find_matches(self, job_post: JobPost, job_embedding: Optional[List[float]] = None) -> List[JobMatch]:
+        """Find matching freelancers for a job, reusing a precomputed job embedding if given"""
         try:
             # Log the matching attempt
             await analytics_logger.log_event(
@@ -37,11 +40,14 @@ class MatchingAgent(BaseAgent):
             # Get vector manager from service factory
             vector_manager = service_factory.get_vector_manager()
             
-            # Generate embedding for the job text and perform similarity search
-            job_embedding = await vector_manager.generate_embedding(job_text)
+            # Embed the job text (unless already done) and perform similarity search
+            if job_embedding is None:
+                job_embedding = await self.embed_job(job_post)
+            # The threshold is applied by the search, so every result qualifies
             search_results = await vector_manager.similarity_search(
                 query=job_embedding,
-                top_k=10
+                top_k=10,
+                score_threshold=self.config.confidence_threshold
             )
             
             if "error" in search_results:
@@ -59,15 +65,13 @@ class MatchingAgent(BaseAgent):
                 if not freelancer_id:
                     continue
                     
-                # Check if score meets threshold
                 score = match.get("score", 0)
-                if score >= self.config.confidence_threshold:
-                    job_matches.append(JobMatch(
-                        job_id=str(uuid.uuid4()),
-                        freelancer_id=freelancer_id,
-                        confidence_score=score,
-                        match_reasons=[f"Skill match: {score:.2f}"]
-                    ))
+                job_matches.append(JobMatch(
+                    job_id=str(uuid.uuid4()),
+                    freelancer_id=freelancer_id,
+                    confidence_score=score,
+                    match_reasons=[f"Skill match: {score:.2f}"]
+                ))
             
             # Log match results
             await analytics_logger.log_event(
@@ -5,19 +5,21 @@ GigNova: Negotiation Agent
 
 import os
 import json
+import math
 import logging
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from gignova.models.base import AgentType, AgentConfig
 from gignova.agents.base import BaseAgent
+from gignova.database.vector_manager_mcp import VectorManager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
 class NegotiationAgent(BaseAgent):
-    def __init__(self, config: AgentConfig):
-        super().__init__(AgentType.NEGOTIATION, config)
+    def __init__(self, config: AgentConfig, vector_manager: Optional[VectorManager] = None):
+        super().__init__(AgentType.NEGOTIATION, config, vector_manager)
         
     async def negotiate(self, client_budget: Tuple[float, float], freelancer_rate: float) -> Dict:
         """Negotiate between client budget and freelancer rate"""
@@ -31,44 +33,28 @@ class NegotiationAgent(BaseAgent):
                 "success": True
             }
             
-        # Start negotiation
-        current_offer = client_max
-        current_ask = freelancer_rate
-        rounds = 0
+        # Each round moves the offer 35% and the ask 15% of the gap toward each
+        # other, so after n rounds the gap is gap * 0.5**n and offer + ask has
+        # grown by 0.4 * gap * (1 - 0.5**n). Solving gap_n / ask_n <= 0.15 for n
+        # gives the number of rounds directly instead of iterating.
+        gap = freelancer_rate - client_max
+        total = freelancer_rate + client_max
+        rounds = max(0, math.ceil(math.log2(1.91 * gap / (0.15 * total + 0.06 * gap))))
         
-        while abs(current_offer - current_ask) / current_ask > 0.15 and rounds < self.config.negotiation_rounds:
-            # Calculate midpoint with slight bias toward client
-            midpoint = (current_offer + current_ask) / 2
-            new_offer = current_offer + (midpoint - current_offer) * 0.7
-            new_ask = current_ask - (current_ask - midpoint) * 0.3
-            
-            current_offer = new_offer
-            current_ask = new_ask
-            rounds += 1
-            
-        # If the difference is too large or we've reached max rounds, negotiation fails
-        if abs(current_offer - current_ask) / current_ask <= 0.15:
-            agreed_rate = (current_offer + current_ask) / 2
+        # Too many rounds needed: negotiation fails after the last allowed round
+        if rounds > self.config.negotiation_rounds:
             return {
-                "agreed_rate": agreed_rate,
-                "rounds": rounds,
-                "success": True
+                "agreed_rate": None,
+                "rounds": self.config.negotiation_rounds,
+                "success": False
             }
-        else:
-            # For rates far above budget (>2x), ensure negotiation fails
-            if freelancer_rate > client_max * 2:
-                return {
-                    "agreed_rate": None,
-                    "rounds": rounds,
-                    "success": False
-                }
-            else:
-                # For rates moderately above budget, we might still reach an agreement
-                return {
-                    "agreed_rate": None,
-                    "rounds": rounds,
-                    "success": False
-                }
+        
+        agreed_rate = (total + 0.4 * gap * (1 - 0.5 ** rounds)) / 2
+        return {
+            "agreed_rate": agreed_rate,
+            "rounds": rounds,
+            "success": True
+        }
     
     def generate_negotiation_message(self, context: Dict) -> str:
         """Generate negotiation message using templates instead of LLM"""
@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional
 
 from gignova.models.base import AgentType, AgentConfig
 from gignova.agents.base import BaseAgent
+from gignova.database.vector_manager_mcp import VectorManager
 from gignova.utils.service_factory import service_factory
 from gignova.utils.analytics import analytics_logger
 
@@ -18,8 +19,8 @@ logger = logging.getLogger(__name__)
 
 
 class PaymentAgent(BaseAgent):
-    def __init__(self, config: AgentConfig):
-        super().__init__(AgentType.PAYMENT, config)
+    def __init__(self, config: AgentConfig, vector_manager: Optional[VectorManager] = None):
+        super().__init__(AgentType.PAYMENT, config, vector_manager)
         
     async def create_escrow(self, job_data: Dict) -> Dict[str, Any]:
         """Create escrow contract for job using blockchain manager"""
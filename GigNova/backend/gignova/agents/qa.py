@@ -11,7 +11,9 @@ from typing import Dict, Any, List, Optional
 
 from gignova.models.base import AgentType, AgentConfig, QAResult
 from gignova.agents.base import BaseAgent
+from gignova.database.vector_manager_mcp import VectorManager
 from gignova.utils.service_factory import service_factory
+from gignova.utils.helpers import calculate_similarity
 from gignova.utils.analytics import analytics_logger
 
 # Configure logging
@@ -19,11 +21,20 @@ logger = logging.getLogger(__name__)
 
 
 class QAAgent(BaseAgent):
-    def __init__(self, config: AgentConfig):
-        super().__init__(AgentType.QA, config)
+    def __init__(self, config: AgentConfig, vector_manager: Optional[VectorManager] = None):
+        super().__init__(AgentType.QA, config, vector_manager)
+    
+    async def embed_requirements(self, requirements: str) -> List[float]:
+        """Embed a job's requirements text ahead of validation"""
+        return await service_factory.get_vector_manager().generate_embedding(requirements)
         
-    async def validate_deliverable(self, job_id: str, requirements: str, deliverable_id: str) -> QAResult:
-        """Validate deliverable against job requirements using storage manager"""
+    async def validate_deliverable(self, job_id: str, requirements: str, deliverable_id: str,
+                                   requirements_embedding: Optional[List[float]] = None) -> QAResult:
+        """Validate deliverable against job requirements using storage manager
+        
+        Pass requirements_embedding when the job was already embedded at posting
+        time to skip re-encoding the requirements text.
+        """
         try:
             # Log validation attempt to analytics
             await analytics_logger.log_event(
@@ -58,23 +69,26 @@ class QAAgent(BaseAgent):
                     deliverable_text = str(deliverable_data)
                 
                 # Calculate similarity using vector embeddings
-                from gignova.database.vector_manager import vector_manager
-                import numpy as np
+                vector_manager = service_factory.get_vector_manager()
                 
-                # Generate embeddings for requirements and deliverable
-                req_embedding = await vector_manager.generate_embedding(requirements)
-                del_embedding = await vector_manager.generate_embedding(deliverable_text)
+                # Generate embeddings for requirements (unless cached) and deliverable,
+                # both in one encoder call when neither is cached
+                req_embedding = requirements_embedding
+                if req_embedding is None:
+                    req_embedding, del_embedding = await vector_manager.generate_embeddings(
+                        [requirements, deliverable_text]
+                    )
+                else:
+                    del_embedding = await vector_manager.generate_embedding(deliverable_text)
                 
-                similarity = np.dot(req_embedding, del_embedding) / (
-                    np.linalg.norm(req_embedding) * np.linalg.norm(del_embedding)
-                )
+                similarity = calculate_similarity(req_embedding, del_embedding)
                 
                 passed = similarity >= self.config.qa_similarity_threshold
                 
                 # Create result
                 result = QAResult(
                     job_id=job_id,
-                    deliverable_id=deliverable_id,
+                    deliverable_hash=deliverable_id,
                     similarity_score=float(similarity),
                     passed=passed,
                     feedback=f"Similarity score: {similarity:.2f}. {'Approved' if passed else 'Needs revision'}."
@@ -106,7 +120,7 @@ class QAAgent(BaseAgent):
             else:
                 result = QAResult(
                     job_id=job_id,
-                    deliverable_id=deliverable_id,
+                    deliverable_hash=deliverable_id,
                     similarity_score=0.0,
                     passed=False,
                     feedback="Could not retrieve deliverable for validation."
@@ -141,7 +155,7 @@ class QAAgent(BaseAgent):
             
             return QAResult(
                 job_id=job_id,
-                deliverable_id=deliverable_id,
+                deliverable_hash=deliverable_id,
                 similarity_score=0.0,
                 passed=False,
                 feedback=f"Validation failed: {str(e)}"
@@ -6,17 +6,23 @@ GigNova: API Routes with MCP Integration
 import os
 import uuid
 import logging
+import time
+import hashlib
+import asyncio
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Type, TypeVar
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Body
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Body, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel, ValidationError
 import jwt
 from passlib.context import CryptContext
 
 from gignova.models.base import JobPost, FreelancerProfile, JobStatus
 from gignova.orchestrator_mcp import GigNovaOrchestrator
-from gignova.mcp.client import mcp_manager
+from gignova.mcp.client import mcp_manager, STREAM_CHUNK_SIZE
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,6 +31,12 @@ logger = logging.getLogger(__name__)
 security = HTTPBearer()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Recently verified tokens: blake2b(token) -> (user ID, monotonic expiry).
+# The short TTL bounds how long a token stays accepted without re-verification
+TOKEN_CACHE_SIZE = 10_000
+TOKEN_CACHE_TTL = 10.0
+_token_cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
 # Create router
 router = APIRouter(prefix="/api/v1")
 
@@ -46,14 +58,68 @@ def create_token(user_id: str) -> str:
     return jwt.encode(payload, os.getenv("JWT_SECRET", "dev_secret"), algorithm="HS256")
 
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
-    """Verify JWT token"""
+async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    """Verify JWT token, reusing a recent verification of the same token.
+    Cache hits stay on the event loop; only a miss decodes in a worker thread."""
+    token = credentials.credentials
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    
+    cached = _token_cache.get(key)
+    if cached is not None and cached[1] > now:
+        _token_cache.move_to_end(key)
+        return cached[0]
+    
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, os.getenv("JWT_SECRET", "dev_secret"), algorithms=["HS256"])
-        return payload["sub"]
+        payload = await asyncio.to_thread(
+            jwt.decode, token, os.getenv("JWT_SECRET", "dev_secret"), algorithms=["HS256"]
+        )
     except jwt.PyJWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    
+    # Never cache past the token's own expiry
+    now = time.monotonic()
+    expires = now + TOKEN_CACHE_TTL
+    if "exp" in payload:
+        expires = min(expires, now + payload["exp"] - time.time())
+    
+    # Only touched from the event loop, so no lock is needed
+    _token_cache[key] = (payload["sub"], expires)
+    _token_cache.move_to_end(key)
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return payload["sub"]
+
+
+# Request body helpers
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def json_body(model: Type[BaseModel]) -> Dict[str, Any]:
+    """OpenAPI request body for endpoints that parse their JSON body manually"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+
+async def parse_body(request: Request, model: Type[ModelT]) -> ModelT:
+    """Parse and validate the raw JSON body in a single pydantic-core pass"""
+    try:
+        return model.model_validate_json(await request.body())
+    except ValidationError as e:
+        # Match FastAPI's own body errors, whose loc starts with "body"
+        raise RequestValidationError([
+            {**error, "loc": ("body", *error["loc"])} for error in e.errors()
+        ])
+
+
+async def _iter_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    """Yield an uploaded file in STREAM_CHUNK_SIZE pieces"""
+    while chunk := await upload.read(STREAM_CHUNK_SIZE):
+        yield chunk
 
 
 # Health check
@@ -65,7 +131,7 @@ async def health_check():
     
     return {
         "status": "healthy" if "error" not in mcp_status else "degraded",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "mcp_status": mcp_status
     }
 
@@ -77,10 +143,15 @@ async def register(username: str = Body(...), password: str = Body(...), role: s
     if username in users:
         raise HTTPException(status_code=400, detail="Username already exists")
         
+    # bcrypt is deliberately slow; hash off the event loop
+    password_hash = await asyncio.to_thread(pwd_context.hash, password)
+    if username in users:
+        raise HTTPException(status_code=400, detail="Username already exists")
+        
     user_id = str(uuid.uuid4())
     users[username] = {
         "id": user_id,
-        "password": pwd_context.hash(password),
+        "password": password_hash,
         "role": role
     }
     
@@ -90,7 +161,7 @@ async def register(username: str = Body(...), password: str = Body(...), role: s
         event_data={
             "user_id": user_id,
             "role": role,
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
     
@@ -108,10 +179,10 @@ async def login(username: str = Body(...), password: str = Body(...)):
         raise HTTPException(status_code=401, detail="Invalid credentials")
         
     user = users[username]
-    if not pwd_context.verify(password, user["password"]):
+    if not await asyncio.to_thread(pwd_context.verify, password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
         
-    token = create_token(user["id"])
+    token = await asyncio.to_thread(create_token, user["id"])
     
     # Log login event in analytics
     await mcp_manager.analytics_log_event(
@@ -119,7 +190,7 @@ async def login(username: str = Body(...), password: str = Body(...)):
         event_data={
             "user_id": user["id"],
             "role": user["role"],
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
     
@@ -132,9 +203,10 @@ async def login(username: str = Body(...), password: str = Body(...)):
 
 
 # Job endpoints
-@router.post("/jobs")
-async def create_job(job_post: JobPost, user_id: str = Depends(verify_token)):
+@router.post("/jobs", openapi_extra=json_body(JobPost))
+async def create_job(request: Request, user_id: str = Depends(verify_token)):
     """Create a new job with MCP integration"""
+    job_post = await parse_body(request, JobPost)
     job_post.client_id = user_id
     result = await orchestrator.process_job_posting(job_post)
     return result
@@ -143,13 +215,12 @@ async def create_job(job_post: JobPost, user_id: str = Depends(verify_token)):
 @router.get("/jobs/{job_id}")
 async def get_job(job_id: str, user_id: str = Depends(verify_token)):
     """Get job details"""
-    if job_id not in orchestrator.jobs:
+    job = orchestrator.jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-        
-    job = orchestrator.jobs[job_id]
     
     # Check authorization
-    if job["post"].client_id != user_id and job.get("freelancer_id") != user_id:
+    if job.post.client_id != user_id and job.freelancer_id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to view this job")
         
     # Log job view event
@@ -158,21 +229,21 @@ async def get_job(job_id: str, user_id: str = Depends(verify_token)):
         event_data={
             "job_id": job_id,
             "viewer_id": user_id,
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
         
     return {
         "job_id": job_id,
-        "status": job["status"].value,
-        "post": job["post"],
-        "freelancer_id": job.get("freelancer_id"),
-        "created_at": job.get("created_at").isoformat(),
-        "agreed_rate": job.get("agreed_rate"),
-        "contract_address": job.get("contract_address"),
-        "escrow_id": job.get("escrow_id"),
-        "deliverable_hash": job.get("deliverable_hash"),
-        "qa_result": job.get("qa_result")
+        "status": job.status.value,
+        "post": job.post,
+        "freelancer_id": job.freelancer_id,
+        "created_at": job.created_at,
+        "agreed_rate": job.agreed_rate,
+        "contract_address": job.contract_address,
+        "escrow_id": job.escrow_id,
+        "deliverable_hash": job.deliverable_hash,
+        "qa_result": job.qa_result
     }
 
 
@@ -183,41 +254,44 @@ async def submit_deliverable(
     user_id: str = Depends(verify_token)
 ):
     """Submit deliverable for a job with MCP integration"""
-    if job_id not in orchestrator.jobs:
+    job = orchestrator.jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-        
-    job = orchestrator.jobs[job_id]
     
     # Check authorization
-    if job.get("freelancer_id") != user_id:
+    if job.freelancer_id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to submit deliverable")
         
     # Check job status
-    if job["status"] != JobStatus.ACTIVE:
-        raise HTTPException(status_code=400, detail=f"Job is not active, current status: {job['status'].value}")
+    if job.status != JobStatus.ACTIVE:
+        raise HTTPException(status_code=400, detail=f"Job is not active, current status: {job.status.value}")
         
-    # Process deliverable
-    deliverable_data = await deliverable.read()
-    result = await orchestrator.submit_deliverable(job_id, deliverable_data)
+    # Stream the upload to storage instead of reading it into memory
+    result = await orchestrator.submit_deliverable(
+        job_id, _iter_upload(deliverable), size_hint=deliverable.size
+    )
     
     return result
 
 
 # Freelancer endpoints
-@router.post("/freelancers")
-async def register_freelancer(profile: FreelancerProfile, user_id: str = Depends(verify_token)):
+@router.post("/freelancers", openapi_extra=json_body(FreelancerProfile))
+async def register_freelancer(request: Request, user_id: str = Depends(verify_token)):
     """Register freelancer profile with MCP integration"""
+    profile = await parse_body(request, FreelancerProfile)
+    
     # Ensure user_id matches the one in the profile
     if profile.user_id != user_id:
         raise HTTPException(status_code=400, detail="User ID mismatch")
     
     # Store in orchestrator
-    orchestrator.freelancers[user_id] = profile.dict()
+    profile_data = profile.model_dump()
+    orchestrator.freelancers[user_id] = profile_data
     
     # Store embedding via MCP vector server
     profile_text = f"{profile.name} {profile.bio} {' '.join(profile.skills)}, hourly rate: {profile.hourly_rate}"
     await orchestrator.matching_agent.vector_manager.store_freelancer_embedding(
-        user_id, profile_text, profile.dict()
+        user_id, profile_text, profile_data
     )
     
     # Log freelancer registration in analytics
@@ -227,7 +301,7 @@ async def register_freelancer(profile: FreelancerProfile, user_id: str = Depends
             "freelancer_id": user_id,
             "skills": profile.skills,
             "hourly_rate": profile.hourly_rate,
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
     
@@ -249,7 +323,7 @@ async def get_freelancer(freelancer_id: str, user_id: str = Depends(verify_token
         event_data={
             "freelancer_id": freelancer_id,
             "viewer_id": user_id,
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
         
@@ -266,22 +340,23 @@ async def list_jobs(
     """List jobs"""
     results = []
     
-    for job_id, job in orchestrator.jobs.items():
+    # Only the user's own jobs are visited, via the orchestrator's per-user indexes
+    for job_id in orchestrator.user_job_ids(user_id):
+        job = orchestrator.jobs[job_id]
+        
         # Filter by status if specified
-        if status and job["status"].value != status:
+        if status and job.status.value != status:
             continue
             
-        # Filter by user association
-        if job["post"].client_id == user_id or job.get("freelancer_id") == user_id:
-            results.append({
-                "job_id": job_id,
-                "title": job["post"].title,
-                "status": job["status"].value,
-                "created_at": job.get("created_at").isoformat(),
-                "client_id": job["post"].client_id,
-                "freelancer_id": job.get("freelancer_id"),
-                "contract_address": job.get("contract_address")
-            })
+        results.append({
+            "job_id": job_id,
+            "title": job.post.title,
+            "status": job.status.value,
+            "created_at": job.created_at,
+            "client_id": job.post.client_id,
+            "freelancer_id": job.freelancer_id,
+            "contract_address": job.contract_address
+        })
             
         if len(results) >= limit:
             break
@@ -293,7 +368,7 @@ async def list_jobs(
             "user_id": user_id,
             "filter_status": status,
             "result_count": len(results),
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
             
@@ -318,17 +393,17 @@ async def get_dashboard(user_id: str = Depends(verify_token)):
     metrics = await orchestrator.get_performance_metrics()
     
     # Get user's jobs
+    user_job_index = orchestrator.jobs_by_client if user_role == "client" else orchestrator.jobs_by_freelancer
     user_jobs = []
-    for job_id, job in orchestrator.jobs.items():
-        if (user_role == "client" and job["post"].client_id == user_id) or \
-           (user_role == "freelancer" and job.get("freelancer_id") == user_id):
-            user_jobs.append({
-                "job_id": job_id,
-                "title": job["post"].title,
-                "status": job["status"].value,
-                "created_at": job.get("created_at").isoformat(),
-                "contract_address": job.get("contract_address")
-            })
+    for job_id in user_job_index.get(user_id, {}):
+        job = orchestrator.jobs[job_id]
+        user_jobs.append({
+            "job_id": job_id,
+            "title": job.post.title,
+            "status": job.status.value,
+            "created_at": job.created_at,
+            "contract_address": job.contract_address
+        })
     
     # Log dashboard view in analytics
     await mcp_manager.analytics_log_event(
@@ -337,7 +412,7 @@ async def get_dashboard(user_id: str = Depends(verify_token)):
             "user_id": user_id,
             "role": user_role,
             "jobs_count": len(user_jobs),
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
             
@@ -410,9 +485,9 @@ async def initialize_test_data():
             "role": "freelancer"
         }
         
-    # Create test freelancer profile
-    profile = FreelancerProfile(
-        user_id="freelancer-123",
+    # Create test freelancer profile (trusted literal values, so skip validation)
+    profile = FreelancerProfile.model_construct(
+        freelancer_id="freelancer-123",
         name="Test Freelancer",
         bio="Experienced developer with 5 years of experience",
         skills=["python", "javascript", "react", "fastapi"],
@@ -420,19 +495,20 @@ async def initialize_test_data():
         availability="full-time"
     )
     
-    orchestrator.freelancers["freelancer-123"] = profile.dict()
+    profile_data = profile.model_dump()
+    orchestrator.freelancers["freelancer-123"] = profile_data
     
     # Store embedding via MCP vector server
     profile_text = f"{profile.name} {profile.bio} {' '.join(profile.skills)}"
     await orchestrator.matching_agent.vector_manager.store_freelancer_embedding(
-        "freelancer-123", profile_text, profile.dict()
+        "freelancer-123", profile_text, profile_data
     )
     
     # Log test data initialization in analytics
     await mcp_manager.analytics_log_event(
         event_type="test_data_initialized",
         event_data={
-            "timestamp": datetime.now().timestamp()
+            "timestamp": time.time()
         }
     )
     
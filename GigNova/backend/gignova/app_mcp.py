@@ -5,17 +5,26 @@ Enhanced with MCP integration
 """
 
 import logging
-import schedule
-import time
-import threading
 import asyncio
-from datetime import datetime
-from typing import List, Dict, Any
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # optional; responses fall back to the stdlib encoder
+    orjson = None
 
 from gignova.api.routes_mcp import router, orchestrator
 from gignova.config.settings import Settings
@@ -25,30 +34,45 @@ from gignova.mcp.client import mcp_manager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Background tasks
-def run_scheduled_tasks():
-    """Run scheduled tasks in background"""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by orjson in C, or the stdlib encoder without it"""
     
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+# Background tasks
+def seconds_until(at: str, weekday: Optional[int] = None, now: Optional[datetime] = None) -> float:
+    """Seconds until the next local HH:MM, on the given weekday (Monday=0) if set"""
+    now = now or datetime.now()
+    hour, minute = map(int, at.split(":"))
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if weekday is not None:
+        target += timedelta(days=(weekday - now.weekday()) % 7)
+    if target <= now:
+        target += timedelta(days=1 if weekday is None else 7)
+    return (target - now).total_seconds()
+
+async def run_at(task: Callable[[], Awaitable[Any]], at: str, weekday: Optional[int] = None):
+    """Await task() at every HH:MM (weekly when weekday is set, otherwise daily).
+    Sleeps on the event loop between runs, so no thread or polling is needed."""
     while True:
-        pending = schedule.get_jobs()
-        for job in pending:
-            if job.should_run:
-                # For async tasks
-                if asyncio.iscoroutinefunction(job.job_func):
-                    loop.run_until_complete(job.job_func())
-                else:
-                    job.run()
-                
-        schedule.run_pending()
-        time.sleep(1)
+        await asyncio.sleep(seconds_until(at, weekday))
+        try:
+            await task()
+        except Exception as e:
+            logger.error(f"Scheduled task {task.__name__} failed: {e}")
 
 # Use asynccontextmanager for lifespan events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting GigNova API with MCP integration")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
+    
+    # Pre-establish MCP connections in the background without blocking startup
+    app.state.mcp_warm_up = asyncio.create_task(mcp_manager.warm_up())
     
     try:
         # Initialize MCP connections
@@ -72,15 +96,12 @@ async def lifespan(app: FastAPI):
         logger.error(f"Error initializing MCP connections: {e}")
         logger.warning("Starting with limited functionality")
     
-    # Schedule agent evolution weekly
-    schedule.every().monday.at("00:00").do(orchestrator.evolve_agents)
-    
-    # Also schedule a daily health check for MCP services
-    schedule.every().day.at("04:00").do(check_mcp_health)
-    
-    # Start background task thread
-    background_thread = threading.Thread(target=run_scheduled_tasks, daemon=True)
-    background_thread.start()
+    app.state.scheduled_tasks = [
+        # Agent evolution weekly, Monday 00:00
+        asyncio.create_task(run_at(orchestrator.evolve_agents, "00:00", weekday=0)),
+        # Daily health check for MCP services
+        asyncio.create_task(run_at(check_mcp_health, "04:00"))
+    ]
     
     logger.info("GigNova API started successfully with MCP integration")
     
@@ -89,6 +110,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down GigNova API")
+    app.state.mcp_warm_up.cancel()
+    for task in app.state.scheduled_tasks:
+        task.cancel()
+    await orchestrator.flush_events()
 
 async def check_mcp_health():
     """Daily health check for MCP services"""
@@ -101,7 +126,7 @@ async def check_mcp_health():
         await mcp_manager.analytics_log_event(
             event_type="system_health_check",
             event_data={
-                "timestamp": datetime.now().timestamp(),
+                "timestamp": time.time(),
                 "mcp_status": mcp_status
             }
         )
@@ -118,7 +143,8 @@ app = FastAPI(
     description=f"{Settings.API_DESCRIPTION}\nEnhanced with MCP integration for production-grade services.",
     version=Settings.API_VERSION,
     debug=Settings.DEBUG,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # Add CORS middleware
@@ -146,7 +172,7 @@ async def health():
     
     return {
         "status": "healthy" if "error" not in mcp_health else "degraded",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "mcp_status": mcp_health
     }
 
@@ -172,7 +198,8 @@ def run_app():
         "gignova.app_mcp:app",
         host="0.0.0.0",
         port=port,
-        reload=Settings.DEBUG
+        reload=Settings.DEBUG,
+        loop="uvloop" if uvloop else "asyncio"
     )
 
 
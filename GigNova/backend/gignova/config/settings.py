@@ -7,11 +7,16 @@ import os
 import logging
 from typing import Dict, Any
 
-# Configure logging
+from gignova.utils.helpers import JobContextFilter
+
+# Configure logging; the filter sits on the handlers so records from every
+# logger carry the job_id the format expects
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - [%(job_id)s] %(message)s'
 )
+for _handler in logging.getLogger().handlers:
+    _handler.addFilter(JobContextFilter())
 
 logger = logging.getLogger(__name__)
 
@@ -46,9 +51,19 @@ class Settings:
     QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
     QDRANT_API_KEY = os.getenv("QDRANT_API_KEY")
     
+    # Sentence encoder; the int8 ONNX export is cached under ENCODER_ONNX_DIR
+    ENCODER_MODEL = os.getenv("GIGNOVA_ENCODER_MODEL", "all-MiniLM-L6-v2")
+    ENCODER_QUANTIZED = os.getenv("GIGNOVA_ENCODER_QUANTIZED", "true").lower() == "true"
+    ENCODER_ONNX_DIR = os.getenv("GIGNOVA_ENCODER_ONNX_DIR", "./models/miniLM-int8")
+    ENCODER_CACHE_SIZE = int(os.getenv("GIGNOVA_ENCODER_CACHE_SIZE", "10000"))
+    
     # IPFS
     IPFS_API_URL = os.getenv("IPFS_API_URL", "/ip4/127.0.0.1/tcp/5001")
     
+    # Analytics batching
+    ANALYTICS_BATCH_SIZE = int(os.getenv("GIGNOVA_BATCH_SIZE", "32"))
+    ANALYTICS_BATCH_MS = int(os.getenv("GIGNOVA_BATCH_MS", "50"))
+    
     # Agent Configuration
     AGENT_CONFIG = {
         "confidence_threshold": float(os.getenv("AGENT_CONFIDENCE_THRESHOLD", "0.7")),
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+GigNova: Columnar Job Storage
+Structure-of-arrays mirror of the scalar job fields used for aggregation
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+from gignova.models.base import JobStatus
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Compact uint8 code for each job status
+STATUS_CODES = {status: code for code, status in enumerate(JobStatus)}
+COMPLETED_CODE = STATUS_CODES[JobStatus.COMPLETED]
+
+
+def _outcome_reduce(status, qa_score, created_at_s, cutoff_s, completed_code):
+    """Vectorized reduction: (jobs, successes, qa_sum, qa_count) after the cutoff"""
+    mask = created_at_s > cutoff_s
+    qa_scores = qa_score[mask]
+    qa_scores = qa_scores[~np.isnan(qa_scores)]
+    return (
+        int(mask.sum()),
+        int((status[mask] == completed_code).sum()),
+        float(qa_scores.sum()),
+        int(qa_scores.size)
+    )
+
+
+class JobColumns:
+    """
+    Parallel NumPy arrays holding one row per job, so that aggregations
+    over the job history are vectorized instead of walking Python dicts.
+    Missing QA scores / match confidences are stored as NaN.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.index: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.size = 0
+        self.status = np.zeros(capacity, dtype=np.uint8)
+        self.created_at = np.zeros(capacity, dtype="datetime64[s]")
+        self.qa_score = np.full(capacity, np.nan, dtype=np.float32)
+        self.match_conf = np.full(capacity, np.nan, dtype=np.float32)
+
+    def _grow(self):
+        """Double the capacity of every column"""
+        capacity = max(1, len(self.status)) * 2
+
+        def grown(column: np.ndarray, fill) -> np.ndarray:
+            new_column = np.full(capacity, fill, dtype=column.dtype)
+            new_column[:self.size] = column[:self.size]
+            return new_column
+
+        self.status = grown(self.status, 0)
+        self.created_at = grown(self.created_at, np.datetime64(0, "s"))
+        self.qa_score = grown(self.qa_score, np.nan)
+        self.match_conf = grown(self.match_conf, np.nan)
+
+    def add(self, job_id: str, status: JobStatus, created_at: datetime) -> int:
+        """Append a row for a new job and return its row index"""
+        if job_id in self.index:
+            row = self.index[job_id]
+        else:
+            if self.size == len(self.status):
+                self._grow()
+            row = self.size
+            self.index[job_id] = row
+            self.ids.append(job_id)
+            self.size += 1
+
+        self.status[row] = STATUS_CODES[status]
+        self.created_at[row] = np.datetime64(created_at, "s")
+        self.qa_score[row] = np.nan
+        self.match_conf[row] = np.nan
+        return row
+
+    def remove(self, job_id: str):
+        """Drop a job's row by moving the last row into its place"""
+        row = self.index.pop(job_id, None)
+        if row is None:
+            return
+        
+        last = self.size - 1
+        moved_id = self.ids.pop()
+        if row != last:
+            self.ids[row] = moved_id
+            self.index[moved_id] = row
+            for column in (self.status, self.created_at, self.qa_score, self.match_conf):
+                column[row] = column[last]
+        
+        self.qa_score[last] = np.nan
+        self.match_conf[last] = np.nan
+        self.size = last
+    
+    def set_status(self, job_id: str, status: JobStatus):
+        row = self.index.get(job_id)
+        if row is not None:
+            self.status[row] = STATUS_CODES[status]
+
+    def set_qa_score(self, job_id: str, score: float):
+        row = self.index.get(job_id)
+        if row is not None:
+            self.qa_score[row] = score
+
+    def set_match_confidence(self, job_id: str, confidence: float):
+        row = self.index.get(job_id)
+        if row is not None:
+            self.match_conf[row] = confidence
+
+    def outcome_stats(self, since: datetime) -> Dict[str, float]:
+        """Success rate and average QA score for jobs created after `since`"""
+        n = self.size
+        jobs, successes, qa_sum, qa_count = _outcome_reduce(
+            self.status[:n],
+            self.qa_score[:n],
+            self.created_at[:n].view(np.int64),
+            int(np.datetime64(since, "s").astype(np.int64)),
+            COMPLETED_CODE
+        )
+
+        if jobs == 0:
+            return {"jobs": 0, "success_rate": 0.0, "avg_qa_score": 0.0}
+
+        return {
+            "jobs": int(jobs),
+            "success_rate": successes / jobs,
+            "avg_qa_score": float(qa_sum / qa_count) if qa_count else 0.0
+        }
@@ -12,10 +12,22 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 
+from gignova.utils.helpers import normalize_rows
+
+try:
+    import faiss
+except ImportError:  # optional; searches stay exact without it
+    faiss = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Below this many vectors every search is an exact scan
+ANN_MIN_VECTORS = 10_000
+# IVF lists probed per query; more is slower but recalls better
+ANN_NPROBE = 8
+
 class LocalVectorManager:
     """
     Simple file-based vector database manager for development and testing
@@ -41,6 +53,12 @@ class LocalVectorManager:
         # Initialize embeddings storage
         self.embeddings = self._load_embeddings()
         
+        # Search state derived from self.embeddings, rebuilt after any change
+        self._ids: Optional[List[str]] = None
+        self._matrix: Optional[np.ndarray] = None
+        self._ann_index = None
+        self.nprobe = ANN_NPROBE
+        
         logger.info(f"Local Vector Manager initialized at {self.persist_directory}")
     
     def _load_embeddings(self) -> Dict[str, Any]:
@@ -65,6 +83,47 @@ class LocalVectorManager:
         with open(self.embeddings_file, 'w') as f:
             json.dump(self.embeddings, f, indent=2)
     
+    def _invalidate_index(self) -> None:
+        """Drop the search matrix and ANN index after the stored embeddings change"""
+        self._ids = None
+        self._matrix = None
+        self._ann_index = None
+    
+    def _search_state(self):
+        """Return (ids, matrix, ann_index), building them on first use.
+        ann_index is None unless faiss is installed and the store is large
+        enough for an approximate search to pay off."""
+        if self._matrix is None:
+            self._ids = list(self.embeddings)
+            # Rows are normalized once here, so every search scores cosine
+            # similarity as a plain inner product
+            self._matrix = normalize_rows(
+                [self.embeddings[embedding_id]["embedding"] for embedding_id in self._ids]
+            )
+            if faiss is not None and len(self._ids) > ANN_MIN_VECTORS:
+                self._ann_index = self._build_ann_index(self._matrix)
+        return self._ids, self._matrix, self._ann_index
+    
+    def _build_ann_index(self, matrix: np.ndarray):
+        """Train an inner-product IVF-PQ index over the unit-length matrix
+        (8-bit codes, 8 subquantizers)"""
+        n, d = matrix.shape
+        m = 8 if d % 8 == 0 else 1
+        nlist = max(16, int(np.sqrt(n)))
+        quantizer = faiss.IndexFlatIP(d)
+        index = faiss.IndexIVFPQ(quantizer, d, nlist, m, 8, faiss.METRIC_INNER_PRODUCT)
+        index.train(matrix)
+        index.add(matrix)
+        index.nprobe = self.nprobe
+        logger.info(f"Built IVF-PQ index over {n} embeddings ({nlist} lists)")
+        return index
+    
+    def set_nprobe(self, nprobe: int) -> None:
+        """Set how many IVF lists an approximate search probes (recall vs latency)"""
+        self.nprobe = nprobe
+        if self._ann_index is not None:
+            self._ann_index.nprobe = nprobe
+    
     async def connect(self) -> bool:
         """
         Connect to the vector database (no-op for local implementation)
@@ -104,6 +163,18 @@ class LocalVectorManager:
         
         return embedding
     
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in one call
+        
+        Args:
+            texts: Texts to generate embeddings for
+            
+        Returns:
+            List[List[float]]: One embedding per text, in order
+        """
+        return [await self.generate_embedding(text) for text in texts]
+    
     async def store_embedding(self, embedding_id: str, embedding: List[float], metadata: Dict = None) -> Dict[str, Any]:
         """
         Store an embedding in the local vector database
@@ -126,6 +197,8 @@ class LocalVectorManager:
                 "metadata": metadata
             }
             
+            self._invalidate_index()
+            
             # Save to file
             self._save_embeddings()
             
@@ -158,13 +231,15 @@ class LocalVectorManager:
             logger.error(f"Error retrieving embedding: {str(e)}")
             return {"success": False, "error": str(e)}
     
-    async def similarity_search(self, query: Union[str, List[float]], top_k: int = 5) -> Dict[str, Any]:
+    async def similarity_search(self, query: Union[str, List[float]], top_k: int = 5,
+                                score_threshold: Optional[float] = None) -> Dict[str, Any]:
         """
         Search for similar embeddings
         
         Args:
             query: Query text or embedding
             top_k: Number of results to return
+            score_threshold: Drop results scoring below this similarity
             
         Returns:
             Dict with search results
@@ -175,32 +250,40 @@ class LocalVectorManager:
             if isinstance(query, str):
                 query_embedding = await self.generate_embedding(query)
             
-            # Convert query embedding to numpy array
-            query_vector = np.array(query_embedding)
+            if not self.embeddings:
+                return {"success": True, "results": []}
             
-            # Calculate similarity for all embeddings
-            results = []
-            for embedding_id, data in self.embeddings.items():
-                embedding_vector = np.array(data["embedding"])
-                
-                # Calculate cosine similarity
-                similarity = np.dot(query_vector, embedding_vector) / (
-                    np.linalg.norm(query_vector) * np.linalg.norm(embedding_vector)
-                )
-                
-                results.append({
-                    "id": embedding_id,
-                    "score": float(similarity),
-                    "metadata": data["metadata"]
-                })
+            ids, matrix, ann_index = self._search_state()
+            query_row = normalize_rows(query_embedding)
+            if ann_index is not None:
+                # Large store: the IVF-PQ index proposes candidates, which are
+                # then scored exactly so similarities match the exact path
+                _, neighbours = ann_index.search(query_row, top_k)
+                candidates = neighbours[0][neighbours[0] >= 0]
+                scores = np.zeros(len(ids), dtype=np.float32)
+                scores[candidates] = matrix[candidates] @ query_row[0]
+            else:
+                # Score every stored embedding with a single matrix-vector product
+                scores = matrix @ query_row[0]
+                candidates = np.arange(len(ids))
             
-            # Sort by similarity score (highest first)
-            results.sort(key=lambda x: x["score"], reverse=True)
+            # Highest similarity first, among those meeting the threshold
+            if score_threshold is not None:
+                candidates = candidates[scores[candidates] >= score_threshold]
+            top = candidates[np.argsort(-scores[candidates], kind="stable")[:top_k]]
+            results = [
+                {
+                    "id": ids[i],
+                    "score": float(scores[i]),
+                    "metadata": self.embeddings[ids[i]]["metadata"]
+                }
+                for i in top
+            ]
             
             # Return top_k results
             return {
                 "success": True,
-                "results": results[:top_k]
+                "results": results
             }
         except Exception as e:
             logger.error(f"Error in similarity search: {str(e)}")
@@ -219,6 +302,7 @@ class LocalVectorManager:
         try:
             if embedding_id in self.embeddings:
                 del self.embeddings[embedding_id]
+                self._invalidate_index()
                 self._save_embeddings()
                 return {"success": True}
             else:
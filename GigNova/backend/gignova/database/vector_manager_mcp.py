@@ -5,30 +5,178 @@ Replaces the in-memory vector database with MCP vector server integration
 """
 
 import os
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 from gignova.mcp.client import mcp_manager
+from gignova.config.settings import Settings
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Encoding is pure CPU; run it off the event loop on a bounded pool
+_encode_pool = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix="gignova-encode"
+)
+
+# Texts per forward pass when encoding a batch
+ENCODE_BATCH_SIZE = 64
+
+# Embeddings are unit length, so the vector server scores them with a plain
+# dot product; every encode call must keep normalize_embeddings=True. They stay
+# float32 arrays end to end and are packed as raw bytes for the MCP call
+_ENCODE_KWARGS = {"convert_to_numpy": True, "normalize_embeddings": True}
+
+# Dynamic int8 quantization targeting AVX2, the widest commonly available ISA
+_QUANTIZATION = "avx2"
+_QUANTIZED_FILE = f"onnx/model_qint8_{_QUANTIZATION}.onnx"
+
+
+def _load_encoder() -> "SentenceTransformer":
+    """Load the int8-quantized ONNX encoder, exporting it on first run.
+    Falls back to the FP32 torch model when ONNX support is unavailable.
+    sentence-transformers (and torch) are imported here rather than at module
+    top, so importing the agents or orchestrator does not pay for them."""
+    from sentence_transformers import SentenceTransformer
+    
+    try:
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+    except ImportError:  # sentence-transformers < 3.2 has no ONNX backend
+        export_dynamic_quantized_onnx_model = None
+    
+    if not Settings.ENCODER_QUANTIZED or export_dynamic_quantized_onnx_model is None:
+        return SentenceTransformer(Settings.ENCODER_MODEL)
+    
+    onnx_dir = Settings.ENCODER_ONNX_DIR
+    try:
+        if not os.path.exists(os.path.join(onnx_dir, _QUANTIZED_FILE)):
+            logger.info(f"Exporting int8 ONNX encoder to {onnx_dir}")
+            model = SentenceTransformer(Settings.ENCODER_MODEL, backend="onnx")
+            model.save_pretrained(onnx_dir)
+            export_dynamic_quantized_onnx_model(model, _QUANTIZATION, onnx_dir)
+        
+        return SentenceTransformer(
+            onnx_dir, backend="onnx", model_kwargs={"file_name": _QUANTIZED_FILE}
+        )
+    except Exception as e:
+        logger.warning(f"Quantized ONNX encoder unavailable, using FP32 model: {e}")
+        return SentenceTransformer(Settings.ENCODER_MODEL)
+
 
 class VectorManager:
     def __init__(self):
         """Initialize vector manager with MCP integration"""
-        self.encoder = SentenceTransformer('all-MiniLM-L6-v2')
+        self.encoder = _load_encoder()
+        # LRU of embeddings keyed by a digest of the encoded text
+        self._emb_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        # freelancer ID -> (profile text digest, embedding); kept outside the LRU
+        # so re-registering an unchanged profile never re-runs the model
+        self._profile_embeddings: Dict[str, Tuple[bytes, np.ndarray]] = {}
         logger.info("Initialized vector manager with MCP integration")
     
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def _cached_embedding(self, key: bytes) -> Optional[np.ndarray]:
+        """Return a cached embedding and mark it recently used.
+        Cached arrays are shared with callers and must not be modified."""
+        embedding = self._emb_cache.get(key)
+        if embedding is None:
+            return None
+        self._emb_cache.move_to_end(key)
+        return embedding
+    
+    def _cache_embedding(self, key: bytes, embedding: np.ndarray):
+        """Remember an embedding, evicting the least recently used past the cap"""
+        self._emb_cache[key] = embedding
+        if len(self._emb_cache) > Settings.ENCODER_CACHE_SIZE:
+            self._emb_cache.popitem(last=False)
+    
+    async def _encode(self, text: str) -> np.ndarray:
+        """Encode text on the worker pool so the event loop stays responsive.
+        Repeated texts are served from the embedding cache."""
+        key = self._cache_key(text)
+        embedding = self._cached_embedding(key)
+        if embedding is not None:
+            return embedding
+        
+        loop = asyncio.get_running_loop()
+        embedding = await loop.run_in_executor(
+            _encode_pool, partial(self.encoder.encode, text, **_ENCODE_KWARGS)
+        )
+        self._cache_embedding(key, embedding)
+        return embedding
+    
+    async def _encode_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Encode many texts in padded batches with one call into the encoder;
+        only texts missing from the embedding cache are encoded"""
+        keys = [self._cache_key(text) for text in texts]
+        embeddings = [self._cached_embedding(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            loop = asyncio.get_running_loop()
+            encoded = await loop.run_in_executor(_encode_pool, partial(
+                self.encoder.encode, [texts[i] for i in missing],
+                batch_size=ENCODE_BATCH_SIZE, **_ENCODE_KWARGS
+            ))
+            for i, embedding in zip(missing, encoded):
+                self._cache_embedding(keys[i], embedding)
+                embeddings[i] = embedding
+        
+        return embeddings
+    
+    async def _store_batch(self, kind: str, items: List[Tuple[str, str, Dict]]) -> Dict:
+        """Encode and store (id, text, metadata) items of one kind in a single MCP call"""
+        if not items:
+            return {"success": True, "stored_count": 0}
+        
+        try:
+            embeddings = await self._encode_batch([text for _, text, _ in items])
+            result = await mcp_manager.vector_batch_store([
+                {
+                    "id": f"{kind}_{item_id}",
+                    "vector": embedding,
+                    "metadata": {"type": kind, "text": text, **metadata}
+                }
+                for (item_id, text, metadata), embedding in zip(items, embeddings)
+            ])
+            
+            if result.get("success"):
+                logger.info(f"Batch stored {len(items)} {kind} embeddings via MCP")
+            else:
+                logger.error(f"Failed to batch store {kind} embeddings: {result.get('error')}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Batch {kind} embedding storage failed: {e}")
+            return {"success": False, "error": str(e)}
+    
+    async def store_job_embeddings_batch(self, jobs: List[Tuple[str, str, Dict]]) -> Dict:
+        """Store many (job_id, job_text, metadata) embeddings via MCP vector server"""
+        return await self._store_batch("job", jobs)
+    
+    async def store_freelancer_embeddings_batch(self, freelancers: List[Tuple[str, str, Dict]]) -> Dict:
+        """Store many (freelancer_id, profile_text, metadata) embeddings via MCP vector server"""
+        return await self._store_batch("freelancer", freelancers)
+    
     async def store_job_embedding(self, job_id: str, job_text: str, metadata: Dict):
         """Store job posting embedding via MCP vector server"""
         try:
             # Generate embedding locally
-            embedding = self.encoder.encode(job_text).tolist()
+            embedding = await self._encode(job_text)
             
             # Store via MCP
             result = await mcp_manager.vector_store_embedding(
@@ -50,10 +198,17 @@ class VectorManager:
             logger.error(f"Job embedding storage failed: {e}")
     
     async def store_freelancer_embedding(self, freelancer_id: str, profile_text: str, metadata: Dict):
-        """Store freelancer profile embedding via MCP vector server"""
+        """Store freelancer profile embedding via MCP vector server.
+        The model only runs when the profile text changed since the last store."""
         try:
-            # Generate embedding locally
-            embedding = self.encoder.encode(profile_text).tolist()
+            key = self._cache_key(profile_text)
+            cached = self._profile_embeddings.get(freelancer_id)
+            if cached is not None and cached[0] == key:
+                embedding = cached[1]
+            else:
+                # Generate embedding locally
+                embedding = await self._encode(profile_text)
+                self._profile_embeddings[freelancer_id] = (key, embedding)
             
             # Store via MCP
             result = await mcp_manager.vector_store_embedding(
@@ -74,16 +229,16 @@ class VectorManager:
         except Exception as e:
             logger.error(f"Freelancer embedding storage failed: {e}")
     
-    async def find_matches(self, job_text: str, limit: int = 10) -> List[Dict]:
+    async def find_matches(self, job_text: str, limit: int = 10, score_threshold: float = 0.7) -> List[Dict]:
         """Find matching freelancers for a job via MCP vector server"""
         try:
             # Generate query embedding locally
-            query_embedding = self.encoder.encode(job_text).tolist()
+            query_embedding = await self._encode(job_text)
             
             # Search via MCP
             result = await mcp_manager.vector_similarity_search(
                 query_vector=query_embedding,
-                threshold=0.7,  # Configurable threshold
+                threshold=score_threshold,
                 limit=limit,
                 filter_params={"type": "freelancer"}
             )
@@ -109,35 +264,16 @@ class VectorManager:
             return []
     
     async def store_outcome(self, interaction_id: str, outcome_data: Dict):
-        """Store interaction outcome for learning via MCP vector server"""
+        """Record an interaction outcome for learning via the analytics MCP server"""
         try:
-            # Convert outcome to text for embedding
-            outcome_text = json.dumps(outcome_data)
-            
-            # Generate embedding locally
-            embedding = self.encoder.encode(outcome_text).tolist()
-            
-            # Store via MCP
-            result = await mcp_manager.vector_store_embedding(
-                id=f"outcome_{interaction_id}",
-                vector=embedding,
-                metadata={
-                    "type": "outcome",
-                    "data": outcome_data,
-                    "timestamp": outcome_data.get("timestamp", 0)
-                }
-            )
-            
-            if result.get("success"):
-                logger.info(f"Stored outcome for interaction_id: {interaction_id} via MCP")
-            else:
-                logger.error(f"Failed to store outcome: {result.get('error')}")
-            
-            # Also log to analytics MCP
+            # Outcomes are structured records that are aggregated, never searched
+            # by similarity, so they are logged as payload only; encoding the
+            # JSON would cost a transformer pass for a meaningless vector
             await mcp_manager.analytics_log_event(
                 event_type="agent_outcome",
-                event_data=outcome_data
+                event_data={"interaction_id": interaction_id, **outcome_data}
             )
+            logger.info(f"Stored outcome for interaction_id: {interaction_id} via MCP")
             
         except Exception as e:
             logger.error(f"Outcome storage failed: {e}")
@@ -5,26 +5,69 @@ Replaces the local file storage with MCP storage server integration
 """
 
 import os
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import AsyncIterable, AsyncIterator, Dict, Any, Optional, Union
 
 from gignova.mcp.client import mcp_manager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Buffers above this are hashed on a worker thread (hashlib releases the GIL)
+_THREAD_HASH_MIN = 1 << 20
+
+# Recently stored deliverables remembered by SHA-256
+_STORED_CACHE_SIZE = 1024
+
 
 class IPFSManager:
     def __init__(self):
         """Initialize storage manager with MCP integration"""
+        # SHA-256 hex -> storage hash; storage is content-addressed, so an
+        # identical upload would only return the same hash again
+        self._stored: "OrderedDict[str, str]" = OrderedDict()
         logger.info("Initialized storage manager with MCP integration")
     
-    async def store_deliverable(self, data: bytes) -> str:
-        """Store deliverable via MCP storage server and return its hash"""
+    async def store_deliverable(self, data: Union[bytes, AsyncIterable[bytes]]) -> str:
+        """Store deliverable via MCP storage server and return its hash
+        
+        An async byte stream is forwarded chunk by chunk, so the file never has
+        to be held in memory; its size and SHA-256 are computed on the way through.
+        In-memory data already stored by this manager is not uploaded again.
+        """
         try:
+            digest = hashlib.sha256()
+            size = 0
+            
+            if isinstance(data, (bytes, bytearray, memoryview)):
+                if len(data) >= _THREAD_HASH_MIN:
+                    await asyncio.to_thread(digest.update, data)
+                else:
+                    digest.update(data)
+                size = len(data)
+                file_data = data
+                
+                file_hash = self._stored.get(digest.hexdigest())
+                if file_hash is not None:
+                    self._stored.move_to_end(digest.hexdigest())
+                    logger.info(f"Deliverable already stored with hash: {file_hash}")
+                    return file_hash
+            else:
+                async def measured(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+                    nonlocal size
+                    async for chunk in chunks:
+                        digest.update(chunk)
+                        size += len(chunk)
+                        yield chunk
+                
+                file_data = measured(data)
+            
             # Store via MCP
             result = await mcp_manager.storage_store_file(
-                file_data=data,
+                file_data=file_data,
                 metadata={
                     "type": "deliverable",
                     "content_type": "application/octet-stream"
@@ -38,12 +81,18 @@ class IPFSManager:
             file_hash = result.get("file_hash")
             logger.info(f"Stored deliverable via MCP with hash: {file_hash}")
             
+            if file_hash:
+                self._stored[digest.hexdigest()] = file_hash
+                if len(self._stored) > _STORED_CACHE_SIZE:
+                    self._stored.popitem(last=False)
+            
             # Log to analytics
             await mcp_manager.analytics_log_event(
                 event_type="file_stored",
                 event_data={
                     "file_hash": file_hash,
-                    "file_size": len(data),
+                    "file_size": size,
+                    "sha256": digest.hexdigest(),
                     "storage_type": "mcp"
                 }
             )
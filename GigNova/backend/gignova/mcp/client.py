@@ -6,13 +6,69 @@ Handles connections to various MCP servers for the GigNova platform
 
 import os
 import json
+import uuid
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Any, Optional, Sequence, Union
+
+import numpy as np
 from mcp.client.session import ClientSession as Client
 
+try:
+    import pybase64 as base64  # SIMD-accelerated drop-in replacement
+except ImportError:
+    import base64
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Bound once so the file transfer paths skip the attribute lookups
+_b64encode = base64.b64encode
+_b64decode = base64.b64decode
+
+# Files larger than this are uploaded in chunks instead of one base64 string
+STREAM_THRESHOLD = 1 << 20
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on concurrent in-flight tool calls per MCP server
+MAX_IN_FLIGHT = int(os.getenv("MCP_MAX_CONNS", "100"))
+
+
+def _encode_vector(vector: Union[Sequence[float], np.ndarray]) -> str:
+    """Pack a vector as base64 of its little-endian float32 bytes.
+    
+    About 4x smaller than a JSON float list and skips float-to-decimal formatting.
+    """
+    return _b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode('ascii')
+
+
+def _vector_param(name: str, vector: Union[Sequence[float], np.ndarray], packed: bool) -> Dict[str, Any]:
+    """A vector payload field: name_f32_b64 when packed, else a plain JSON float list under name"""
+    if packed:
+        return {f"{name}_f32_b64": _encode_vector(vector)}
+    return {name: np.asarray(vector, dtype=np.float64).tolist()}
+
+
+async def _iter_chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    """Yield zero-copy slices of an in-memory buffer"""
+    view = memoryview(data)
+    for start in range(0, len(view), size):
+        yield view[start:start + size]
+
+
+async def _read_all(chunks: AsyncIterable[bytes]) -> bytes:
+    """Collect the rest of an async byte stream into one buffer"""
+    data = bytearray()
+    async for chunk in chunks:
+        data += chunk
+    return bytes(data)
+
+
 class MCPClientManager:
     """
     Manages connections to MCP servers and provides a unified interface
@@ -22,6 +78,15 @@ class MCPClientManager:
     def __init__(self):
         """Initialize MCP client connections."""
         self.clients = {}
+        # {server: {tool_name: input_schema}}, filled once by load_tool_descriptions()
+        self.server_descriptions: Dict[str, Dict[str, Any]] = {}
+        # Per-server call limits, recreated if the manager is used from a new event loop
+        self._limits: Dict[str, asyncio.Semaphore] = {}
+        self._limits_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Cleared once the storage server turns out not to support chunked uploads
+        self._storage_streaming = True
+        # Cleared once the vector server turns out to take only JSON float lists
+        self._vector_packed = True
         self._initialize_clients()
         
     def _initialize_clients(self):
@@ -40,199 +105,307 @@ class MCPClientManager:
             for server_type, server_name in mcp_servers.items():
                 try:
                     self.clients[server_type] = Client(server_name)
-                    logger.info(f"Connected to {server_type} MCP server: {server_name}")
+                    logger.info("Connected to %s MCP server: %s", server_type, server_name)
                 except Exception as e:
-                    logger.warning(f"Failed to connect to {server_type} MCP server: {e}")
+                    logger.warning("Failed to connect to %s MCP server: %s", server_type, e)
                     self.clients[server_type] = None
                     
         except Exception as e:
-            logger.error(f"Error initializing MCP clients: {e}")
+            logger.error("Error initializing MCP clients: %s", e)
     
-    async def vector_store_embedding(self, id: str, vector: List[float], metadata: Optional[Dict[str, Any]] = None) -> Dict:
-        """Store a vector embedding with metadata."""
+    async def warm_up(self) -> Dict[str, bool]:
+        """Ping every configured MCP server concurrently so the first real
+        requests do not pay the connection handshake."""
+        async def ping(server_type: str, client: Client) -> bool:
+            try:
+                await client.send_ping()
+                return True
+            except Exception as e:
+                logger.warning("Warm-up ping to %s MCP server failed: %s", server_type, e)
+                return False
+        
+        servers = [(server_type, client) for server_type, client in self.clients.items() if client is not None]
+        results = await asyncio.gather(*(ping(server_type, client) for server_type, client in servers))
+        status = {server_type: ok for (server_type, _), ok in zip(servers, results)}
+        
+        logger.info("MCP warm-up complete: %s", status)
+        return status
+    
+    async def load_tool_descriptions(self) -> Dict[str, Dict[str, Any]]:
+        """List every server's tools once and cache their schemas.
+        
+        Listing up front also fills the session's own tool cache, so calls do
+        not trigger a discovery round trip. Call again after a server sends
+        tools/list_changed.
+        """
+        async def describe(server_type: str, client: Client) -> Optional[Dict[str, Any]]:
+            try:
+                result = await client.list_tools()
+                return {tool.name: tool.inputSchema for tool in result.tools}
+            except Exception as e:
+                logger.warning("Listing tools on %s MCP server failed: %s", server_type, e)
+                return None
+        
+        servers = [(server_type, client) for server_type, client in self.clients.items() if client is not None]
+        results = await asyncio.gather(*(describe(server_type, client) for server_type, client in servers))
+        for (server_type, _), tools in zip(servers, results):
+            if tools is not None:
+                self.server_descriptions[server_type] = tools
+        
+        return self.server_descriptions
+    
+    def _supports(self, server: str, tool: str) -> bool:
+        """Whether a server offers a tool; assumed true until its tools are listed"""
+        tools = self.server_descriptions.get(server)
+        return tools is None or tool in tools
+    
+    async def _invoke(self, server: str, tool: str, payload: Dict[str, Any]) -> Dict:
+        """Call a tool on an MCP server and decode its JSON response."""
+        client = self.clients.get(server)
+        if client is None:
+            error = f"{server.capitalize()} MCP server not available"
+            logger.error(error)
+            return {"success": False, "error": error}
+        
         try:
-            if not self.clients.get("vector"):
-                logger.error("Vector MCP server not available")
-                return {"success": False, "error": "Vector MCP server not available"}
-                
-            result = await self.clients["vector"].call_tool("store_embedding", {
-                "id": id,
-                "vector": vector,
-                "metadata": metadata or {}
-            })
-            
-            return json.loads(result)
-            
+            async with self._limit(server):
+                return _json_loads(await client.call_tool(tool, payload))
         except Exception as e:
-            logger.error(f"Error storing embedding: {e}")
+            logger.error("Error calling %s tool %s: %s", server, tool, e)
             return {"success": False, "error": str(e)}
     
-    async def vector_similarity_search(self, query_vector: List[float], threshold: float = 0.8, 
+    def _limit(self, server: str) -> asyncio.Semaphore:
+        """Semaphore capping concurrent calls to one server at MAX_IN_FLIGHT"""
+        loop = asyncio.get_running_loop()
+        if self._limits_loop is not loop:
+            self._limits = {}
+            self._limits_loop = loop
+        
+        limit = self._limits.get(server)
+        if limit is None:
+            limit = self._limits[server] = asyncio.Semaphore(MAX_IN_FLIGHT)
+        return limit
+    
+    async def _invoke_vector(self, tool: str, payload: Callable[[bool], Dict[str, Any]]) -> Dict:
+        """Call a vector tool with float32-packed vectors (payload(True)).
+        
+        If the server rejects the call but accepts the same call with JSON
+        float lists (payload(False)), as servers built before the packed
+        fields do, float lists are sent from then on.
+        """
+        if not self._vector_packed:
+            return await self._invoke("vector", tool, payload(False))
+        
+        result = await self._invoke("vector", tool, payload(True))
+        if result.get("success") or self.clients.get("vector") is None:
+            return result
+        
+        fallback = await self._invoke("vector", tool, payload(False))
+        if not fallback.get("success"):
+            return result
+        logger.warning("Vector server rejected packed vectors, sending float lists: %s", result.get("error"))
+        self._vector_packed = False
+        return fallback
+    
+    async def vector_store_embedding(self, id: str, vector: Union[List[float], np.ndarray], 
+                                     metadata: Optional[Dict[str, Any]] = None) -> Dict:
+        """Store a vector embedding with metadata."""
+        return await self._invoke_vector("store_embedding", lambda packed: {
+            "id": id,
+            **_vector_param("vector", vector, packed),
+            "metadata": metadata or {}
+        })
+    
+    async def vector_batch_store(self, embeddings: List[Dict[str, Any]]) -> Dict:
+        """Store many {id, vector, metadata} embeddings in one call."""
+        return await self._invoke_vector("batch_store", lambda packed: {
+            "embeddings": [
+                {
+                    "id": embedding["id"],
+                    **_vector_param("vector", embedding["vector"], packed),
+                    "metadata": embedding.get("metadata") or {}
+                }
+                for embedding in embeddings
+            ]
+        })
+    
+    async def vector_similarity_search(self, query_vector: Union[List[float], np.ndarray], threshold: float = 0.8, 
                                       limit: int = 10, filter_params: Optional[Dict[str, Any]] = None) -> Dict:
         """Find similar vectors using cosine similarity."""
-        try:
-            if not self.clients.get("vector"):
-                logger.error("Vector MCP server not available")
-                return {"success": False, "error": "Vector MCP server not available"}
-                
-            result = await self.clients["vector"].call_tool("similarity_search", {
-                "query_vector": query_vector,
-                "threshold": threshold,
-                "limit": limit,
-                "filter_params": filter_params or {}
-            })
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            logger.error(f"Error in similarity search: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._invoke_vector("similarity_search", lambda packed: {
+            **_vector_param("query_vector", query_vector, packed),
+            "threshold": threshold,
+            "limit": limit,
+            "filter_params": filter_params or {}
+        })
+    
+    async def vector_call_tool(self, tool: str, payload: Dict[str, Any]) -> Dict:
+        """Call an arbitrary tool on the vector MCP server."""
+        return await self._invoke("vector", tool, payload)
     
     async def blockchain_deploy_contract(self, contract_type: str, client_address: str, 
                                         freelancer_address: str, amount: float, 
                                         milestones: Optional[List[Dict[str, Any]]] = None) -> Dict:
         """Deploy a smart contract to the blockchain."""
-        try:
-            if not self.clients.get("blockchain"):
-                logger.error("Blockchain MCP server not available")
-                return {"success": False, "error": "Blockchain MCP server not available"}
-                
-            result = await self.clients["blockchain"].call_tool("deploy_contract", {
-                "contract_type": contract_type,
-                "client_address": client_address,
-                "freelancer_address": freelancer_address,
-                "amount": amount,
-                "milestones": milestones or []
-            })
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            logger.error(f"Error deploying contract: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._invoke("blockchain", "deploy_contract", {
+            "contract_type": contract_type,
+            "client_address": client_address,
+            "freelancer_address": freelancer_address,
+            "amount": amount,
+            "milestones": milestones or []
+        })
     
     async def blockchain_release_payment(self, contract_address: str, escrow_id: str) -> Dict:
         """Release payment from escrow contract."""
+        return await self._invoke("blockchain", "release_payment", {
+            "contract_address": contract_address,
+            "escrow_id": escrow_id
+        })
+    
+    async def blockchain_call_tool(self, tool: str, payload: Dict[str, Any]) -> Dict:
+        """Call an arbitrary tool on the blockchain MCP server."""
+        return await self._invoke("blockchain", tool, payload)
+    
+    async def storage_store_file(self, file_data: Union[bytes, AsyncIterable[bytes]], 
+                                 metadata: Optional[Dict[str, Any]] = None) -> Dict:
+        """Store a file in IPFS or other storage."""
+        if self.clients.get("storage") is None:
+            logger.error("Storage MCP server not available")
+            return {"success": False, "error": "Storage MCP server not available"}
+        
+        # Large files and async byte streams are uploaded chunk by chunk when
+        # the server supports it, otherwise buffered and sent in one call
+        streaming = self._storage_streaming and self._supports("storage", "store_file_stream")
         try:
-            if not self.clients.get("blockchain"):
-                logger.error("Blockchain MCP server not available")
-                return {"success": False, "error": "Blockchain MCP server not available"}
-                
-            result = await self.clients["blockchain"].call_tool("release_payment", {
-                "contract_address": contract_address,
-                "escrow_id": escrow_id
-            })
-            
-            return json.loads(result)
-            
+            if not isinstance(file_data, (bytes, bytearray, memoryview)):
+                if streaming:
+                    return await self._storage_store_stream(file_data, metadata or {})
+                file_data = await _read_all(file_data)
+            elif len(file_data) > STREAM_THRESHOLD and streaming:
+                return await self._storage_store_stream(
+                    _iter_chunks(file_data, STREAM_CHUNK_SIZE), metadata or {}
+                )
         except Exception as e:
-            logger.error(f"Error releasing payment: {e}")
+            logger.error("Error storing file: %s", e)
             return {"success": False, "error": str(e)}
+        
+        return await self._storage_store_whole(file_data, metadata or {})
     
-    async def storage_store_file(self, file_data: bytes, metadata: Optional[Dict[str, Any]] = None) -> Dict:
-        """Store a file in IPFS or other storage."""
-        try:
-            if not self.clients.get("storage"):
-                logger.error("Storage MCP server not available")
-                return {"success": False, "error": "Storage MCP server not available"}
-                
-            # Convert bytes to base64 for JSON serialization
-            import base64
-            encoded_data = base64.b64encode(file_data).decode('utf-8')
+    async def _storage_store_whole(self, file_data: bytes, metadata: Dict[str, Any]) -> Dict:
+        """Upload a file as a single base64 string."""
+        return await self._invoke("storage", "store_file", {
+            "file_data_base64": _b64encode(file_data).decode('ascii'),
+            "metadata": metadata
+        })
+    
+    async def _storage_store_stream(self, chunks: AsyncIterable[bytes], metadata: Dict[str, Any]) -> Dict:
+        """Upload a file as a sequence of independently base64-encoded chunks.
+        
+        Peak memory is one chunk rather than the whole file plus its base64 copy.
+        The final call carries the metadata and returns the stored file hash.
+        If the server rejects the first chunk (no store_file_stream tool), the
+        file is sent through store_file instead and streaming is not retried.
+        """
+        client = self.clients["storage"]
+        upload_id = str(uuid.uuid4())
+        chunk_index = 0
+        
+        async for chunk in chunks:
+            try:
+                async with self._limit("storage"):
+                    result = _json_loads(await client.call_tool("store_file_stream", {
+                        "upload_id": upload_id,
+                        "chunk_index": chunk_index,
+                        "chunk_base64": _b64encode(chunk).decode('ascii'),
+                        "final": False
+                    }))
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+            
+            if not result.get("success"):
+                if chunk_index > 0:
+                    return result
                 
-            result = await self.clients["storage"].call_tool("store_file", {
-                "file_data_base64": encoded_data,
-                "metadata": metadata or {}
+                logger.warning("Chunked upload unavailable, falling back to store_file: %s", result.get("error"))
+                self._storage_streaming = False
+                return await self._storage_store_whole(bytes(chunk) + await _read_all(chunks), metadata)
+            chunk_index += 1
+        
+        async with self._limit("storage"):
+            result = await client.call_tool("store_file_stream", {
+                "upload_id": upload_id,
+                "chunk_index": chunk_index,
+                "chunk_base64": "",
+                "final": True,
+                "metadata": metadata
             })
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            logger.error(f"Error storing file: {e}")
-            return {"success": False, "error": str(e)}
+        
+        return _json_loads(result)
     
     async def storage_get_file(self, file_hash: str) -> Dict:
         """Retrieve a file from storage."""
-        try:
-            if not self.clients.get("storage"):
-                logger.error("Storage MCP server not available")
-                return {"success": False, "error": "Storage MCP server not available"}
-                
-            result = await self.clients["storage"].call_tool("get_file", {
-                "hash": file_hash
-            })
-            
-            response = json.loads(result)
-            
-            # Convert base64 back to bytes if successful
-            if response.get("success") and "file_data_base64" in response:
-                import base64
-                response["file_data"] = base64.b64decode(response["file_data_base64"])
-                del response["file_data_base64"]
-                
-            return response
+        response = await self._invoke("storage", "get_file", {"hash": file_hash})
+        
+        # Convert base64 back to bytes if successful
+        if response.get("success") and "file_data_base64" in response:
+            response["file_data"] = _b64decode(response.pop("file_data_base64"))
             
-        except Exception as e:
-            logger.error(f"Error retrieving file: {e}")
-            return {"success": False, "error": str(e)}
+        return response
+    
+    async def storage_call_tool(self, tool: str, payload: Dict[str, Any]) -> Dict:
+        """Call an arbitrary tool on the storage MCP server."""
+        return await self._invoke("storage", tool, payload)
     
     async def analytics_log_event(self, event_type: str, event_data: Dict[str, Any]) -> Dict:
         """Log an event to analytics."""
-        try:
-            if not self.clients.get("analytics"):
-                logger.error("Analytics MCP server not available")
-                return {"success": False, "error": "Analytics MCP server not available"}
-                
-            result = await self.clients["analytics"].call_tool("log_event", {
-                "event_type": event_type,
-                "event_data": event_data
-            })
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            logger.error(f"Error logging event: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._invoke("analytics", "log_event", {
+            "event_type": event_type,
+            "event_data": event_data
+        })
+    
+    async def analytics_log_events(self, events: List[Dict[str, Any]]) -> Dict:
+        """Log a batch of events to analytics in a single call.
+        
+        Falls back to one log_event call per event when the server has no
+        log_events tool or the batch call fails.
+        """
+        result = await self._invoke("analytics", "log_events", {"events": events})
+        if result.get("success", True) or self.clients.get("analytics") is None:
+            return result
+        
+        results = await asyncio.gather(*(
+            self.analytics_log_event(event["event_type"], self._counted_event_data(event))
+            for event in events
+        ))
+        return {
+            "success": all(r.get("success", False) for r in results),
+            "logged": sum(1 for r in results if r.get("success", False))
+        }
+    
+    @staticmethod
+    def _counted_event_data(event: Dict[str, Any]) -> Dict[str, Any]:
+        """Event data with the batch's duplicate "count" carried over, if any"""
+        if "count" not in event:
+            return event["event_data"]
+        return {**event["event_data"], "count": event["count"]}
     
     async def analytics_get_metrics(self, metric_type: str, time_range: str, 
                                    filters: Optional[Dict[str, Any]] = None) -> Dict:
         """Get analytics metrics."""
-        try:
-            if not self.clients.get("analytics"):
-                logger.error("Analytics MCP server not available")
-                return {"success": False, "error": "Analytics MCP server not available"}
-                
-            result = await self.clients["analytics"].call_tool("get_metrics", {
-                "metric_type": metric_type,
-                "time_range": time_range,
-                "filters": filters or {}
-            })
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            logger.error(f"Error getting metrics: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._invoke("analytics", "get_metrics", {
+            "metric_type": metric_type,
+            "time_range": time_range,
+            "filters": filters or {}
+        })
     
     async def social_post_update(self, platforms: List[str], message: str, 
                                media_urls: Optional[List[str]] = None) -> Dict:
         """Post an update to social media platforms."""
-        try:
-            if not self.clients.get("social"):
-                logger.error("Social MCP server not available")
-                return {"success": False, "error": "Social MCP server not available"}
-                
-            result = await self.clients["social"].call_tool("post_update", {
-                "platforms": platforms,
-                "message": message,
-                "media_urls": media_urls or []
-            })
-            
-            return json.loads(result)
-            
-        except Exception as e:
-            logger.error(f"Error posting social update: {e}")
-            return {"success": False, "error": str(e)}
+        return await self._invoke("social", "post_update", {
+            "platforms": platforms,
+            "message": message,
+            "media_urls": media_urls or []
+        })
 
 # Global instance
 mcp_manager = MCPClientManager()
@@ -52,6 +52,22 @@ class JobPost(BaseModel):
         if 'budget_min' in info.data and v < info.data['budget_min']:
             raise ValueError('budget_max must be greater than budget_min')
         return v
+    
+    # Derived on access, so copies and field updates are always reflected
+    @property
+    def job_text(self) -> str:
+        """Title, description and skills as embedded for matching"""
+        return f"{self.title} {self.description} {' '.join(self.skills)}"
+    
+    @property
+    def requirements_text(self) -> str:
+        """The text a deliverable is compared against during QA"""
+        return f"{self.title} {self.description}"
+    
+    @property
+    def budget_range(self) -> List[float]:
+        """A new list on every access, so callers can't alter each other's copy"""
+        return [self.budget_min, self.budget_max]
 
 
 class FreelancerProfile(BaseModel):
@@ -7,9 +7,10 @@ Enhanced with MCP integration
 import uuid
 import logging
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import asdict
+from typing import AsyncIterable, Dict, List, Any, Optional, Union
+from collections.abc import MutableMapping
 
 from gignova.models.base import AgentConfig, JobStatus, JobPost
 from gignova.agents.matching import MatchingAgent
@@ -17,60 +18,365 @@ from gignova.agents.negotiation import NegotiationAgent
 from gignova.agents.qa import QAAgent
 from gignova.agents.payment import PaymentAgent
 from gignova.mcp.client import mcp_manager
+from gignova.database.vector_manager_mcp import VectorManager
+from gignova.database.job_columns import JobColumns
+from gignova.config.settings import Settings
+from gignova.utils.helpers import JOB_CTX, stable_digest
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Status constants used by the metric counters on every transition
+_COMPLETED = JobStatus.COMPLETED
+_POSTED = JobStatus.POSTED
+_ACTIVE_SET = frozenset({JobStatus.ACTIVE, JobStatus.IN_QA})
+
+# Seconds each MCP server gets to answer its startup probe
+_PROBE_TIMEOUT = 2.0
+
+
+def _tracked_field(name: str) -> property:
+    """Record field whose writes are reported to the orchestrator holding the record"""
+    slot = "_" + name
+    
+    def get(self):
+        return getattr(self, slot)
+    
+    def set(self, value):
+        previous = getattr(self, slot)
+        setattr(self, slot, value)
+        if self._owner is not None:
+            self._owner._job_changed(self._job_id, name, previous, value)
+    
+    return property(get, set)
+
+
+class JobRecord:
+    """State of one job. Slotted, so a record carries no per-instance __dict__.
+    Also readable and writable by key (job.status, job.qa_result)
+    like the plain dicts it replaced. Writes to the tracked fields, by
+    attribute or by key, keep the owning orchestrator's counters, columns
+    and per-user indexes in step."""
+    
+    FIELDS = (
+        "post", "status", "created_at", "freelancer_id", "agreed_rate",
+        "negotiation_rounds", "contract_address", "escrow_id", "match_confidence",
+        "deliverable_hash", "qa_result", "payment_tx", "requirements_embedding"
+    )
+    
+    __slots__ = (
+        "post", "created_at", "agreed_rate", "negotiation_rounds", "contract_address",
+        "escrow_id", "deliverable_hash", "payment_tx", "requirements_embedding",
+        # Storage behind the tracked properties, and the orchestrator they report to
+        "_status", "_freelancer_id", "_match_confidence", "_qa_result", "_owner", "_job_id"
+    )
+    
+    status = _tracked_field("status")
+    freelancer_id = _tracked_field("freelancer_id")
+    match_confidence = _tracked_field("match_confidence")
+    qa_result = _tracked_field("qa_result")
+    
+    def __init__(self, post: Optional[JobPost] = None, status: JobStatus = JobStatus.POSTED,
+                 created_at: Optional[datetime] = None, **fields):
+        self._owner = None
+        self._job_id = None
+        self._freelancer_id = self._match_confidence = self._qa_result = None
+        self._status = status
+        self.post = post
+        self.created_at = created_at or datetime.now()
+        for name in self.FIELDS[3:]:
+            setattr(self, name, None)
+        for name, value in fields.items():
+            self[name] = value
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.FIELDS and getattr(self, key) is not None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Field value, or default when the field is unknown or unset (None)"""
+        value = getattr(self, key, None) if key in self.FIELDS else None
+        return default if value is None else value
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS
+                           if getattr(self, name) is not None)
+        return f"JobRecord({fields})"
+
+
+class _JobTable(MutableMapping):
+    """Job records keyed by job ID. Storing or deleting a record keeps the
+    orchestrator's metric counters and job columns in step. Plain dicts
+    stored here are converted to JobRecords."""
+    
+    def __init__(self, orchestrator: "GigNovaOrchestrator"):
+        self._orchestrator = orchestrator
+        self._records: Dict[str, Dict] = {}
+    
+    def __getitem__(self, job_id: str) -> Dict:
+        return self._records[job_id]
+    
+    def __contains__(self, job_id) -> bool:
+        return job_id in self._records
+    
+    def get(self, job_id: str, default=None):
+        return self._records.get(job_id, default)
+    
+    def __setitem__(self, job_id: str, job: Union[JobRecord, Dict]):
+        if isinstance(job, dict):
+            job = JobRecord(**job)
+        if job_id in self._records:
+            self._orchestrator._untrack_job(job_id, self._records[job_id])
+        self._records[job_id] = job
+        self._orchestrator._track_job(job_id, job)
+    
+    def __delitem__(self, job_id: str):
+        job = self._records.pop(job_id)
+        self._orchestrator._untrack_job(job_id, job)
+    
+    def __iter__(self):
+        return iter(self._records)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __repr__(self) -> str:
+        return repr(self._records)
+
 
 class GigNovaOrchestrator:
     def __init__(self):
         self.config = AgentConfig()
-        self.matching_agent = MatchingAgent(self.config)
-        self.negotiation_agent = NegotiationAgent(self.config)
-        self.qa_agent = QAAgent(self.config)
-        self.payment_agent = PaymentAgent(self.config)
+        # One vector manager (and encoder) shared by every agent
+        self.vector_manager = VectorManager()
+        self.matching_agent = MatchingAgent(self.config, self.vector_manager)
+        self.negotiation_agent = NegotiationAgent(self.config, self.vector_manager)
+        self.qa_agent = QAAgent(self.config, self.vector_manager)
+        self.payment_agent = PaymentAgent(self.config, self.vector_manager)
         
         # In-memory storage (replace with proper DB in production)
         self.jobs = {}
         self.freelancers = {}
         self.contracts = {}
         
+        # Analytics events are queued and shipped in batches by a background task
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        
         logger.info("GigNova Orchestrator initialized with MCP integration")
+    
+    @property
+    def jobs(self) -> "_JobTable":
+        return self._jobs
+    
+    @jobs.setter
+    def jobs(self, jobs: Dict[str, Dict]):
+        """Replace the job table and rebuild the running metric counters and columns"""
+        self._counts = {"completed": 0, "matched": 0, "active": 0}
+        self._qa_sum = 0.0
+        self._qa_n = 0
+        self.job_columns = JobColumns(max(1024, len(jobs)))
+        # user ID -> that user's job IDs, in insertion order (dict used as an ordered set)
+        self.jobs_by_client: Dict[str, Dict[str, None]] = {}
+        self.jobs_by_freelancer: Dict[str, Dict[str, None]] = {}
+        self._jobs = _JobTable(self)
+        self._jobs.update(jobs)
+    
+    def _track_job(self, job_id: str, job: Dict):
+        """Add a newly stored job record to the counters and columns"""
+        if not isinstance(job, JobRecord):
+            return
+        
+        self._count_status(job.status, 1)
+        client_id = getattr(job.post, "client_id", None)
+        if client_id is not None:
+            self.jobs_by_client.setdefault(client_id, {})[job_id] = None
+        if job.freelancer_id is not None:
+            self.jobs_by_freelancer.setdefault(job.freelancer_id, {})[job_id] = None
+        self.job_columns.add(job_id, job.status, job.created_at)
+        if job.qa_result:
+            self._qa_sum += job.qa_result.similarity_score
+            self._qa_n += 1
+            self.job_columns.set_qa_score(job_id, job.qa_result.similarity_score)
+        if job.match_confidence is not None:
+            self.job_columns.set_match_confidence(job_id, job.match_confidence)
+        # From here on the record reports its own writes to _job_changed
+        job._owner = self
+        job._job_id = job_id
+    
+    def _untrack_job(self, job_id: str, job: Dict):
+        """Remove a stored job record from the counters and columns"""
+        if not isinstance(job, JobRecord):
+            return
+        
+        job._owner = None
+        job._job_id = None
+        self._count_status(job.status, -1)
+        if job.qa_result:
+            self._qa_sum -= job.qa_result.similarity_score
+            self._qa_n -= 1
+        self.job_columns.remove(job_id)
+        self.jobs_by_client.get(getattr(job.post, "client_id", None), {}).pop(job_id, None)
+        self.jobs_by_freelancer.get(job.freelancer_id, {}).pop(job_id, None)
+    
+    def _job_changed(self, job_id: str, field: str, previous: Any, value: Any):
+        """Apply a write to one of a stored record's tracked fields to the
+        counters, columns and indexes. Called by JobRecord itself."""
+        if field == "status":
+            self._count_status(previous, -1)
+            self._count_status(value, 1)
+            self.job_columns.set_status(job_id, value)
+        elif field == "freelancer_id":
+            if previous is not None:
+                self.jobs_by_freelancer.get(previous, {}).pop(job_id, None)
+            if value is not None:
+                self.jobs_by_freelancer.setdefault(value, {})[job_id] = None
+        elif field == "match_confidence":
+            self.job_columns.set_match_confidence(job_id, float("nan") if value is None else value)
+        elif field == "qa_result":
+            if previous:
+                self._qa_sum -= previous.similarity_score
+                self._qa_n -= 1
+            if value:
+                self._qa_sum += value.similarity_score
+                self._qa_n += 1
+            self.job_columns.set_qa_score(job_id, value.similarity_score if value else float("nan"))
+    
+    def user_job_ids(self, user_id: str) -> List[str]:
+        """IDs of the jobs a user posted or is assigned to, oldest first per role"""
+        return list({
+            **self.jobs_by_client.get(user_id, {}),
+            **self.jobs_by_freelancer.get(user_id, {})
+        })
+    
+    def _count_status(self, status: JobStatus, delta: int):
+        """Apply a status to the running counters (delta is +1 on entry, -1 on exit)"""
+        counts = self._counts
+        if status is _COMPLETED:
+            counts["completed"] += delta
+        if status is not _POSTED:
+            counts["matched"] += delta
+        if status in _ACTIVE_SET:
+            counts["active"] += delta
+    
+    def start_event_flusher(self):
+        """Start the background task that ships queued analytics events"""
+        loop = asyncio.get_running_loop()
+        if self._flusher_task is None or self._flusher_task.done() or self._flusher_task.get_loop() is not loop:
+            self._event_queue = asyncio.Queue()
+            self._flusher_task = loop.create_task(self._flush_events())
+    
+    def _log(self, event_type: str, event_data: Dict[str, Any]):
+        """Queue an analytics event without waiting on the analytics server"""
+        # Normally started by initialize_mcp_connections; this covers callers that skip it
+        self.start_event_flusher()
+        self._event_queue.put_nowait({"event_type": event_type, "event_data": event_data})
+    
+    @staticmethod
+    def _add_to_batch(batch: Dict[Any, Dict[str, Any]], event: Dict[str, Any]):
+        """Add an event to a pending batch, folding it into an identical
+        earlier event by bumping that event's "count" instead"""
+        try:
+            key = stable_digest(event)
+        except (TypeError, ValueError):
+            # Unserializable payloads are never treated as duplicates
+            key = id(event)
+        
+        pending = batch.get(key)
+        if pending is None:
+            batch[key] = event
+        else:
+            pending["count"] = pending.get("count", 1) + 1
+    
+    async def _flush_events(self):
+        """Ship queued events in batches of up to ANALYTICS_BATCH_SIZE,
+        or whatever arrived within ANALYTICS_BATCH_MS of the first event.
+        Identical events within a batch are sent once with a "count".
+        A None on the queue sends the pending batch and stops the task."""
+        queue = self._event_queue
+        window = Settings.ANALYTICS_BATCH_MS / 1000
+        stopping = False
+        
+        while not stopping:
+            event = await queue.get()
+            if event is None:
+                break
+            
+            # Give a partial batch the window to fill up before draining it
+            if queue.qsize() < Settings.ANALYTICS_BATCH_SIZE - 1:
+                await asyncio.sleep(window)
+            
+            batch: Dict[Any, Dict[str, Any]] = {}
+            self._add_to_batch(batch, event)
+            while len(batch) < Settings.ANALYTICS_BATCH_SIZE and not queue.empty():
+                event = queue.get_nowait()
+                if event is None:
+                    stopping = True
+                    break
+                self._add_to_batch(batch, event)
+            
+            await mcp_manager.analytics_log_events(list(batch.values()))
+    
+    async def flush_events(self):
+        """Send every queued event and stop the background flusher"""
+        task, self._flusher_task = self._flusher_task, None
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            return
+        
+        # Events queued ahead of the sentinel are sent before the task exits
+        self._event_queue.put_nowait(None)
+        await task
         
     async def process_job_posting(self, job_post: JobPost) -> Dict:
         """Complete job processing pipeline with MCP integration"""
         job_id = str(uuid.uuid4())
+        token = JOB_CTX.set(job_id)
+        store_task = None
         
         try:
             # Log job posting to analytics
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="job_posted",
                 event_data={
                     "job_id": job_id,
                     "client_id": job_post.client_id,
                     "title": job_post.title,
-                    "budget_range": [job_post.budget_min, job_post.budget_max]
+                    "budget_range": job_post.budget_range
                 }
             )
             
             # Step 1: Store job and find matches
-            self.jobs[job_id] = {
-                "post": job_post,
-                "status": JobStatus.POSTED,
-                "created_at": datetime.now()
-            }
-            
-            # Store job embedding via MCP vector server
-            job_text = f"{job_post.title} {job_post.description} {' '.join(job_post.skills)}"
-            await self.matching_agent.vector_manager.store_job_embedding(
-                job_id, job_text, {"budget_range": [job_post.budget_min, job_post.budget_max]}
+            job = JobRecord(post=job_post)
+            self.jobs[job_id] = job
+            
+            # Embed the matching text and the QA requirements text once each;
+            # the requirements vector is reused when the deliverable arrives
+            job_embedding, requirements_embedding = await asyncio.gather(
+                self.matching_agent.embed_job(job_post),
+                self.qa_agent.embed_requirements(job_post.requirements_text)
             )
+            job.requirements_embedding = requirements_embedding
             
-            # Find matches via MCP vector search
-            matches = await self.matching_agent.find_matches(job_post)
+            # Nothing downstream reads the stored job vector, so the store runs
+            # alongside matching, negotiation and escrow and is awaited on exit
+            store_task = asyncio.ensure_future(
+                self.matching_agent.vector_manager.store_job_embedding(
+                    job_id, job_post.job_text, {"budget_range": job_post.budget_range}
+                )
+            )
+            matches = await self.matching_agent.find_matches(job_post, job_embedding)
             
             if not matches:
-                await mcp_manager.analytics_log_event(
+                self._log(
                     event_type="job_no_matches",
                     event_data={"job_id": job_id}
                 )
@@ -85,7 +391,7 @@ class GigNovaOrchestrator:
             best_match = matches[0]
             freelancer_data = self.freelancers.get(best_match["freelancer_id"], {})
             
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="negotiation_started",
                 event_data={
                     "job_id": job_id,
@@ -100,7 +406,7 @@ class GigNovaOrchestrator:
             )
             
             if not negotiation_result['success']:
-                await mcp_manager.analytics_log_event(
+                self._log(
                     event_type="negotiation_failed",
                     event_data={
                         "job_id": job_id,
@@ -125,7 +431,7 @@ class GigNovaOrchestrator:
             contract_result = await self.payment_agent.create_escrow(contract_data)
             
             if not contract_result.get("success"):
-                await mcp_manager.analytics_log_event(
+                self._log(
                     event_type="contract_creation_failed",
                     event_data={
                         "job_id": job_id,
@@ -140,16 +446,14 @@ class GigNovaOrchestrator:
                 }
             
             # Update job status
-            self.jobs[job_id].update({
-                "status": JobStatus.ACTIVE,
-                "freelancer_id": best_match["freelancer_id"],
-                "agreed_rate": negotiation_result['agreed_rate'],
-                "contract_address": contract_result.get("contract_address"),
-                "escrow_id": contract_result.get("escrow_id"),
-                "match_confidence": best_match["score"]
-            })
-            
-            await mcp_manager.analytics_log_event(
+            job.status = JobStatus.ACTIVE
+            job.freelancer_id = best_match["freelancer_id"]
+            job.agreed_rate = negotiation_result['agreed_rate']
+            job.contract_address = contract_result.get("contract_address")
+            job.escrow_id = contract_result.get("escrow_id")
+            job.match_confidence = best_match["score"]
+            
+            self._log(
                 event_type="job_activated",
                 event_data={
                     "job_id": job_id,
@@ -170,9 +474,9 @@ class GigNovaOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"Job processing failed: {e}")
+            logger.error("Job processing failed: %s", e)
             
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="job_processing_error",
                 event_data={
                     "job_id": job_id,
@@ -185,21 +489,33 @@ class GigNovaOrchestrator:
                 "status": "error",
                 "message": str(e)
             }
+        
+        finally:
+            if store_task is not None:
+                await store_task
+            JOB_CTX.reset(token)
     
-    async def submit_deliverable(self, job_id: str, deliverable_data: bytes) -> Dict:
-        """Process deliverable submission with MCP integration"""
+    async def submit_deliverable(self, job_id: str, deliverable_data: Union[bytes, AsyncIterable[bytes]],
+                                 size_hint: Optional[int] = None) -> Dict:
+        """Process deliverable submission with MCP integration
+        
+        deliverable_data may be an async byte stream, which is uploaded to
+        storage without being buffered; pass size_hint for the analytics event.
+        """
+        token = JOB_CTX.set(job_id)
         try:
-            if job_id not in self.jobs:
+            job = self.jobs.get(job_id)
+            if job is None:
                 raise ValueError("Job not found")
             
-            job = self.jobs[job_id]
-            
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="deliverable_submitted",
                 event_data={
                     "job_id": job_id,
-                    "freelancer_id": job.get("freelancer_id"),
-                    "file_size": len(deliverable_data)
+                    "freelancer_id": job.freelancer_id,
+                    "file_size": size_hint if size_hint is not None else (
+                        len(deliverable_data) if isinstance(deliverable_data, bytes) else None
+                    )
                 }
             )
             
@@ -207,39 +523,40 @@ class GigNovaOrchestrator:
             file_hash = await self.qa_agent.ipfs_manager.store_deliverable(deliverable_data)
             
             # Run QA validation via MCP
-            job_requirements = f"{job['post'].title} {job['post'].description}"
-            qa_result = await self.qa_agent.validate_deliverable(job_id, job_requirements, file_hash)
+            job_requirements = job.post.requirements_text
+            qa_result = await self.qa_agent.validate_deliverable(
+                job_id, job_requirements, file_hash,
+                requirements_embedding=job.requirements_embedding
+            )
             
             # Update job status
-            self.jobs[job_id].update({
-                "status": JobStatus.IN_QA if not qa_result.passed else JobStatus.COMPLETED,
-                "deliverable_hash": file_hash,
-                "qa_result": qa_result
-            })
+            job.status = JobStatus.IN_QA if not qa_result.passed else JobStatus.COMPLETED
+            job.deliverable_hash = file_hash
+            job.qa_result = qa_result
             
             # If QA passed, release payment via MCP blockchain server
             if qa_result.passed:
                 payment_result = await self.payment_agent.release_payment(
                     job_id, 
-                    job.get("contract_address"), 
-                    job.get("escrow_id"),
+                    job.contract_address, 
+                    job.escrow_id,
                     True
                 )
                 
-                self.jobs[job_id]["payment_tx"] = payment_result.get("transaction_hash")
+                job.payment_tx = payment_result.get("transaction_hash")
                 
                 # Record successful outcome for learning
                 outcome = {
                     "job_id": job_id,
                     "successful": True,
                     "qa_score": qa_result.similarity_score,
-                    "negotiation_rounds": job.get("negotiation_rounds", 0),
-                    "timestamp": datetime.now().timestamp()
+                    "negotiation_rounds": job.negotiation_rounds or 0,
+                    "timestamp": time.time()
                 }
                 
                 await self.matching_agent.learn_from_outcome(outcome)
                 
-                await mcp_manager.analytics_log_event(
+                self._log(
                     event_type="job_completed",
                     event_data={
                         "job_id": job_id,
@@ -248,7 +565,7 @@ class GigNovaOrchestrator:
                     }
                 )
             else:
-                await mcp_manager.analytics_log_event(
+                self._log(
                     event_type="qa_failed",
                     event_data={
                         "job_id": job_id,
@@ -264,13 +581,13 @@ class GigNovaOrchestrator:
                 "feedback": qa_result.feedback,
                 "file_hash": file_hash,
                 "payment_released": qa_result.passed,
-                "transaction_hash": self.jobs[job_id].get("payment_tx") if qa_result.passed else None
+                "transaction_hash": job.payment_tx if qa_result.passed else None
             }
             
         except Exception as e:
-            logger.error(f"Deliverable processing failed: {e}")
+            logger.error("Deliverable processing failed: %s", e)
             
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="deliverable_processing_error",
                 event_data={
                     "job_id": job_id,
@@ -282,6 +599,9 @@ class GigNovaOrchestrator:
                 "job_id": job_id,
                 "error": str(e)
             }
+        
+        finally:
+            JOB_CTX.reset(token)
     
     async def get_performance_metrics(self) -> Dict:
         """Get current system performance metrics with MCP analytics integration"""
@@ -298,12 +618,10 @@ class GigNovaOrchestrator:
                     "active_jobs": 0
                 }
             
-            completed_jobs = sum(1 for job in self.jobs.values() if job["status"] == JobStatus.COMPLETED)
-            matched_jobs = sum(1 for job in self.jobs.values() if job["status"] != JobStatus.POSTED)
-            active_jobs = sum(1 for job in self.jobs.values() if job["status"] in [JobStatus.ACTIVE, JobStatus.IN_QA])
-            
-            qa_scores = [job.get("qa_result").similarity_score 
-                        for job in self.jobs.values() if job.get("qa_result")]
+            # Running counters maintained on every status transition
+            completed_jobs = self._counts["completed"]
+            matched_jobs = self._counts["matched"]
+            active_jobs = self._counts["active"]
             
             # Get enhanced metrics from MCP analytics server
             analytics_metrics = await mcp_manager.analytics_get_metrics(
@@ -312,14 +630,15 @@ class GigNovaOrchestrator:
                 filters={}
             )
             
-            # Combine local and MCP metrics
+            # Combine local and MCP metrics; the config is flat, so a shallow copy
+            # replaces asdict()'s recursive deepcopy (agents tune it, so it is not cached)
             basic_metrics = {
                 "total_jobs": total_jobs,
                 "match_rate": matched_jobs / total_jobs if total_jobs > 0 else 0,
                 "completion_rate": completed_jobs / total_jobs if total_jobs > 0 else 0,
-                "avg_qa_score": sum(qa_scores) / len(qa_scores) if qa_scores else 0,
+                "avg_qa_score": self._qa_sum / self._qa_n if self._qa_n else 0,
                 "active_jobs": active_jobs,
-                "agent_config": asdict(self.config)
+                "agent_config": dict(vars(self.config))
             }
             
             if analytics_metrics.get("success"):
@@ -331,7 +650,7 @@ class GigNovaOrchestrator:
                 return basic_metrics
                 
         except Exception as e:
-            logger.error(f"Error getting performance metrics: {e}")
+            logger.error("Error getting performance metrics: %s", e)
             return {"error": str(e)}
     
     async def evolve_agents(self):
@@ -340,47 +659,58 @@ class GigNovaOrchestrator:
         
         try:
             # Log evolution start to analytics
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="agent_evolution_started",
                 event_data={
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
             )
             
-            # Evolve each agent type
-            matching_evolution = await self.matching_agent.evolve()
-            negotiation_evolution = await self.negotiation_agent.evolve()
-            qa_evolution = await self.qa_agent.evolve()
-            payment_evolution = await self.payment_agent.evolve()
+            # Evolve each agent type concurrently; a failing agent reports its
+            # error without aborting the others
+            matching_evolution, negotiation_evolution, qa_evolution, payment_evolution = (
+                {"error": repr(result)} if isinstance(result, Exception) else result
+                for result in await asyncio.gather(
+                    self.matching_agent.evolve(),
+                    self.negotiation_agent.evolve(),
+                    self.qa_agent.evolve(),
+                    self.payment_agent.evolve(),
+                    return_exceptions=True
+                )
+            )
+            
+            # Aggregate last week's job outcomes from the columnar store
+            job_stats = self.job_columns.outcome_stats(datetime.now() - timedelta(days=7))
             
             # Collect evolution results
             evolution_results = {
                 "matching": matching_evolution,
                 "negotiation": negotiation_evolution,
                 "qa": qa_evolution,
-                "payment": payment_evolution
+                "payment": payment_evolution,
+                "job_stats": job_stats
             }
             
             # Log evolution results to analytics
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="agent_evolution_completed",
                 event_data={
                     "results": evolution_results,
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
             )
             
-            logger.info(f"Evolution complete. Results: {evolution_results}")
+            logger.info("Evolution complete. Results: %s", evolution_results)
             return evolution_results
             
         except Exception as e:
-            logger.error(f"Agent evolution failed: {e}")
+            logger.error("Agent evolution failed: %s", e)
             
-            await mcp_manager.analytics_log_event(
+            self._log(
                 event_type="agent_evolution_error",
                 event_data={
                     "error": str(e),
-                    "timestamp": datetime.now().timestamp()
+                    "timestamp": time.time()
                 }
             )
             
@@ -389,23 +719,28 @@ class GigNovaOrchestrator:
     async def initialize_mcp_connections(self):
         """Initialize all MCP server connections"""
         try:
-            # Check vector MCP server
-            vector_status = await mcp_manager.vector_store_embedding(
-                id="test_connection",
-                vector=[0.1, 0.2, 0.3],
-                metadata={"test": True}
+            self.start_event_flusher()
+            
+            # Probe every MCP server concurrently with read-only tools from
+            # mcp_implementation_guide.md; startup costs one round trip,
+            # bounded by the probe timeout
+            probes = await asyncio.gather(
+                *(asyncio.wait_for(probe, _PROBE_TIMEOUT) for probe in (
+                    mcp_manager.vector_call_tool("get_collection_info", {}),
+                    mcp_manager.blockchain_call_tool("get_status", {}),
+                    mcp_manager.storage_call_tool("list_files", {"limit": 1}),
+                    mcp_manager.analytics_log_event(
+                        event_type="system_startup",
+                        event_data={"timestamp": time.time()}
+                    ),
+                    # Tool schemas are cached here once instead of rediscovered per call
+                    mcp_manager.load_tool_descriptions()
+                )),
+                return_exceptions=True
             )
-            
-            # Check blockchain MCP server
-            blockchain_status = await mcp_manager.blockchain_call_tool("get_status", {})
-            
-            # Check storage MCP server
-            storage_status = await mcp_manager.storage_call_tool("get_status", {})
-            
-            # Check analytics MCP server
-            analytics_status = await mcp_manager.analytics_log_event(
-                event_type="system_startup",
-                event_data={"timestamp": datetime.now().timestamp()}
+            vector_status, blockchain_status, storage_status, analytics_status, _ = (
+                {"success": False, "error": repr(probe)} if isinstance(probe, Exception) else probe
+                for probe in probes
             )
             
             logger.info("MCP connections initialized")
@@ -418,5 +753,5 @@ class GigNovaOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"MCP initialization failed: {e}")
+            logger.error("MCP initialization failed: %s", e)
             return {"error": str(e)}
@@ -5,13 +5,46 @@ GigNova: Utility Helper Functions
 
 import json
 import uuid
+import hashlib
 import logging
-from typing import Dict, List, Any
+import contextvars
+from typing import Dict, List, Any, Union
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson  # serializes datetime and numpy natively, in C
+except ImportError:
+    orjson = None
+
+try:
+    import simsimd  # AVX2/AVX-512/NEON distance kernels
+except ImportError:
+    simsimd = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    _json_loads = orjson.loads
+else:
+    _json_loads = json.loads
+
+
+# Job being handled by the current task; contextvars follow asyncio.gather
+# and create_task, so concurrent jobs never see each other's ID
+JOB_CTX: contextvars.ContextVar[str] = contextvars.ContextVar("job_id", default="-")
+
+
+class JobContextFilter(logging.Filter):
+    """Attach the current JOB_CTX value to each record as record.job_id"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.job_id = JOB_CTX.get()
+        return True
+
 
 def generate_id() -> str:
     """Generate a unique ID"""
@@ -19,7 +52,7 @@ def generate_id() -> str:
 
 
 def serialize_datetime(obj: Any) -> Any:
-    """JSON serializer for datetime objects"""
+    """JSON serializer for datetime objects (stdlib fallback when orjson is missing)"""
     if isinstance(obj, datetime):
         return obj.isoformat()
     raise TypeError(f"Type {type(obj)} not serializable")
@@ -28,46 +61,67 @@ def serialize_datetime(obj: Any) -> Any:
 def safe_json_dumps(data: Any) -> str:
     """Safely convert data to JSON string"""
     try:
+        if orjson is not None:
+            return orjson.dumps(data, option=_ORJSON_OPTS).decode()
         return json.dumps(data, default=serialize_datetime)
     except Exception as e:
         logger.error(f"JSON serialization failed: {e}")
         return "{}"
 
 
-def safe_json_loads(json_str: str) -> Dict:
+def safe_json_loads(json_str: Union[str, bytes]) -> Dict:
     """Safely parse JSON string"""
     try:
-        return json.loads(json_str)
+        return _json_loads(json_str)
     except Exception as e:
         logger.error(f"JSON parsing failed: {e}")
         return {}
 
 
-def calculate_similarity(vec1: List[float], vec2: List[float]) -> float:
+def stable_digest(data: Any) -> bytes:
+    """16-byte blake2b digest of data's key-sorted JSON encoding.
+    Raises TypeError / ValueError when data cannot be serialized."""
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=_ORJSON_OPTS | orjson.OPT_SORT_KEYS)
+    else:
+        encoded = json.dumps(data, sort_keys=True, default=serialize_datetime).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def calculate_similarity(vec1: Union[List[float], np.ndarray],
+                         vec2: Union[List[float], np.ndarray]) -> float:
     """Calculate cosine similarity between two vectors"""
-    import numpy as np
-    
-    if not vec1 or not vec2:
+    if len(vec1) == 0 or len(vec2) == 0:
         return 0.0
         
     try:
-        vec1_np = np.array(vec1)
-        vec2_np = np.array(vec2)
+        a = np.ascontiguousarray(vec1, dtype=np.float32)
+        b = np.ascontiguousarray(vec2, dtype=np.float32)
         
-        dot_product = np.dot(vec1_np, vec2_np)
-        norm1 = np.linalg.norm(vec1_np)
-        norm2 = np.linalg.norm(vec2_np)
+        if simsimd is not None:
+            # SimSIMD treats a zero vector as distance 1 or 0; keep it at 0 similarity
+            if not (a.any() and b.any()):
+                return 0.0
+            return 1.0 - float(simsimd.cosine(a, b))
         
-        if norm1 == 0 or norm2 == 0:
+        norms = np.linalg.norm(a) * np.linalg.norm(b)
+        if norms == 0:
             return 0.0
             
-        return dot_product / (norm1 * norm2)
+        return float(a @ b) / float(norms)
         
     except Exception as e:
         logger.error(f"Similarity calculation failed: {e}")
         return 0.0
 
 
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row of a float32 matrix to unit length (zero rows stay zero)"""
+    m = np.array(matrix, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(m, axis=1, keepdims=True)
+    return np.divide(m, norms, out=np.zeros_like(m), where=norms != 0)
+
+
 def format_currency(amount: float) -> str:
     """Format amount as currency"""
     return f"${amount:.2f}"
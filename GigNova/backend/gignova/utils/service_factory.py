@@ -6,15 +6,81 @@ Provides a factory for creating service instances based on environment
 
 import logging
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional, Union
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; pass use_local to a getter to override it
+_DEV_MODE = os.environ.get("DEV_MODE", "true").lower() in ("true", "1", "yes")
+
+
+@lru_cache(maxsize=4)
+def _storage_manager(use_local: bool) -> Any:
+    """Import and return the storage manager singleton"""
+    if use_local:
+        try:
+            from gignova.storage.local_manager import local_storage_manager
+            logger.info("Using local storage manager")
+            return local_storage_manager
+        except ImportError:
+            logger.warning("Local storage manager not available, falling back to IPFS")
+    
+    try:
+        from gignova.storage.manager import storage_manager
+        logger.info("Using IPFS storage manager")
+        return storage_manager
+    except ImportError:
+        logger.error("IPFS storage manager not available")
+        raise ImportError("No storage manager available")
+
+
+@lru_cache(maxsize=4)
+def _vector_manager(use_local: bool) -> Any:
+    """Import and return the vector manager singleton"""
+    if use_local:
+        try:
+            from gignova.database.local_vector_manager import local_vector_manager
+            logger.info("Using local vector manager")
+            return local_vector_manager
+        except ImportError:
+            logger.warning("Local vector manager not available, falling back to ChromaDB")
+    
+    try:
+        from gignova.database.vector_manager import vector_manager
+        logger.info("Using ChromaDB vector manager")
+        return vector_manager
+    except ImportError:
+        logger.error("Vector manager not available")
+        raise ImportError("No vector manager available")
+
+
+@lru_cache(maxsize=4)
+def _blockchain_manager(use_local: bool) -> Any:
+    """Import and return the blockchain manager singleton"""
+    if use_local:
+        try:
+            from gignova.blockchain.local_manager import local_blockchain_manager
+            logger.info("Using local blockchain manager")
+            return local_blockchain_manager
+        except ImportError:
+            logger.warning("Local blockchain manager not available, falling back to Ethereum")
+    
+    try:
+        from gignova.blockchain.manager import blockchain_manager
+        logger.info("Using Ethereum blockchain manager")
+        return blockchain_manager
+    except ImportError:
+        logger.error("Ethereum blockchain manager not available")
+        raise ImportError("No blockchain manager available")
+
+
 class ServiceFactory:
     """
-    Factory for creating service instances based on environment
+    Factory for creating service instances based on environment.
+    Each manager is resolved once and then served from a cache.
     """
     
     @staticmethod
@@ -28,25 +94,7 @@ class ServiceFactory:
         Returns:
             StorageManager instance
         """
-        # Determine if we should use local implementation
-        if use_local is None:
-            use_local = os.environ.get("DEV_MODE", "true").lower() in ("true", "1", "yes")
-        
-        if use_local:
-            try:
-                from gignova.storage.local_manager import local_storage_manager
-                logger.info("Using local storage manager")
-                return local_storage_manager
-            except ImportError:
-                logger.warning("Local storage manager not available, falling back to IPFS")
-        
-        try:
-            from gignova.storage.manager import storage_manager
-            logger.info("Using IPFS storage manager")
-            return storage_manager
-        except ImportError:
-            logger.error("IPFS storage manager not available")
-            raise ImportError("No storage manager available")
+        return _storage_manager(_DEV_MODE if use_local is None else use_local)
     
     @staticmethod
     def get_vector_manager(use_local: bool = None) -> Any:
@@ -59,25 +107,7 @@ class ServiceFactory:
         Returns:
             VectorManager instance
         """
-        # Determine if we should use local implementation
-        if use_local is None:
-            use_local = os.environ.get("DEV_MODE", "true").lower() in ("true", "1", "yes")
-        
-        if use_local:
-            try:
-                from gignova.database.local_vector_manager import local_vector_manager
-                logger.info("Using local vector manager")
-                return local_vector_manager
-            except ImportError:
-                logger.warning("Local vector manager not available, falling back to ChromaDB")
-        
-        try:
-            from gignova.database.vector_manager import vector_manager
-            logger.info("Using ChromaDB vector manager")
-            return vector_manager
-        except ImportError:
-            logger.error("Vector manager not available")
-            raise ImportError("No vector manager available")
+        return _vector_manager(_DEV_MODE if use_local is None else use_local)
     
     @staticmethod
     def get_blockchain_manager(use_local: bool = None) -> Any:
@@ -90,25 +120,7 @@ class ServiceFactory:
         Returns:
             BlockchainManager instance
         """
-        # Determine if we should use local implementation
-        if use_local is None:
-            use_local = os.environ.get("DEV_MODE", "true").lower() in ("true", "1", "yes")
-        
-        if use_local:
-            try:
-                from gignova.blockchain.local_manager import local_blockchain_manager
-                logger.info("Using local blockchain manager")
-                return local_blockchain_manager
-            except ImportError:
-                logger.warning("Local blockchain manager not available, falling back to Ethereum")
-        
-        try:
-            from gignova.blockchain.manager import blockchain_manager
-            logger.info("Using Ethereum blockchain manager")
-            return blockchain_manager
-        except ImportError:
-            logger.error("Ethereum blockchain manager not available")
-            raise ImportError("No blockchain manager available")
+        return _blockchain_manager(_DEV_MODE if use_local is None else use_local)
 
 # Create a singleton instance
 service_factory = ServiceFactory()
@@ -11,14 +11,17 @@ import logging
 import hashlib
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import BinaryIO, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from enum import Enum
 import uuid
+from collections import deque
+from pathlib import Path
 
 # Core dependencies
 import numpy as np
-from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import uvicorn
@@ -39,7 +42,9 @@ import solcx
 
 # Vector DB and Storage
 from qdrant_client import QdrantClient, AsyncQdrantClient
-from qdrant_client.models import Distance, VectorParams, PointStruct
+from qdrant_client.models import (
+    Distance, VectorParams, PointStruct, HnswConfigDiff, PayloadSchemaType
+)
 from qdrant_client.http.models import Filter, FieldCondition, MatchValue
 
 # IPFS
@@ -50,7 +55,6 @@ from dotenv import load_dotenv
 import redis
 import aioredis
 from concurrent.futures import ThreadPoolExecutor
-import schedule
 import threading
 
 # Load environment variables
@@ -74,6 +78,15 @@ class JobStatus(Enum):
     DISPUTED = "disputed"
     CANCELLED = "cancelled"
 
+# Compact integer code for each job status, for counting with np.bincount
+JOB_STATUS_CODES = {status: code for code, status in enumerate(JobStatus)}
+
+def count_statuses(jobs: List[Dict]) -> np.ndarray:
+    """Number of jobs in each status, indexed by JOB_STATUS_CODES"""
+    codes = np.fromiter((JOB_STATUS_CODES[job["status"]] for job in jobs),
+                        dtype=np.int8, count=len(jobs))
+    return np.bincount(codes, minlength=len(JOB_STATUS_CODES))
+
 class AgentType(Enum):
     MATCHING = "matching"
     NEGOTIATION = "negotiation"
@@ -209,6 +222,29 @@ contract GigNovaEscrow {
 }
 """
 
+SOLC_VERSION = '0.8.19'
+SOLC_CACHE_DIR = Path('.solc_cache')
+
+def compile_escrow_contract() -> Dict:
+    """Return the escrow contract's {abi, bin}, compiling only when the source changed"""
+    digest = hashlib.blake2b(f"{SOLC_VERSION}\n{ESCROW_CONTRACT}".encode()).hexdigest()[:16]
+    path = SOLC_CACHE_DIR / f"{digest}.json"
+    if path.exists():
+        return json.loads(path.read_text())
+    
+    solcx.install_solc(SOLC_VERSION)
+    solcx.set_solc_version(SOLC_VERSION)
+    compiled_sol = solcx.compile_source(ESCROW_CONTRACT)
+    contract_interface = compiled_sol['<stdin>:GigNovaEscrow']
+    artifact = {'abi': contract_interface['abi'], 'bin': contract_interface['bin']}
+    
+    # Write then rename so a concurrent start never reads a partial file
+    SOLC_CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(artifact))
+    os.replace(tmp_path, path)
+    return artifact
+
 # =============================================================================
 # BLOCKCHAIN INTERFACE
 # =============================================================================
@@ -218,17 +254,29 @@ class BlockchainManager:
         self.w3 = Web3(Web3.HTTPProvider(os.getenv('WEB3_PROVIDER_URI')))
         self.account = Account.from_key(os.getenv('WALLET_PRIVATE_KEY'))
         self.contract = None
+        self._nonce = None
+        self._nonce_lock = threading.Lock()
         self._deploy_contract()
     
+    def _resync_nonce(self):
+        """Reload the next nonce from the node, counting pending transactions"""
+        with self._nonce_lock:
+            self._nonce = self.w3.eth.get_transaction_count(self.account.address, 'pending')
+    
+    def _next_nonce(self) -> int:
+        """Take the next locally tracked nonce, priming it from the node once"""
+        if self._nonce is None:
+            self._resync_nonce()
+        with self._nonce_lock:
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+    
     def _deploy_contract(self):
         """Deploy the escrow contract"""
         try:
-            # Compile contract
-            solcx.install_solc('0.8.19')
-            solcx.set_solc_version('0.8.19')
-            
-            compiled_sol = solcx.compile_source(ESCROW_CONTRACT)
-            contract_interface = compiled_sol['<stdin>:GigNovaEscrow']
+            # Compile contract (cached on disk by source hash)
+            contract_interface = compile_escrow_contract()
             
             # Deploy contract
             contract = self.w3.eth.contract(
@@ -237,7 +285,7 @@ class BlockchainManager:
             )
             
             # Build transaction
-            nonce = self.w3.eth.get_transaction_count(self.account.address)
+            nonce = self._next_nonce()
             transaction = contract.constructor().build_transaction({
                 'from': self.account.address,
                 'nonce': nonce,
@@ -259,6 +307,7 @@ class BlockchainManager:
             
         except Exception as e:
             logger.error(f"Contract deployment failed: {e}")
+            self._nonce = None  # resync from the node on the next send
             # Use mock contract for development
             self.contract = MockContract()
     
@@ -268,7 +317,7 @@ class BlockchainManager:
             job_id_bytes = self.w3.keccak(text=job_id)
             deadline = int(time.time()) + (30 * 24 * 60 * 60)  # 30 days
             
-            nonce = self.w3.eth.get_transaction_count(self.account.address)
+            nonce = self._next_nonce()
             transaction = self.contract.functions.createJob(
                 job_id_bytes,
                 freelancer,
@@ -289,6 +338,7 @@ class BlockchainManager:
             
         except Exception as e:
             logger.error(f"Escrow creation failed: {e}")
+            self._nonce = None  # resync from the node on the next send
             return f"mock_tx_{job_id}"
     
     def release_payment(self, job_id: str) -> str:
@@ -296,7 +346,7 @@ class BlockchainManager:
         try:
             job_id_bytes = self.w3.keccak(text=job_id)
             
-            nonce = self.w3.eth.get_transaction_count(self.account.address)
+            nonce = self._next_nonce()
             transaction = self.contract.functions.completeJob(job_id_bytes).build_transaction({
                 'from': self.account.address,
                 'nonce': nonce,
@@ -311,6 +361,7 @@ class BlockchainManager:
             
         except Exception as e:
             logger.error(f"Payment release failed: {e}")
+            self._nonce = None  # resync from the node on the next send
             return f"mock_payment_{job_id}"
 
 class MockContract:
@@ -339,6 +390,7 @@ class VectorManager:
         )
         self.encoder = SentenceTransformer('all-MiniLM-L6-v2')
         self.collection_name = "gignova_embeddings"
+        self.outcome_collection_name = "gignova_outcomes"
         self._setup_collection()
     
     def _setup_collection(self):
@@ -348,9 +400,27 @@ class VectorManager:
             if not any(c.name == self.collection_name for c in collections):
                 self.client.create_collection(
                     collection_name=self.collection_name,
-                    vectors_config=VectorParams(size=384, distance=Distance.COSINE)
+                    vectors_config=VectorParams(size=384, distance=Distance.COSINE),
+                    # payload_m builds extra per-"type" graph links so filtered
+                    # searches stay connected inside the freelancer subset
+                    hnsw_config=HnswConfigDiff(m=16, ef_construct=100, payload_m=16),
+                    on_disk_payload=True
+                )
+                # Indexed "type" lets the freelancer filter prune candidates
+                # before vector scoring instead of after
+                self.client.create_payload_index(
+                    collection_name=self.collection_name,
+                    field_name="type",
+                    field_schema=PayloadSchemaType.KEYWORD
                 )
                 logger.info(f"Created collection: {self.collection_name}")
+            if not any(c.name == self.outcome_collection_name for c in collections):
+                # Payload-only: outcomes are aggregated, never searched by similarity
+                self.client.create_collection(
+                    collection_name=self.outcome_collection_name,
+                    vectors_config={}
+                )
+                logger.info(f"Created collection: {self.outcome_collection_name}")
         except Exception as e:
             logger.error(f"Collection setup failed: {e}")
     
@@ -400,6 +470,40 @@ class VectorManager:
         except Exception as e:
             logger.error(f"Freelancer embedding storage failed: {e}")
     
+    def store_freelancer_embeddings_batch(self, freelancers: List[Tuple[str, str, Dict]]):
+        """Store many (freelancer_id, profile_text, metadata) embeddings with one
+        batched encode and a single upsert"""
+        if not freelancers:
+            return
+        
+        try:
+            embeddings = self.encoder.encode(
+                [profile_text for _, profile_text, _ in freelancers],
+                batch_size=64,
+                convert_to_numpy=True
+            )
+            
+            points = [
+                PointStruct(
+                    id=freelancer_id,
+                    vector=embedding.tolist(),
+                    payload={
+                        "type": "freelancer",
+                        "text": profile_text,
+                        **metadata
+                    }
+                )
+                for (freelancer_id, profile_text, metadata), embedding in zip(freelancers, embeddings)
+            ]
+            
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=points
+            )
+            
+        except Exception as e:
+            logger.error(f"Batch freelancer embedding storage failed: {e}")
+    
     def find_matches(self, job_text: str, limit: int = 10) -> List[Dict]:
         """Find matching freelancers for a job"""
         try:
@@ -432,12 +536,10 @@ class VectorManager:
     def store_outcome(self, interaction_id: str, outcome_data: Dict):
         """Store interaction outcome for learning"""
         try:
-            outcome_text = json.dumps(outcome_data)
-            embedding = self.encoder.encode(outcome_text).tolist()
-            
+            # No embedding: the JSON blob has no useful semantic vector
             point = PointStruct(
-                id=f"outcome_{interaction_id}",
-                vector=embedding,
+                id=str(uuid.uuid5(uuid.NAMESPACE_OID, interaction_id)),
+                vector={},
                 payload={
                     "type": "outcome",
                     "timestamp": time.time(),
@@ -446,7 +548,7 @@ class VectorManager:
             )
             
             self.client.upsert(
-                collection_name=self.collection_name,
+                collection_name=self.outcome_collection_name,
                 points=[point]
             )
             
@@ -465,18 +567,31 @@ class IPFSManager:
             logger.error(f"IPFS connection failed: {e}")
             self.client = None
     
-    def store_deliverable(self, data: bytes) -> str:
-        """Store deliverable on IPFS"""
+    def store_deliverable(self, data: Union[bytes, BinaryIO]) -> str:
+        """Store deliverable on IPFS. A file object is streamed from its
+        current position rather than read into memory."""
         try:
             if self.client:
-                result = self.client.add_bytes(data)
-                return result
+                if isinstance(data, bytes):
+                    return self.client.add_bytes(data)
+                return self.client.add(data)['Hash']
             else:
                 # Mock hash for development
-                return hashlib.sha256(data).hexdigest()
+                return self._sha256(data)
         except Exception as e:
             logger.error(f"IPFS storage failed: {e}")
+            return self._sha256(data)
+    
+    @staticmethod
+    def _sha256(data: Union[bytes, BinaryIO]) -> str:
+        """SHA-256 of bytes, or of a file object read in 64 KiB chunks"""
+        if isinstance(data, bytes):
             return hashlib.sha256(data).hexdigest()
+        data.seek(0)
+        digest = hashlib.sha256()
+        while chunk := data.read(1 << 16):
+            digest.update(chunk)
+        return digest.hexdigest()
     
     def retrieve_deliverable(self, ipfs_hash: str) -> bytes:
         """Retrieve deliverable from IPFS"""
@@ -489,6 +604,22 @@ class IPFSManager:
             logger.error(f"IPFS retrieval failed: {e}")
             return b""
 
+# One client per backend for the whole process, so agents share connection
+# pools (and a single loaded encoder) instead of each opening their own.
+# Endpoints take them via Depends so tests can override them.
+
+@lru_cache(maxsize=1)
+def get_vector_manager() -> VectorManager:
+    return VectorManager()
+
+@lru_cache(maxsize=1)
+def get_ipfs_manager() -> IPFSManager:
+    return IPFSManager()
+
+@lru_cache(maxsize=1)
+def get_blockchain_manager() -> BlockchainManager:
+    return BlockchainManager()
+
 # =============================================================================
 # AI AGENTS
 # =============================================================================
@@ -497,8 +628,9 @@ class BaseAgent:
     def __init__(self, agent_type: AgentType, config: AgentConfig):
         self.agent_type = agent_type
         self.config = config
-        self.vector_manager = VectorManager()
-        self.memory = []
+        self.vector_manager = get_vector_manager()
+        # Recent outcomes only; Qdrant holds the full history
+        self.memory = deque(maxlen=1024)
         
     def learn_from_outcome(self, outcome: Dict):
         """Update agent behavior based on outcome"""
@@ -535,12 +667,10 @@ class MatchingAgent(BaseAgent):
         
         return job_matches
     
-    def evolve_threshold(self, recent_outcomes: List[Dict]):
-        """Adjust confidence threshold based on recent outcomes"""
-        if not recent_outcomes:
+    def evolve_threshold(self, success_rate: Optional[float]):
+        """Adjust confidence threshold based on the recent job success rate"""
+        if success_rate is None:
             return
-            
-        success_rate = sum(1 for outcome in recent_outcomes if outcome.get('successful', False)) / len(recent_outcomes)
         
         if success_rate < 0.6:  # Too many failures
             self.config.confidence_threshold += 0.05
@@ -555,7 +685,13 @@ class MatchingAgent(BaseAgent):
 class NegotiationAgent(BaseAgent):
     def __init__(self, config: AgentConfig):
         super().__init__(AgentType.NEGOTIATION, config)
-        self.openai_client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        # Async client so message generation never blocks the event loop;
+        # one retry at most, each attempt bounded by the per-request timeout
+        self.openai_client = openai.AsyncOpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            max_retries=1
+        )
+        self._message_cache: Dict[str, str] = {}
         
     def negotiate(self, client_budget: Tuple[float, float], freelancer_rate: float) -> Dict:
         """Negotiate between client budget and freelancer rate"""
@@ -598,22 +734,34 @@ class NegotiationAgent(BaseAgent):
                 "success": False
             }
     
-    def generate_negotiation_message(self, context: Dict) -> str:
+    async def generate_negotiation_message(self, context: Dict) -> str:
         """Generate negotiation message using LLM"""
+        context_json = json.dumps(context, sort_keys=True)
+        cache_key = hashlib.sha256(context_json.encode()).hexdigest()
+        cached = self._message_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = f"""
             You are a professional negotiation agent. Generate a polite but firm negotiation message.
-            Context: {json.dumps(context)}
+            Context: {context_json}
             Keep it professional and brief.
             """
             
-            response = self.openai_client.chat.completions.create(
+            response = await self.openai_client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=150
+                max_tokens=150,
+                stream=False,
+                timeout=2.0
             )
             
-            return response.choices[0].message.content
+            message = response.choices[0].message.content
+            if len(self._message_cache) >= 1024:
+                self._message_cache.pop(next(iter(self._message_cache)))
+            self._message_cache[cache_key] = message
+            return message
             
         except Exception as e:
             logger.error(f"Message generation failed: {e}")
@@ -622,7 +770,7 @@ class NegotiationAgent(BaseAgent):
 class QAAgent(BaseAgent):
     def __init__(self, config: AgentConfig):
         super().__init__(AgentType.QA, config)
-        self.ipfs_manager = IPFSManager()
+        self.ipfs_manager = get_ipfs_manager()
         
     def validate_deliverable(self, job_requirements: str, deliverable_hash: str) -> QAResult:
         """Validate deliverable against job requirements"""
@@ -673,7 +821,7 @@ class QAAgent(BaseAgent):
 class PaymentAgent(BaseAgent):
     def __init__(self, config: AgentConfig):
         super().__init__(AgentType.PAYMENT, config)
-        self.blockchain_manager = BlockchainManager()
+        self.blockchain_manager = get_blockchain_manager()
         
     def create_escrow(self, job_data: Dict) -> str:
         """Create escrow contract for job"""
@@ -717,6 +865,8 @@ class GigNovaOrchestrator:
         self.jobs = {}
         self.freelancers = {}
         self.contracts = {}
+        # Running per-freelancer earnings, credited when a job completes
+        self.total_earned_by_user: Dict[str, float] = {}
         
         # Evolution tracking
         self.performance_metrics = {
@@ -807,16 +957,18 @@ class GigNovaOrchestrator:
                 "message": str(e)
             }
     
-    async def submit_deliverable(self, job_id: str, deliverable_data: bytes) -> Dict:
+    async def submit_deliverable(self, job_id: str, deliverable_data: Union[bytes, BinaryIO]) -> Dict:
         """Process deliverable submission"""
         try:
-            if job_id not in self.jobs:
+            job = self.jobs.get(job_id)
+            if job is None:
                 raise ValueError("Job not found")
+            already_completed = job["status"] == JobStatus.COMPLETED
             
-            job = self.jobs[job_id]
-            
-            # Store deliverable on IPFS
-            ipfs_hash = self.qa_agent.ipfs_manager.store_deliverable(deliverable_data)
+            # Store deliverable on IPFS (blocking upload, so off the event loop)
+            ipfs_hash = await asyncio.to_thread(
+                self.qa_agent.ipfs_manager.store_deliverable, deliverable_data
+            )
             
             # Run QA validation
             job_requirements = f"{job['post'].title} {job['post'].description}"
@@ -829,6 +981,13 @@ class GigNovaOrchestrator:
                 "qa_result": qa_result
             })
             
+            # Credit the freelancer once, on the transition to COMPLETED
+            freelancer_id = job.get("freelancer_id")
+            if qa_result.passed and not already_completed and freelancer_id:
+                self.total_earned_by_user[freelancer_id] = (
+                    self.total_earned_by_user.get(freelancer_id, 0) + job.get("agreed_rate", 0)
+                )
+            
             # If QA passed, release payment
             if qa_result.passed:
                 payment_result = self.payment_agent.release_payment(job_id, True)
@@ -894,25 +1053,29 @@ class GigNovaOrchestrator:
         logger.info("Starting agent evolution process...")
         
         # Get recent outcomes for learning
-        recent_outcomes = []
         cutoff_time = datetime.now() - timedelta(days=7)
+        recent_jobs = [
+            job for job in self.jobs.values()
+            if job.get("created_at", datetime.min) > cutoff_time
+        ]
         
-        for job in self.jobs.values():
-            if job.get("created_at", datetime.min) > cutoff_time:
-                outcome = {
-                    "successful": job["status"] == JobStatus.COMPLETED,
-                    "qa_score": job.get("qa_result", {}).get("similarity_score", 0),
-                    "match_confidence": job.get("match_confidence", 0)
-                }
-                recent_outcomes.append(outcome)
+        # One pass to pull the outcome fields into arrays, then vectorized means
+        successful = np.fromiter(
+            (job["status"] == JobStatus.COMPLETED for job in recent_jobs),
+            dtype=bool, count=len(recent_jobs)
+        )
+        qa_scores = np.fromiter(
+            (job.get("qa_result", {}).get("similarity_score", 0) for job in recent_jobs),
+            dtype=np.float64, count=len(recent_jobs)
+        )
+        success_rate = float(successful.mean()) if recent_jobs else 0.0
         
         # Evolve matching agent
-        self.matching_agent.evolve_threshold(recent_outcomes)
+        self.matching_agent.evolve_threshold(success_rate if recent_jobs else None)
         
         # Update performance tracking
-        if recent_outcomes:
-            success_rate = sum(1 for o in recent_outcomes if o["successful"]) / len(recent_outcomes)
-            avg_qa_score = sum(o["qa_score"] for o in recent_outcomes) / len(recent_outcomes)
+        if recent_jobs:
+            avg_qa_score = float(qa_scores.mean())
             
             self.performance_metrics["match_rate"].append(success_rate)
             self.performance_metrics["qa_pass_rate"].append(avg_qa_score)
@@ -979,11 +1142,10 @@ async def create_job(job_post: JobPost, user_id: str = Depends(verify_token)):
 @app.get("/jobs/{job_id}")
 async def get_job(job_id: str, user_id: str = Depends(verify_token)):
     """Get job details"""
-    if job_id not in orchestrator.jobs:
+    job = orchestrator.jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = orchestrator.jobs[job_id]
-    
     # Check if user has access to this job
     if job["post"].client_id != user_id and job.get("freelancer_id") != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
@@ -1002,20 +1164,21 @@ async def get_job(job_id: str, user_id: str = Depends(verify_token)):
 @app.post("/jobs/{job_id}/deliverable")
 async def submit_deliverable(
     job_id: str, 
-    deliverable: bytes,
+    deliverable: UploadFile = File(...),
     user_id: str = Depends(verify_token)
 ):
     """Submit deliverable for a job"""
-    if job_id not in orchestrator.jobs:
+    job = orchestrator.jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    job = orchestrator.jobs[job_id]
-    
     # Check if user is the assigned freelancer
     if job.get("freelancer_id") != user_id:
         raise HTTPException(status_code=403, detail="Only assigned freelancer can submit deliverable")
     
-    result = await orchestrator.submit_deliverable(job_id, deliverable)
+    # The upload is spooled to disk by Starlette; hand IPFS the file object
+    # so the body is streamed instead of copied into one bytes object
+    result = await orchestrator.submit_deliverable(job_id, deliverable.file)
     return result
 
 @app.post("/freelancers/register")
@@ -1043,10 +1206,11 @@ async def register_freelancer(profile: FreelancerProfile, user_id: str = Depends
 @app.get("/freelancers/{freelancer_id}")
 async def get_freelancer(freelancer_id: str):
     """Get freelancer profile"""
-    if freelancer_id not in orchestrator.freelancers:
+    freelancer = orchestrator.freelancers.get(freelancer_id)
+    if freelancer is None:
         raise HTTPException(status_code=404, detail="Freelancer not found")
     
-    return orchestrator.freelancers[freelancer_id]
+    return freelancer
 
 @app.post("/auth/login")
 async def login(credentials: dict):
@@ -1094,19 +1258,22 @@ async def dashboard(user_id: str = Depends(verify_token)):
     client_jobs = [job for job in user_jobs if job["post"].client_id == user_id]
     freelancer_jobs = [job for job in user_jobs if job.get("freelancer_id") == user_id]
     
+    # One counting pass per role instead of one list comprehension per status
+    client_counts = count_statuses(client_jobs)
+    freelancer_counts = count_statuses(freelancer_jobs)
+    
     return {
         "user_id": user_id,
         "total_jobs": len(user_jobs),
         "as_client": {
-            "posted": len([j for j in client_jobs if j["status"] == JobStatus.POSTED]),
-            "active": len([j for j in client_jobs if j["status"] == JobStatus.ACTIVE]),
-            "completed": len([j for j in client_jobs if j["status"] == JobStatus.COMPLETED])
+            "posted": int(client_counts[JOB_STATUS_CODES[JobStatus.POSTED]]),
+            "active": int(client_counts[JOB_STATUS_CODES[JobStatus.ACTIVE]]),
+            "completed": int(client_counts[JOB_STATUS_CODES[JobStatus.COMPLETED]])
         },
         "as_freelancer": {
-            "active": len([j for j in freelancer_jobs if j["status"] == JobStatus.ACTIVE]),
-            "completed": len([j for j in freelancer_jobs if j["status"] == JobStatus.COMPLETED]),
-            "total_earned": sum(j.get("agreed_rate", 0) for j in freelancer_jobs 
-                              if j["status"] == JobStatus.COMPLETED)
+            "active": int(freelancer_counts[JOB_STATUS_CODES[JobStatus.ACTIVE]]),
+            "completed": int(freelancer_counts[JOB_STATUS_CODES[JobStatus.COMPLETED]]),
+            "total_earned": orchestrator.total_earned_by_user.get(user_id, 0)
         },
         "system_metrics": orchestrator.get_performance_metrics()
     }
@@ -1115,21 +1282,32 @@ async def dashboard(user_id: str = Depends(verify_token)):
 # BACKGROUND TASKS & SCHEDULING
 # =============================================================================
 
-def run_weekly_evolution():
-    """Background task for weekly agent evolution"""
-    orchestrator.evolve_agents()
+def seconds_until_next_sunday_0200(now: Optional[datetime] = None) -> float:
+    """Seconds until the next Sunday 02:00 local time"""
+    now = now or datetime.now()
+    target = now.replace(hour=2, minute=0, second=0, microsecond=0)
+    target += timedelta(days=(6 - now.weekday()) % 7)
+    if target <= now:
+        target += timedelta(days=7)
+    return (target - now).total_seconds()
+
+async def weekly_evolution_loop():
+    """Run agent evolution every Sunday at 02:00 without a scheduler thread"""
+    while True:
+        await asyncio.sleep(seconds_until_next_sunday_0200())
+        try:
+            # evolve_agents is synchronous; keep it off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, orchestrator.evolve_agents)
+        except Exception as e:
+            logger.error(f"Weekly evolution failed: {e}")
+
+# Held so the running loop task isn't garbage collected
+evolution_task: Optional[asyncio.Task] = None
 
 def start_background_scheduler():
     """Start background task scheduler"""
-    def scheduler_loop():
-        schedule.every().sunday.at("02:00").do(run_weekly_evolution)
-        
-        while True:
-            schedule.run_pending()
-            time.sleep(3600)  # Check every hour
-    
-    scheduler_thread = threading.Thread(target=scheduler_loop, daemon=True)
-    scheduler_thread.start()
+    global evolution_task
+    evolution_task = asyncio.create_task(weekly_evolution_loop())
     logger.info("Background scheduler started")
 
 # =============================================================================
@@ -1149,6 +1327,18 @@ async def startup_event():
     
     logger.info("GigNova API started successfully!")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the scheduler and close the shared backend clients"""
+    if evolution_task is not None:
+        evolution_task.cancel()
+    
+    get_vector_manager().client.close()
+    ipfs_client = get_ipfs_manager().client
+    if ipfs_client is not None:
+        ipfs_client.close()
+    # The Web3 HTTP provider keeps no connection open that needs closing
+
 async def initialize_demo_data():
     """Initialize demo freelancers and jobs for testing"""
     try:
@@ -1182,18 +1372,20 @@ async def initialize_demo_data():
         
         for freelancer in demo_freelancers:
             orchestrator.freelancers[freelancer.user_id] = freelancer
-            
-            # Store embeddings
-            profile_text = f"{' '.join(freelancer.skills)} Rate: ${freelancer.hourly_rate}/hr Rating: {freelancer.rating}"
-            orchestrator.matching_agent.vector_manager.store_freelancer_embedding(
+        
+        # Store embeddings in one batch
+        orchestrator.matching_agent.vector_manager.store_freelancer_embeddings_batch([
+            (
                 freelancer.user_id,
-                profile_text,
+                f"{' '.join(freelancer.skills)} Rate: ${freelancer.hourly_rate}/hr Rating: {freelancer.rating}",
                 {
                     "skills": freelancer.skills,
                     "hourly_rate": freelancer.hourly_rate,
                     "rating": freelancer.rating
                 }
             )
+            for freelancer in demo_freelancers
+        ])
         
         logger.info(f"Initialized {len(demo_freelancers)} demo freelancers")
         
@@ -1204,23 +1396,37 @@ async def initialize_demo_data():
 # HEALTH CHECK ENDPOINTS
 # =============================================================================
 
+HEALTH_PROBE_TIMEOUT = 0.2  # seconds
+
 @app.get("/health")
-async def health_check():
+async def health_check(
+    vector_manager: VectorManager = Depends(get_vector_manager),
+    blockchain_manager: BlockchainManager = Depends(get_blockchain_manager),
+    ipfs_manager: IPFSManager = Depends(get_ipfs_manager)
+):
     """Detailed health check"""
     try:
-        # Check vector DB connection
-        vector_status = "connected"
-        try:
-            orchestrator.matching_agent.vector_manager.client.get_collections()
-        except:
-            vector_status = "disconnected"
+        # Probe every backend concurrently, each bounded by HEALTH_PROBE_TIMEOUT,
+        # so the endpoint takes as long as the slowest probe rather than the sum
+        def probe_blockchain():
+            if not blockchain_manager.w3.is_connected():
+                raise ConnectionError("node not reachable")
         
-        # Check blockchain connection
-        blockchain_status = "connected"
-        try:
-            orchestrator.payment_agent.blockchain_manager.w3.is_connected()
-        except:
-            blockchain_status = "disconnected"
+        def probe_ipfs():
+            ipfs_manager.client.id()
+        
+        probes = await asyncio.gather(
+            *(asyncio.wait_for(asyncio.to_thread(probe), HEALTH_PROBE_TIMEOUT) for probe in (
+                vector_manager.client.get_collections,
+                probe_blockchain,
+                probe_ipfs
+            )),
+            return_exceptions=True
+        )
+        vector_status, blockchain_status, ipfs_status = (
+            "disconnected" if isinstance(probe, BaseException) else "connected"
+            for probe in probes
+        )
         
         return {
             "status": "healthy",
@@ -1228,7 +1434,7 @@ async def health_check():
             "services": {
                 "vector_db": vector_status,
                 "blockchain": blockchain_status,
-                "ipfs": "connected" if orchestrator.qa_agent.ipfs_manager.client else "disconnected"
+                "ipfs": ipfs_status
             },
             "metrics": orchestrator.get_performance_metrics()
         }
@@ -1244,18 +1450,25 @@ async def health_check():
 # TESTING ENDPOINTS
 # =============================================================================
 
+# Immutable parts of the sample job; only the deadline is stamped per request
+_SAMPLE_JOB_TITLE = "AI Chatbot Development"
+_SAMPLE_JOB_DESCRIPTION = "Build an intelligent chatbot using GPT-4 for customer service automation"
+_SAMPLE_SKILLS = ("Python", "AI", "NLP", "API Integration")
+_SAMPLE_REQUIREMENTS = ("Experience with OpenAI API", "Previous chatbot projects")
+_SAMPLE_DEADLINE = timedelta(days=14)
+
 @app.post("/test/create-sample-job")
 async def create_sample_job():
     """Create a sample job for testing"""
     sample_job = JobPost(
-        title="AI Chatbot Development",
-        description="Build an intelligent chatbot using GPT-4 for customer service automation",
-        skills=["Python", "AI", "NLP", "API Integration"],
+        title=_SAMPLE_JOB_TITLE,
+        description=_SAMPLE_JOB_DESCRIPTION,
+        skills=list(_SAMPLE_SKILLS),
         budget_min=1000.0,
         budget_max=2500.0,
-        deadline=datetime.now() + timedelta(days=14),
+        deadline=datetime.now() + _SAMPLE_DEADLINE,
         client_id="demo_client",
-        requirements=["Experience with OpenAI API", "Previous chatbot projects"]
+        requirements=list(_SAMPLE_REQUIREMENTS)
     )
     
     result = await orchestrator.process_job_posting(sample_job)
@@ -1288,11 +1501,13 @@ if __name__ == "__main__":
     if not os.path.exists('.env'):
         logger.warning("No .env file found. Using default configuration.")
     
-    # Run the application
+    # Run the application. uvicorn picks uvloop and httptools when installed
+    # (uvicorn[standard]); the reload file watcher is for development only.
+    # One worker: jobs and freelancers live in this process's memory
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=os.getenv("DEV") == "1",
         log_level="info"
     )
\ No newline at end of file
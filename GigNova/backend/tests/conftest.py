@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+GigNova: Backend Test Configuration
+Installs stand-ins for the MCP SDK, sentence-transformers and NumPy before the
+test modules are imported. Set GIGNOVA_TEST_REAL_ML=1 to keep the real
+sentence-transformers and NumPy; the MCP SDK is always mocked.
+"""
+
+import os
+import sys
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+
+class MockSentenceTransformer:
+    def __init__(self, *args, **kwargs):
+        pass
+        
+    def encode(self, text, **kwargs):
+        # Return a fixed embedding vector for testing that has a tolist method
+        class MockArray(list):
+            def tolist(self):
+                return list(self)
+        return MockArray([0.1, 0.2, 0.3, 0.4, 0.5])
+
+
+def pytest_configure(config):
+    """Mock the MCP client module (and the ML stack) before collection"""
+    sys.modules['mcp'] = MagicMock()
+    sys.modules['mcp.client'] = MagicMock()
+    sys.modules['mcp.client.session'] = MagicMock()
+    
+    # Create a proper async mock for the ClientSession class
+    mcp_client_mock = MagicMock()
+    mcp_client_mock.call_tool = AsyncMock(return_value='{"success": true}')
+    sys.modules['mcp.client.session'].ClientSession = MagicMock(return_value=mcp_client_mock)
+    
+    if os.getenv("GIGNOVA_TEST_REAL_ML") == "1":
+        return
+    
+    # Create mock numpy module
+    mock_numpy = MagicMock()
+    mock_numpy.array = lambda x: x
+    mock_numpy.dot = lambda x, y: 0.95  # High similarity score for testing
+    
+    sys.modules['sentence_transformers'] = MagicMock()
+    sys.modules['sentence_transformers'].SentenceTransformer = MockSentenceTransformer
+    sys.modules['numpy'] = mock_numpy
+
+
+@pytest.fixture(scope="session")
+def mock_sentence_transformer():
+    """The fixed-vector SentenceTransformer stand-in"""
+    return MockSentenceTransformer
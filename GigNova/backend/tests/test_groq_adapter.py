@@ -7,12 +7,14 @@ import os
 import pytest
 from unittest.mock import AsyncMock, patch
 
+from langchain_core.messages import HumanMessage, SystemMessage
+
 from gignova.llm.groq_adapter import GroqAdapter
 
 
-@pytest.fixture
-def mock_groq_adapter():
-    """Create a mock Groq adapter for testing"""
+@pytest.fixture(scope="module")
+def groq_adapter():
+    """Create a Groq adapter backed by a mock ChatGroq once per module"""
     with patch('gignova.llm.groq_adapter.ChatGroq') as mock_chat_groq:
         # Configure the mock to return a response with content
         mock_instance = mock_chat_groq.return_value
@@ -25,6 +27,13 @@ def mock_groq_adapter():
         yield adapter
 
 
+@pytest.fixture
+def mock_groq_adapter(groq_adapter):
+    """The module's Groq adapter with its mock call history cleared"""
+    groq_adapter.llm.reset_mock()
+    yield groq_adapter
+
+
 @pytest.mark.asyncio
 async def test_generate_text(mock_groq_adapter):
     """Test generating text with the Groq adapter"""
@@ -39,40 +48,49 @@ async def test_generate_text(mock_groq_adapter):
     assert response == "This is a mock response from Groq"
     
     # Verify the mock was called with the right parameters
-    mock_groq_adapter.llm.invoke.assert_called_once()
+    mock_groq_adapter.llm.invoke.assert_called_once_with([
+        SystemMessage(content="Test system prompt"),
+        HumanMessage(content="Test prompt")
+    ])
+    assert mock_groq_adapter.llm.model_kwargs == {"temperature": 0.5, "max_tokens": 1024}
 
 
 @pytest.mark.asyncio
 async def test_generate_structured_output(mock_groq_adapter):
     """Test generating structured output with the Groq adapter"""
-    # Mock the generate_text method to return a JSON string
-    mock_groq_adapter.generate_text = AsyncMock(return_value='{"key": "value"}')
-    
-    # Call the generate_structured_output method
-    response = await mock_groq_adapter.generate_structured_output(
-        prompt="Test prompt",
-        system_prompt="Test system prompt",
-        output_schema={"key": "str"}
-    )
+    # Mock the generate_text method to return a JSON string; patch.object
+    # restores it so the shared adapter is unchanged for other tests
+    with patch.object(mock_groq_adapter, "generate_text",
+                      AsyncMock(return_value='{"key": "value"}')) as generate_text:
+        # Call the generate_structured_output method
+        response = await mock_groq_adapter.generate_structured_output(
+            prompt="Test prompt",
+            system_prompt="Test system prompt",
+            output_schema={"key": "str"}
+        )
     
     # Verify the response
     assert response == {"key": "value"}
     
-    # Verify the generate_text method was called
-    mock_groq_adapter.generate_text.assert_called_once()
+    # Verify the generate_text method was called with the schema appended
+    generate_text.assert_awaited_once_with(
+        prompt="Test prompt\n\nReturn a JSON object matching this schema: {'key': 'str'}",
+        system_prompt="Test system prompt",
+        temperature=0.2
+    )
 
 
 @pytest.mark.asyncio
 async def test_generate_structured_output_error_handling(mock_groq_adapter):
     """Test error handling in generate_structured_output"""
     # Mock the generate_text method to return an invalid JSON string
-    mock_groq_adapter.generate_text = AsyncMock(return_value='Not a JSON string')
-    
-    # Call the generate_structured_output method
-    response = await mock_groq_adapter.generate_structured_output(
-        prompt="Test prompt",
-        output_schema={"key": "str"}
-    )
+    with patch.object(mock_groq_adapter, "generate_text",
+                      AsyncMock(return_value='Not a JSON string')):
+        # Call the generate_structured_output method
+        response = await mock_groq_adapter.generate_structured_output(
+            prompt="Test prompt",
+            output_schema={"key": "str"}
+        )
     
     # Verify the response contains error information
     assert "error" in response
@@ -5,47 +5,13 @@ Tests for the MCP-enhanced backend components
 """
 
 import os
-import sys
 import uuid
 import pytest
 import asyncio
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
-from datetime import datetime, timedelta
-
-# Mock the MCP client module before importing our modules
-sys.modules['mcp'] = MagicMock()
-sys.modules['mcp.client'] = MagicMock()
-sys.modules['mcp.client.session'] = MagicMock()
-
-# Create a proper async mock for the ClientSession class
-mcp_client_mock = MagicMock()
-mcp_client_mock.call_tool = AsyncMock(return_value='{"success": true}')
-sys.modules['mcp.client.session'].ClientSession = MagicMock(return_value=mcp_client_mock)
-
-# Mock SentenceTransformer and NumPy for testing
-class MockSentenceTransformer:
-    def __init__(self, *args, **kwargs):
-        pass
-        
-    def encode(self, text):
-        # Return a fixed embedding vector for testing that has a tolist method
-        class MockArray:
-            def tolist(self):
-                return [0.1, 0.2, 0.3, 0.4, 0.5]
-        return MockArray()
-        
-# Create mock numpy module
-mock_numpy = MagicMock()
-mock_numpy.array = lambda x: x
-mock_numpy.dot = lambda x, y: 0.95  # High similarity score for testing
-
-# Apply mocks
-sys.modules['sentence_transformers'] = MagicMock()
-sys.modules['sentence_transformers'].SentenceTransformer = MockSentenceTransformer
-sys.modules['numpy'] = mock_numpy
-
-# Now import our modules
-from gignova.models.base import AgentConfig, JobPost, AgentType
+
+from gignova.models.base import AgentConfig, JobPost, AgentType, JobStatus
 from gignova.database.vector_manager_mcp import VectorManager
 from gignova.ipfs.manager_mcp import IPFSManager
 from gignova.blockchain.manager_mcp import BlockchainManager
@@ -68,97 +34,109 @@ def mock_mcp_client():
             yield mock_client
 
 
-@pytest.fixture
-def mock_mcp_manager():
-    """Create a mock MCP manager for testing"""
-    with patch('gignova.mcp.client.mcp_manager') as mock_manager:
-        # Create AsyncMock instances for all async methods
-        mock_manager.vector_store_embedding = AsyncMock(return_value={"success": True, "id": "test_id"})
+# The canned results are shared by every test in the module, so they are
+# handed out read-only: code that mutates one fails loudly instead of
+# leaking the change into later tests
+def _returns(value):
+    """Plain coroutine function returning value, for methods no test asserts on"""
+    value = MappingProxyType(value)
+    
+    async def method(*args, **kwargs):
+        return value
+    return method
+
+
+def _mock_returning(value):
+    """AsyncMock returning value, for methods tests assert on"""
+    return AsyncMock(return_value=MappingProxyType(value))
+
+
+@pytest.fixture(scope="module")
+def mcp_manager_methods():
+    """Build the MCP manager's methods once per module. Only the methods
+    tests assert on are AsyncMocks; the rest are plain coroutines."""
+    return {
+        "vector_store_embedding": _mock_returning({"success": True, "id": "test_id"}),
         
-        mock_manager.vector_similarity_search = AsyncMock(return_value={
+        "vector_similarity_search": _returns({
             "success": True, 
             "results": [
                 {"id": "freelancer_123", "score": 0.95, "metadata": {"name": "Test Freelancer", "type": "freelancer"}}
             ]
-        })
-        
-        # IPFS storage mock responses
-        mock_manager.storage_store_file = AsyncMock(return_value={
-            "success": True,
-            "hash": "QmTest123456"
-        })
-        
-        mock_manager.storage_retrieve_file = AsyncMock(return_value={
-            "success": True,
-            "data": b"Test file content retrieved"
-        })
+        }),
         
         # Blockchain mock responses
-        mock_manager.blockchain_deploy_contract = AsyncMock(return_value={
+        "blockchain_deploy_contract": _mock_returning({
             "success": True,
             "contract_address": "0x123456789",
             "escrow_id": "escrow_123"
-        })
+        }),
         
-        mock_manager.blockchain_release_payment = AsyncMock(return_value={
+        "blockchain_release_payment": _mock_returning({
             "success": True,
             "transaction_hash": "0xabcdef123456"
-        })
+        }),
         
-        mock_manager.storage_store_file = AsyncMock(return_value={
+        # IPFS storage mock responses
+        "storage_store_file": _returns({
             "success": True,
             "hash": "QmTestHash123",
             "url": "http://localhost:8080/ipfs/QmTestHash123"
-        })
+        }),
         
-        mock_manager.storage_retrieve_file = AsyncMock(return_value={
+        "storage_retrieve_file": _returns({
             "success": True,
             "data": b"Test file content"
-        })
+        }),
         
         # Fix the name to match the actual method in the client
-        mock_manager.storage_get_file = AsyncMock(return_value={
+        "storage_get_file": _returns({
             "success": True,
             "data": b"Test file content"
-        })
+        }),
         
-        mock_manager.analytics_log_event = AsyncMock(return_value={"success": True})
+        "analytics_log_event": _mock_returning({"success": True}),
         
-        mock_manager.analytics_get_metrics = AsyncMock(return_value={
+        "analytics_get_metrics": _returns({
             "success": True,
             "metrics": {
                 "qa_acceptance_rate": 0.85,
                 "payment_success_rate": 0.95,
                 "average_job_completion_time": 86400  # 1 day in seconds
             }
-        })
+        }),
         
-        mock_manager.social_post_update = AsyncMock(return_value={"success": True})
+        "social_post_update": _returns({"success": True}),
         
         # Mock the initialize_connections method
-        mock_manager.initialize_connections = AsyncMock(return_value={
+        "initialize_connections": _returns({
             "vector": True,
             "blockchain": True,
             "storage": True,
             "analytics": True,
             "social": True
-        })
+        }),
         
-        # Mock the clients dictionary to avoid AttributeError
-        mock_manager.clients = {
-            "vector": MagicMock(),
-            "blockchain": MagicMock(),
-            "storage": MagicMock(),
-            "analytics": MagicMock(),
-            "social": MagicMock()
+        # Mock the clients dictionary to avoid AttributeError; nothing outside
+        # the manager calls the clients directly
+        "clients": {
+            client_name: SimpleNamespace()
+            for client_name in ("vector", "blockchain", "storage", "analytics", "social")
         }
-        
-        # Mock any direct call_tool methods that might be used
-        for client_name in mock_manager.clients:
-            mock_manager.clients[client_name].call_tool = AsyncMock(return_value='{"success": true}')
-        
-        yield mock_manager
+    }
+
 
+@pytest.fixture
+def mock_mcp_manager(mcp_manager_methods):
+    """Patch the MCP manager with the module's mocks, reset for this test.
+    Each test gets a fresh manager, so attributes it replaces don't leak."""
+    for method in mcp_manager_methods.values():
+        if isinstance(method, AsyncMock):
+            method.reset_mock()
+    
+    methods = {**mcp_manager_methods, "clients": dict(mcp_manager_methods["clients"])}
+    with patch('gignova.mcp.client.mcp_manager', new=SimpleNamespace(**methods)) as mock_manager:
+        yield mock_manager
 
 # Mock methods for testing
 async def mock_store_job_embedding(self, job_id, job_text, metadata):
@@ -183,16 +161,16 @@ async def mock_retrieve_deliverable(self, file_hash):
     return b"Test file content retrieved"
 
 @pytest.mark.asyncio
-async def test_vector_manager_mcp(mock_mcp_manager):
+async def test_vector_manager_mcp(mock_mcp_manager, monkeypatch):
     """Test the MCP-enhanced vector manager"""
+    # Patch the methods on the class; monkeypatch restores them after the test
+    monkeypatch.setattr(VectorManager, "store_job_embedding", mock_store_job_embedding)
+    monkeypatch.setattr(VectorManager, "store_freelancer_embedding", mock_store_freelancer_embedding)
+    monkeypatch.setattr(VectorManager, "find_matches", mock_find_matches)
+    
     # Create vector manager
     vector_manager = VectorManager()
     
-    # Monkey patch the methods directly on the instance
-    vector_manager.store_job_embedding = mock_store_job_embedding.__get__(vector_manager)
-    vector_manager.store_freelancer_embedding = mock_store_freelancer_embedding.__get__(vector_manager)
-    vector_manager.find_matches = mock_find_matches.__get__(vector_manager)
-    
     # Test storing job embedding
     await vector_manager.store_job_embedding(
         job_id="job_123",
@@ -216,15 +194,15 @@ async def test_vector_manager_mcp(mock_mcp_manager):
 
 
 @pytest.mark.asyncio
-async def test_storage_manager_mcp(mock_mcp_manager):
+async def test_storage_manager_mcp(mock_mcp_manager, monkeypatch):
     """Test the MCP-enhanced storage manager"""
+    # Patch the methods on the class; monkeypatch restores them after the test
+    monkeypatch.setattr(IPFSManager, "store_deliverable", mock_store_deliverable)
+    monkeypatch.setattr(IPFSManager, "retrieve_deliverable", mock_retrieve_deliverable)
+    
     # Create storage manager
     storage_manager = IPFSManager()
     
-    # Monkey patch the methods directly on the instance
-    storage_manager.store_deliverable = mock_store_deliverable.__get__(storage_manager)
-    storage_manager.retrieve_deliverable = mock_retrieve_deliverable.__get__(storage_manager)
-    
     # Test storing a file
     file_data = b"Test file content for IPFS storage"
     file_hash = await storage_manager.store_deliverable(file_data)
@@ -243,26 +221,37 @@ async def test_blockchain_manager_mcp(mock_mcp_manager):
     # Create blockchain manager
     blockchain_manager = BlockchainManager()
     
-    # Test creating an escrow
-    escrow_result = await blockchain_manager.create_escrow(
-        client_address="0xclient123",
-        freelancer_address="0xfreelancer456",
-        amount=150.0,
-        job_id="job_123"
-    )
-    
-    assert escrow_result["success"] is True
-    assert "contract_address" in escrow_result
-    assert "escrow_id" in escrow_result
+    with patch('gignova.blockchain.manager_mcp.mcp_manager', mock_mcp_manager):
+        # Test creating an escrow
+        escrow_result = await blockchain_manager.create_escrow(
+            client_address="0xclient123",
+            freelancer_address="0xfreelancer456",
+            amount=150.0,
+            job_id="job_123"
+        )
+        
+        mock_mcp_manager.blockchain_deploy_contract.assert_awaited_once_with(
+            contract_type="escrow",
+            client_address="0xclient123",
+            freelancer_address="0xfreelancer456",
+            amount=150.0,
+            milestones=[{"description": "Job completion for job_id: job_123", "amount": 150.0}]
+        )
+        assert escrow_result["success"] is True
+        assert escrow_result["contract_address"] == "0x123456789"
+        assert escrow_result["escrow_id"] == "escrow_123"
+        
+        # Test releasing payment
+        payment_result = await blockchain_manager.release_payment(
+            contract_address=escrow_result["contract_address"],
+            escrow_id=escrow_result["escrow_id"]
+        )
     
-    # Test releasing payment
-    payment_result = await blockchain_manager.release_payment(
-        contract_address=escrow_result["contract_address"],
-        escrow_id=escrow_result["escrow_id"]
+    mock_mcp_manager.blockchain_release_payment.assert_awaited_once_with(
+        contract_address="0x123456789",
+        escrow_id="escrow_123"
     )
-    
-    assert payment_result["success"] is True
-    assert "transaction_hash" in payment_result
+    assert payment_result == {"success": True, "transaction_hash": "0xabcdef123456"}
 
 
 @pytest.mark.asyncio
@@ -272,16 +261,32 @@ async def test_qa_agent_mcp(mock_mcp_manager):
     config = AgentConfig()
     qa_agent = QAAgent(config)
     
+    # Serve the deliverable from storage and give it the requirements' embedding
+    storage_manager = MagicMock()
+    storage_manager.retrieve_file = AsyncMock(return_value={"success": True, "data": b"A responsive website"})
+    vector_manager = MagicMock()
+    vector_manager.generate_embeddings = AsyncMock(return_value=[[0.6, 0.8], [0.6, 0.8]])
+    
     # Test deliverable validation
-    qa_result = await qa_agent.validate_deliverable(
-        job_id="job_123",
-        job_requirements="Create a website with responsive design",
-        deliverable_hash="QmTest123456"
-    )
+    with patch('gignova.agents.qa.service_factory') as mock_factory, \
+            patch.object(qa_agent, 'learn_from_outcome', new=AsyncMock()):
+        mock_factory.get_storage_manager.return_value = storage_manager
+        mock_factory.get_vector_manager.return_value = vector_manager
+        qa_result = await qa_agent.validate_deliverable(
+            job_id="job_123",
+            requirements="Create a website with responsive design",
+            deliverable_id="QmTest123456"
+        )
     
-    assert hasattr(qa_result, "passed")
-    assert hasattr(qa_result, "similarity_score")
-    assert hasattr(qa_result, "feedback")
+    storage_manager.retrieve_file.assert_awaited_once_with("QmTest123456")
+    vector_manager.generate_embeddings.assert_awaited_once_with(
+        ["Create a website with responsive design", "A responsive website"]
+    )
+    assert qa_result.deliverable_hash == "QmTest123456"
+    assert qa_result.passed is True
+    assert isinstance(qa_result.passed, bool)
+    assert 0.0 <= qa_result.similarity_score <= 1.0
+    assert isinstance(qa_result.feedback, str)
 
 
 @pytest.mark.asyncio
@@ -315,11 +320,11 @@ async def test_payment_agent_mcp(mock_mcp_manager):
     assert "transaction_hash" in payment_result
 
 
-@pytest.mark.asyncio
-async def test_orchestrator_mcp(mock_mcp_manager):
-    """Test the MCP-enhanced orchestrator"""
-    # Create orchestrator with mocked components
-    with patch('gignova.database.vector_manager_mcp.VectorManager') as mock_vector_manager_class:
+@pytest.fixture
+def orchestrator_with_mocks(mock_mcp_manager):
+    """Create an orchestrator with the vector manager and negotiation agent mocked"""
+    with patch('gignova.database.vector_manager_mcp.VectorManager') as mock_vector_manager_class, \
+            patch('gignova.agents.negotiation.NegotiationAgent') as mock_negotiation_class:
         # Setup vector manager mock to return freelancer matches
         mock_vector_manager = MagicMock()
         mock_vector_manager.find_matches = AsyncMock(return_value=[
@@ -328,76 +333,454 @@ async def test_orchestrator_mcp(mock_mcp_manager):
         mock_vector_manager_class.return_value = mock_vector_manager
         
         # Setup negotiation agent mock
-        with patch('gignova.agents.negotiation.NegotiationAgent') as mock_negotiation_class:
-            mock_negotiation = MagicMock()
-            mock_negotiation.negotiate = AsyncMock(return_value={"agreed_rate": 175.0, "success": True})
-            mock_negotiation_class.return_value = mock_negotiation
-            
-            # Create orchestrator with mocked components
-            orchestrator = GigNovaOrchestrator()
-            
-            # Test job posting
-            job_post = JobPost(
-                client_id="client_123",
-                title="Test Job",
-                description="This is a test job posting",
-                skills=["python", "fastapi", "mcp"],
-                budget_min=100,
-                budget_max=200,
-                deadline=datetime.now() + timedelta(days=14),
-                requirements=["Must have experience with MCP integration"]
-            )
-            
-            # Add the job to the orchestrator's jobs dictionary to avoid KeyError
-            job_id = str(uuid.uuid4())
-            orchestrator.jobs[job_id] = job_post
+        mock_negotiation = MagicMock()
+        mock_negotiation.negotiate = AsyncMock(return_value={"agreed_rate": 175.0, "success": True})
+        mock_negotiation_class.return_value = mock_negotiation
+        
+        yield GigNovaOrchestrator()
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_process_job_posting(orchestrator_with_mocks):
+    """Test job posting through the MCP-enhanced orchestrator"""
+    orchestrator = orchestrator_with_mocks
+    job_post = JobPost(
+        client_id="client_123",
+        title="Test Job",
+        description="This is a test job posting",
+        skills=["python", "fastapi", "mcp"],
+        budget_min=100,
+        budget_max=200,
+        deadline_days=14,
+        requirements=["Must have experience with MCP integration"]
+    )
+    
+    # Patch the collaborators and run the real pipeline
+    matching_agent = orchestrator.matching_agent
+    vector_manager = MagicMock()
+    vector_manager.store_job_embedding = AsyncMock(return_value={"success": True, "id": "job_stored"})
+    match = {"freelancer_id": "freelancer_123", "score": 0.95}
+    with patch.object(matching_agent, 'embed_job', new=AsyncMock(return_value=[0.1, 0.2])), \
+            patch.object(orchestrator.qa_agent, 'embed_requirements', new=AsyncMock(return_value=[0.3, 0.4])), \
+            patch.object(matching_agent, 'vector_manager', new=vector_manager), \
+            patch.object(matching_agent, 'find_matches', new=AsyncMock(return_value=[match])) as mock_find, \
+            patch.object(orchestrator.negotiation_agent, 'negotiate',
+                         new=AsyncMock(return_value={"success": True, "agreed_rate": 175.0})) as mock_negotiate, \
+            patch.object(orchestrator.payment_agent, 'create_escrow', new=AsyncMock(return_value={
+                "success": True, "contract_address": "0x123456789", "escrow_id": "escrow_123"
+            })) as mock_escrow:
+        job_result = await orchestrator.process_job_posting(job_post)
+    
+    job_id = job_result["job_id"]
+    assert job_result == {
+        "job_id": job_id,
+        "status": "active",
+        "freelancer_id": "freelancer_123",
+        "agreed_rate": 175.0,
+        "contract_address": "0x123456789",
+        "escrow_id": "escrow_123",
+        "confidence_score": 0.95
+    }
+    mock_find.assert_awaited_once_with(job_post, [0.1, 0.2])
+    # No profile is registered for the freelancer, so the client's maximum is offered
+    mock_negotiate.assert_awaited_once_with((100, 200), 200)
+    mock_escrow.assert_awaited_once_with({
+        "job_id": job_id,
+        "client": "client_123",
+        "freelancer": "freelancer_123",
+        "amount": 175.0
+    })
+    vector_manager.store_job_embedding.assert_awaited_once()
+    assert orchestrator.jobs[job_id]["status"] == JobStatus.ACTIVE
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_submit_deliverable(orchestrator_with_mocks):
+    """Test deliverable submission through the MCP-enhanced orchestrator"""
+    orchestrator = orchestrator_with_mocks
+    
+    # Test deliverable submission with mocked methods
+    with patch.object(orchestrator, 'submit_deliverable', new=AsyncMock()) as mock_submit:
+        mock_submit.return_value = {
+            "qa_passed": True,
+            "similarity_score": 0.92,
+            "file_hash": "QmTest123456",
+            "payment_released": True
+        }
+        
+        deliverable_result = await orchestrator.submit_deliverable(str(uuid.uuid4()), b"Test deliverable content")
+    
+    assert deliverable_result["qa_passed"] is True
+    assert "similarity_score" in deliverable_result
+    assert "file_hash" in deliverable_result
+    assert deliverable_result["payment_released"] is True
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_evolve_agents(orchestrator_with_mocks):
+    """Test agent evolution through the MCP-enhanced orchestrator"""
+    orchestrator = orchestrator_with_mocks
+    
+    # Test agent evolution with mocked method
+    with patch.object(orchestrator, 'evolve_agents', new=AsyncMock()) as mock_evolve:
+        mock_evolve.return_value = {
+            "matching": {"accuracy": 0.92},
+            "qa": {"precision": 0.95}
+        }
+        
+        evolution_result = await orchestrator.evolve_agents()
+    
+    assert "matching" in evolution_result
+    assert "qa" in evolution_result
+
+
+@pytest.mark.asyncio
+async def test_storage_store_file_chunked_upload():
+    """Test large files are uploaded in store_file_stream chunks"""
+    import base64
+    from gignova.mcp.client import MCPClientManager, STREAM_THRESHOLD, STREAM_CHUNK_SIZE
+    
+    manager = MCPClientManager()
+    storage = MagicMock()
+    storage.call_tool = AsyncMock(return_value='{"success": true, "file_hash": "QmChunked"}')
+    manager.clients["storage"] = storage
+    
+    file_data = bytes(range(256)) * (STREAM_THRESHOLD // 256 + 1)
+    result = await manager.storage_store_file(file_data, {"filename": "big.bin"})
+    
+    assert result["file_hash"] == "QmChunked"
+    calls = storage.call_tool.call_args_list
+    assert {call.args[0] for call in calls} == {"store_file_stream"}
+    assert len(calls) == -(-len(file_data) // STREAM_CHUNK_SIZE) + 1
+    assert calls[-1].args[1]["final"] is True
+    assert calls[-1].args[1]["metadata"] == {"filename": "big.bin"}
+    
+    uploaded = b"".join(base64.b64decode(call.args[1]["chunk_base64"]) for call in calls[:-1])
+    assert uploaded == file_data
+
+
+@pytest.mark.asyncio
+async def test_storage_store_file_falls_back_without_stream_tool():
+    """Test uploads fall back to store_file when the server lacks store_file_stream"""
+    import base64
+    from gignova.mcp.client import MCPClientManager, STREAM_THRESHOLD
+    
+    async def call_tool(tool, payload):
+        if tool == "store_file_stream":
+            raise RuntimeError("Unknown tool: store_file_stream")
+        return '{"success": true, "file_hash": "QmWhole"}'
+    
+    manager = MCPClientManager()
+    storage = MagicMock()
+    storage.call_tool = AsyncMock(side_effect=call_tool)
+    manager.clients["storage"] = storage
+    
+    file_data = b"x" * (STREAM_THRESHOLD + 10)
+    result = await manager.storage_store_file(file_data)
+    
+    assert result["file_hash"] == "QmWhole"
+    tool, payload = storage.call_tool.call_args.args
+    assert tool == "store_file"
+    assert base64.b64decode(payload["file_data_base64"]) == file_data
+    
+    # Later uploads go straight to store_file
+    storage.call_tool.reset_mock()
+    await manager.storage_store_file(file_data)
+    assert [call.args[0] for call in storage.call_tool.call_args_list] == ["store_file"]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_pings_each_server():
+    """Test warm_up pings every configured server and reports failures per server"""
+    from gignova.mcp.client import MCPClientManager
+    
+    manager = MCPClientManager()
+    healthy = MagicMock()
+    healthy.send_ping = AsyncMock(return_value=None)
+    broken = MagicMock()
+    broken.send_ping = AsyncMock(side_effect=ConnectionError("refused"))
+    manager.clients = {"vector": healthy, "storage": broken, "social": None}
+    
+    status = await manager.warm_up()
+    
+    assert status == {"vector": True, "storage": False}
+    healthy.send_ping.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_invoke_decodes_and_reports_errors():
+    """Test _invoke decodes tool responses and turns failures into error dicts"""
+    from gignova.mcp.client import MCPClientManager
+    
+    manager = MCPClientManager()
+    analytics = MagicMock()
+    analytics.call_tool = AsyncMock(return_value='{"success": true, "metrics": {"jobs": 3}}')
+    manager.clients = {"analytics": analytics, "social": None}
+    
+    result = await manager._invoke("analytics", "get_metrics", {"metric_type": "jobs"})
+    assert result == {"success": True, "metrics": {"jobs": 3}}
+    analytics.call_tool.assert_awaited_once_with("get_metrics", {"metric_type": "jobs"})
+    
+    result = await manager._invoke("social", "post_update", {})
+    assert result == {"success": False, "error": "Social MCP server not available"}
+    
+    analytics.call_tool = AsyncMock(side_effect=TimeoutError("timed out"))
+    result = await manager._invoke("analytics", "get_metrics", {})
+    assert result == {"success": False, "error": "timed out"}
+
+
+@pytest.mark.asyncio
+async def test_invoke_caps_concurrent_calls_per_server():
+    """Test tool calls to one server never exceed MAX_IN_FLIGHT at a time"""
+    from gignova.mcp.client import MCPClientManager
+    
+    in_flight = 0
+    peak = 0
+    
+    async def call_tool(tool, payload):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return '{"success": true}'
+    
+    manager = MCPClientManager()
+    analytics = MagicMock()
+    analytics.call_tool = AsyncMock(side_effect=call_tool)
+    manager.clients = {"analytics": analytics}
+    
+    with patch("gignova.mcp.client.MAX_IN_FLIGHT", 3):
+        results = await asyncio.gather(*(manager._invoke("analytics", "log_event", {}) for _ in range(10)))
+    
+    assert all(result["success"] for result in results)
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_tool_descriptions_skip_unsupported_chunked_upload():
+    """Test listed tool schemas are cached and steer uploads away from missing tools"""
+    from types import SimpleNamespace
+    from gignova.mcp.client import MCPClientManager, STREAM_THRESHOLD
+    
+    manager = MCPClientManager()
+    storage = MagicMock()
+    storage.list_tools = AsyncMock(return_value=SimpleNamespace(tools=[
+        SimpleNamespace(name="store_file", inputSchema={"type": "object"})
+    ]))
+    storage.call_tool = AsyncMock(return_value='{"success": true, "file_hash": "QmWhole"}')
+    vector = MagicMock()
+    vector.list_tools = AsyncMock(side_effect=ConnectionError("refused"))
+    manager.clients = {"storage": storage, "vector": vector}
+    
+    descriptions = await manager.load_tool_descriptions()
+    assert descriptions == {"storage": {"store_file": {"type": "object"}}}
+    assert manager._supports("vector", "similarity_search")
+    
+    await manager.storage_store_file(b"x" * (STREAM_THRESHOLD + 1))
+    assert [call.args[0] for call in storage.call_tool.call_args_list] == ["store_file"]
+
+
+@pytest.mark.asyncio
+async def test_store_deliverable_streams_and_hashes(mock_mcp_manager):
+    """Test streamed deliverables reach storage unbuffered with size and digest logged"""
+    import hashlib
+    
+    chunks = [b"first chunk ", b"second chunk"]
+    received = []
+    
+    async def store_file(file_data, metadata):
+        assert not isinstance(file_data, bytes)
+        async for chunk in file_data:
+            received.append(chunk)
+        return {"success": True, "file_hash": "QmStreamed"}
+    
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+    
+    with patch('gignova.ipfs.manager_mcp.mcp_manager', mock_mcp_manager):
+        mock_mcp_manager.storage_store_file = AsyncMock(side_effect=store_file)
+        file_hash = await IPFSManager().store_deliverable(stream())
+    
+    assert file_hash == "QmStreamed"
+    assert received == chunks
+    event_data = mock_mcp_manager.analytics_log_event.call_args.kwargs["event_data"]
+    assert event_data["file_size"] == len(b"".join(chunks))
+    assert event_data["sha256"] == hashlib.sha256(b"".join(chunks)).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_vector_manager_encodes_off_event_loop(mock_mcp_manager, mock_sentence_transformer):
+    """Test sentence encoding runs on the worker pool, not the event loop thread"""
+    import threading
+    
+    loop_thread = threading.current_thread()
+    encode_threads = []
+    
+    class RecordingEncoder(mock_sentence_transformer):
+        def encode(self, text, **kwargs):
+            encode_threads.append(threading.current_thread())
+            return super().encode(text, **kwargs)
+    
+    vector_manager = VectorManager()
+    vector_manager.encoder = RecordingEncoder()
+    
+    with patch('gignova.database.vector_manager_mcp.mcp_manager', mock_mcp_manager):
+        await vector_manager.store_job_embedding("job_123", "Test job", {})
+        matches = await vector_manager.find_matches("Another job")
+    
+    assert len(encode_threads) == 2
+    assert all(thread is not loop_thread for thread in encode_threads)
+    assert mock_mcp_manager.vector_store_embedding.call_args.kwargs["vector"] == [0.1, 0.2, 0.3, 0.4, 0.5]
+    assert matches[0]["freelancer_id"] == "123"
+
+
+def test_load_encoder_exports_quantized_model_once(tmp_path, mock_sentence_transformer):
+    """Test the int8 ONNX encoder is exported on first load and reused afterwards"""
+    from gignova.database import vector_manager_mcp
+    
+    loads = []
+    
+    class RecordingSentenceTransformer(mock_sentence_transformer):
+        def __init__(self, *args, **kwargs):
+            loads.append((args, kwargs))
+        
+        def save_pretrained(self, path):
+            pass
+    
+    def export(model, quantization, path):
+        quantized = tmp_path / vector_manager_mcp._QUANTIZED_FILE
+        quantized.parent.mkdir(parents=True)
+        quantized.write_bytes(b"onnx")
+    
+    export_mock = MagicMock(side_effect=export)
+    # _load_encoder imports these from sentence_transformers on each call
+    sentence_transformers_patch = patch.multiple(
+        'sentence_transformers',
+        SentenceTransformer=RecordingSentenceTransformer,
+        export_dynamic_quantized_onnx_model=export_mock,
+        create=True
+    )
+    with sentence_transformers_patch, \
+         patch.object(vector_manager_mcp.Settings, 'ENCODER_QUANTIZED', True), \
+         patch.object(vector_manager_mcp.Settings, 'ENCODER_ONNX_DIR', str(tmp_path)):
+        vector_manager_mcp._load_encoder()
+        vector_manager_mcp._load_encoder()
+    
+    assert export_mock.call_count == 1
+    assert loads[-1] == (
+        (str(tmp_path),),
+        {"backend": "onnx", "model_kwargs": {"file_name": vector_manager_mcp._QUANTIZED_FILE}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_freelancer_embeddings_batch_encodes_once(mock_mcp_manager):
+    """Test a batch of profiles is encoded in one call and stored in one MCP call"""
+    class BatchEncoder:
+        def __init__(self):
+            self.calls = []
+        
+        def encode(self, texts, **kwargs):
+            self.calls.append((texts, kwargs))
             
-            # Mock the process_job_posting method to return a successful result
-            with patch.object(orchestrator, 'process_job_posting', new=AsyncMock()) as mock_process:
-                mock_process.return_value = {
-                    "job_id": job_id,
-                    "status": "active",
-                    "freelancer_id": "freelancer_123",
-                    "agreed_rate": 175.0,
-                    "contract_address": "0x123456789",
-                    "escrow_id": "escrow_123",
-                    "confidence_score": 0.95
-                }
-                
-                job_result = await orchestrator.process_job_posting(job_post)
-                
-                assert "job_id" in job_result
-                assert job_result["status"] == "active"
-                assert "contract_address" in job_result
-                assert "escrow_id" in job_result
-                
-                # Test deliverable submission with mocked methods
-                with patch.object(orchestrator, 'submit_deliverable', new=AsyncMock()) as mock_submit:
-                    mock_submit.return_value = {
-                        "qa_passed": True,
-                        "similarity_score": 0.92,
-                        "file_hash": "QmTest123456",
-                        "payment_released": True
-                    }
-                    
-                    deliverable_result = await orchestrator.submit_deliverable(job_id, b"Test deliverable content")
-                    
-                    assert deliverable_result["qa_passed"] is True
-                    assert "similarity_score" in deliverable_result
-                    assert "file_hash" in deliverable_result
-                    assert deliverable_result["payment_released"] is True
-                    
-                    # Test agent evolution with mocked method
-                    with patch.object(orchestrator, 'evolve_agents', new=AsyncMock()) as mock_evolve:
-                        mock_evolve.return_value = {
-                            "matching": {"accuracy": 0.92},
-                            "qa": {"precision": 0.95}
-                        }
-                        
-                        evolution_result = await orchestrator.evolve_agents()
-                        
-                        assert "matching" in evolution_result
-                        assert "qa" in evolution_result
+            return [[float(i)] * 3 for i in range(len(texts))]
+    
+    vector_manager = VectorManager()
+    vector_manager.encoder = BatchEncoder()
+    mock_mcp_manager.vector_batch_store = AsyncMock(return_value={"success": True, "stored_count": 2})
+    
+    with patch('gignova.database.vector_manager_mcp.mcp_manager', mock_mcp_manager):
+        result = await vector_manager.store_freelancer_embeddings_batch([
+            ("f1", "Python developer", {"hourly_rate": 50}),
+            ("f2", "Solidity auditor", {"hourly_rate": 90})
+        ])
+    
+    assert result["success"]
+    assert vector_manager.encoder.calls == [
+        (["Python developer", "Solidity auditor"],
+         {"batch_size": 64, "convert_to_numpy": True, "normalize_embeddings": True})
+    ]
+    stored = mock_mcp_manager.vector_batch_store.call_args.args[0]
+    assert [item["id"] for item in stored] == ["freelancer_f1", "freelancer_f2"]
+    assert stored[1]["vector"] == [1.0, 1.0, 1.0]
+    assert stored[1]["metadata"] == {"type": "freelancer", "text": "Solidity auditor", "hourly_rate": 90}
+
+
+@pytest.mark.asyncio
+async def test_encoder_cache_reuses_and_evicts(mock_mcp_manager, mock_sentence_transformer):
+    """Test repeated texts skip the encoder and the cache stays within its cap"""
+    from gignova.database import vector_manager_mcp
+    
+    vector_manager = VectorManager()
+    vector_manager.encoder = MagicMock(wraps=mock_sentence_transformer())
+    
+    with patch('gignova.database.vector_manager_mcp.mcp_manager', mock_mcp_manager), \
+         patch.object(vector_manager_mcp.Settings, 'ENCODER_CACHE_SIZE', 2):
+        await vector_manager.find_matches("job a")
+        await vector_manager.find_matches("job a")
+        assert vector_manager.encoder.encode.call_count == 1
+        
+        await vector_manager.find_matches("job b")
+        await vector_manager.find_matches("job c")
+        assert len(vector_manager._emb_cache) == 2
+        
+        # "job a" was least recently used and has been evicted
+        await vector_manager.find_matches("job a")
+        assert vector_manager.encoder.encode.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_freelancer_reregistration_reuses_profile_embedding(mock_mcp_manager, mock_sentence_transformer):
+    """Test an unchanged profile is re-stored without encoding, even after LRU eviction"""
+    from gignova.database import vector_manager_mcp
+    
+    vector_manager = VectorManager()
+    vector_manager.encoder = MagicMock(wraps=mock_sentence_transformer())
+    
+    with patch('gignova.database.vector_manager_mcp.mcp_manager', mock_mcp_manager), \
+         patch.object(vector_manager_mcp.Settings, 'ENCODER_CACHE_SIZE', 1):
+        await vector_manager.store_freelancer_embedding("f1", "python dev", {"rate": 50})
+        await vector_manager.find_matches("unrelated job")  # evicts the profile from the LRU
+        await vector_manager.store_freelancer_embedding("f1", "python dev", {"rate": 60})
+        assert vector_manager.encoder.encode.call_count == 2
+        
+        await vector_manager.store_freelancer_embedding("f1", "python and rust dev", {"rate": 60})
+        assert vector_manager.encoder.encode.call_count == 3
+    
+    assert mock_mcp_manager.vector_store_embedding.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_store_deliverable_skips_repeat_upload(mock_mcp_manager):
+    """Test identical in-memory deliverables are uploaded once and reuse the stored hash"""
+    with patch('gignova.ipfs.manager_mcp.mcp_manager', mock_mcp_manager):
+        mock_mcp_manager.storage_store_file = AsyncMock(return_value={"success": True, "file_hash": "QmSame"})
+        manager = IPFSManager()
+        
+        first = await manager.store_deliverable(b"same deliverable")
+        second = await manager.store_deliverable(b"same deliverable")
+        await manager.store_deliverable(b"different deliverable")
+    
+    assert first == second == "QmSame"
+    assert mock_mcp_manager.storage_store_file.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_store_outcome_skips_embedding(mock_mcp_manager, mock_sentence_transformer):
+    """Test outcomes are logged as payload only, without encoding a vector"""
+    vector_manager = VectorManager()
+    vector_manager.encoder = MagicMock(wraps=mock_sentence_transformer())
+    mock_mcp_manager.analytics_log_event = AsyncMock()
+    
+    with patch('gignova.database.vector_manager_mcp.mcp_manager', mock_mcp_manager):
+        await vector_manager.store_outcome("qa_1", {"type": "qa", "passed": True})
+    
+    vector_manager.encoder.encode.assert_not_called()
+    mock_mcp_manager.vector_store_embedding.assert_not_called()
+    event_data = mock_mcp_manager.analytics_log_event.call_args.kwargs["event_data"]
+    assert event_data == {"interaction_id": "qa_1", "type": "qa", "passed": True}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+GigNova: Shared Pytest Hooks
+Keeps pytest's cache (--lf/--nf bookkeeping) from being written unless the
+run passes --cached.
+"""
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Write .pytest_cache so --lf/--nf work on the next run"
+    )
+
+
+def pytest_configure(config):
+    """Drop the plugins that write .pytest_cache unless --cached was given"""
+    if config.getoption("cached"):
+        return
+    
+    for name in ("lfplugin", "nfplugin"):
+        plugin = config.pluginmanager.get_plugin(name)
+        if plugin is not None:
+            config.pluginmanager.unregister(plugin)
@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+# Run the test suites in parallel with pytest-xdist (pip install -e ".[dev]").
+# backend/tests/conftest.py replaces mcp, sentence_transformers and numpy in
+# sys.modules, which breaks tests/ when both are collected by one process, so
+# each suite gets its own pytest run. --dist=loadfile keeps a file's tests on
+# one worker.
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+workers=$(( $(nproc) - 2 ))
+(( workers < 1 )) && workers=1
+
+export PYTHONPATH=backend${PYTHONPATH:+:$PYTHONPATH}
+
+status=0
+for suite in tests/ backend/tests/; do
+    python -m pytest -n "$workers" --dist=loadfile "$suite" "$@" || status=$?
+done
+exit $status
@@ -24,8 +24,6 @@ setup(
         # AI/ML Dependencies
         "openai>=1.3.5",
         "sentence-transformers>=2.2.2",
-        "torch>=2.1.1",
-        "transformers>=4.35.2",
         "numpy>=1.24.3",
         "langchain-groq>=0.3.2",
         "groq>=0.28.0",
@@ -33,21 +31,11 @@ setup(
         # Blockchain & Web3
         "web3>=6.11.3",
         "eth-account>=0.9.0",
-        "py-solc-x>=1.12.0",
-        
-        # Vector Database
-        "qdrant-client>=1.6.9",
-        
-        # IPFS
-        "ipfshttpclient>=0.8.0a2",
         
         # Environment & Configuration
         "python-dotenv>=1.0.0",
         "pydantic>=2.5.0",
         
-        # Background Tasks & Scheduling
-        "schedule>=1.2.0",
-        
         # MCP Integration
         "aiohttp>=3.9.1",
         "httpx>=0.25.2",
@@ -55,17 +43,36 @@ setup(
     ],
     extras_require={
         "dev": [
-            "pytest>=7.4.3",
-            "pytest-asyncio>=0.21.1",
+            "pytest>=8.2.0",
+            "pytest-asyncio>=0.24.0",
+            "pytest-xdist>=3.5.0",
+            "pytest-profiling>=1.7.0",
             "black>=23.11.0",
             "flake8>=6.1.0",
             "mypy>=1.7.1",
         ],
+        # Backends used directly by research.py and the standalone MCP servers;
+        # the gignova package reaches them through MCP and never imports them
+        "ml": [
+            "torch>=2.1.1",
+            "transformers>=4.35.2",
+            "qdrant-client>=1.6.9",
+        ],
+        "blockchain": [
+            "py-solc-x>=1.12.0",
+            "ipfshttpclient>=0.8.0a2",
+        ],
         "prod": [
             "gunicorn>=21.2.0",
             "prometheus-client>=0.19.0",
             "sentry-sdk[fastapi]>=1.38.0",
         ],
+        "perf": [
+            "faiss-cpu>=1.7.4",
+            "orjson>=3.9.10",
+            "sentence-transformers[onnx]>=3.2.0",
+            "simsimd>=5.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
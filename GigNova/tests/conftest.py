@@ -4,10 +4,10 @@ GigNova: Test Configuration
 """
 
 import os
+import copy
 import pytest
-from fastapi.testclient import TestClient
+from unittest.mock import patch
 
-from gignova.app import app
 from gignova.models.base import JobPost, FreelancerProfile, AgentConfig
 from gignova.agents.matching import MatchingAgent
 from gignova.agents.negotiation import NegotiationAgent
@@ -16,9 +16,36 @@ from gignova.agents.payment import PaymentAgent
 from gignova.orchestrator import GigNovaOrchestrator
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def shared_encoder():
+    """Load the sentence encoder once per session instead of once per agent.
+    Each VectorManager gets a shallow copy, so a test that replaces
+    encoder.encode doesn't leak the replacement into other tests."""
+    from gignova.database import vector_manager_mcp
+    
+    encoder = vector_manager_mcp._load_encoder()
+    with patch.object(vector_manager_mcp, "_load_encoder", lambda: copy.copy(encoder)):
+        yield encoder
+
+
+@pytest.fixture(autouse=True)
+def no_analytics_batch_window(monkeypatch):
+    """Flush analytics batches without waiting for the batching window, the
+    only real sleep on the tested code paths. asyncio.sleep itself is left
+    alone because the probe timeout tests rely on a genuinely hung call."""
+    from gignova.config.settings import Settings
+    monkeypatch.setattr(Settings, "ANALYTICS_BATCH_MS", 0)
+
+
+@pytest.fixture(scope="session")
 def test_client():
-    """Create a test client for FastAPI app with authentication bypass"""
+    """Create a test client for FastAPI app with authentication bypass.
+    Shared by the whole session; it is not entered as a context manager, so
+    the app's lifespan (MCP warm-up, scheduled tasks) never runs in tests."""
+    # Imported here so tests that never hit HTTP don't load the app
+    from fastapi.testclient import TestClient
+    from gignova.app import app
+    
     # Create a test user ID to use in tests
     test_user_id = "test-user-id"
     
@@ -34,7 +61,7 @@ def test_client():
     client = TestClient(app)
     yield client
     
-    # Clean up after tests
+    # Clean up after the session
     app.dependency_overrides = {}
 
 
@@ -79,9 +106,9 @@ def orchestrator():
     return GigNovaOrchestrator()
 
 
-@pytest.fixture
-def sample_job_post():
-    """Create a sample job post"""
+@pytest.fixture(scope="session")
+def sample_job_post_template():
+    """Validate the sample job post once per session"""
     return JobPost(
         title="Test Web Application",
         description="Build a responsive web application using React and FastAPI",
@@ -94,8 +121,14 @@ def sample_job_post():
 
 
 @pytest.fixture
-def sample_freelancer_profile():
-    """Create a sample freelancer profile"""
+def sample_job_post(sample_job_post_template):
+    """Create a sample job post (a copy, since tests reassign its fields)"""
+    return sample_job_post_template.model_copy()
+
+
+@pytest.fixture(scope="session")
+def sample_freelancer_profile_template():
+    """Validate the sample freelancer profile once per session"""
     return FreelancerProfile(
         freelancer_id="test-freelancer-id",
         name="Test Freelancer",
@@ -107,6 +140,12 @@ def sample_freelancer_profile():
 
 
 @pytest.fixture
+def sample_freelancer_profile(sample_freelancer_profile_template):
+    """Create a sample freelancer profile"""
+    return sample_freelancer_profile_template.model_copy()
+
+
+@pytest.fixture(scope="session")
 def auth_headers():
     """Create authentication headers for testing"""
     # In a real test, you would generate a valid JWT token
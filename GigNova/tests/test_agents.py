@@ -3,6 +3,7 @@
 GigNova: Tests for agent modules
 """
 
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -14,6 +15,18 @@ from gignova.agents.qa import QAAgent
 from gignova.agents.payment import PaymentAgent
 
 
+def _embedding(values):
+    """Read-only float32 embedding, safe to share between tests"""
+    vector = np.array(values, dtype=np.float32)
+    vector.setflags(write=False)
+    return vector
+
+
+# Fake encoder outputs for the QA test, built once at import
+REQUIREMENTS_EMBEDDING = _embedding([0.1, 0.2, 0.3])
+DELIVERABLE_EMBEDDING = _embedding([0.15, 0.25, 0.35])
+
+
 def test_base_agent_initialization(agent_config):
     """Test base agent initialization"""
     agent = BaseAgent(AgentType.MATCHING, agent_config)
@@ -59,24 +72,29 @@ async def test_matching_agent_find_matches(matching_agent, sample_job_post):
 
 
 @pytest.mark.asyncio
-async def test_negotiation_agent_negotiate(negotiation_agent):
-    """Test negotiation agent negotiate method"""
-    client_budget = (800.0, 1000.0)
-    
+@pytest.mark.parametrize("freelancer_rate,min_rate,max_rate", [
     # Test successful negotiation (rate within budget)
-    result = await negotiation_agent.negotiate(client_budget, 900.0)
-    assert result['success'] is True
-    assert result['agreed_rate'] == 900.0
-    assert result['rounds'] == 0
-    
+    (900.0, 900.0, 900.0),
     # Test successful negotiation (rate slightly above budget)
-    result = await negotiation_agent.negotiate(client_budget, 1100.0)
+    (1100.0, 1000.0, 1100.0),
+])
+async def test_negotiation_agent_negotiate(negotiation_agent, freelancer_rate, min_rate, max_rate):
+    """Test negotiation agent negotiate method"""
+    result = await negotiation_agent.negotiate((800.0, 1000.0), freelancer_rate)
+    
     assert result['success'] is True
-    assert 1000.0 <= result['agreed_rate'] <= 1100.0
+    assert min_rate <= result['agreed_rate'] <= max_rate
+    if freelancer_rate <= 1000.0:
+        assert result['rounds'] == 0
+
+
+@pytest.mark.asyncio
+async def test_negotiation_agent_negotiate_far_above_budget(negotiation_agent):
+    """Test negotiation with a rate far above the client's budget"""
+    result = await negotiation_agent.negotiate((800.0, 1000.0), 2000.0)
     
     # For the current implementation, the negotiation algorithm can actually reach an agreement
     # even with rates far above budget, so we'll test that it returns a reasonable rate
-    result = await negotiation_agent.negotiate(client_budget, 2000.0)
     if result['success']:
         # If successful, ensure the agreed rate is reasonable
         assert result['agreed_rate'] < 2000.0
@@ -89,7 +107,6 @@ async def test_negotiation_agent_negotiate(negotiation_agent):
 async def test_qa_agent_validate_deliverable(qa_agent):
     """Test QA agent validate_deliverable method"""
     from unittest.mock import AsyncMock
-    import numpy as np
     
     # Mock IPFS manager to return test data
     qa_agent.ipfs_manager.retrieve_deliverable = AsyncMock(return_value=b"This is a test deliverable with good quality content")
@@ -100,8 +117,8 @@ async def test_qa_agent_validate_deliverable(qa_agent):
     
     # Mock vector_manager.encoder to return test embeddings
     qa_agent.vector_manager.encoder.encode = MagicMock(side_effect=[
-        np.array([0.1, 0.2, 0.3]),  # First call (job requirements)
-        np.array([0.15, 0.25, 0.35])  # Second call (deliverable)
+        REQUIREMENTS_EMBEDDING,  # First call (job requirements)
+        DELIVERABLE_EMBEDDING  # Second call (deliverable)
     ])
     
     # Mock learn_from_outcome
@@ -163,3 +180,116 @@ async def test_payment_agent_methods(payment_agent):
     result = await payment_agent.release_payment('job123', "0xcontract123", "escrow123", False)
     assert result['success'] is False
     assert result['transaction_hash'] is None
+
+
+def test_qa_similarity_matches_with_and_without_simsimd():
+    """Test the SimSIMD cosine path agrees with the NumPy fallback"""
+    from gignova.utils import helpers
+    
+    a, b = [0.3, -1.2, 2.0], [0.5, 0.1, 1.5]
+    
+    class FakeSimSIMD:
+        @staticmethod
+        def cosine(x, y):
+            return 1.0 - float(x @ y) / float(((x @ x) * (y @ y)) ** 0.5)
+    
+    with patch.object(helpers, "simsimd", None):
+        expected = helpers.calculate_similarity(a, b)
+        assert helpers.calculate_similarity(a, [0.0, 0.0, 0.0]) == 0.0
+    with patch.object(helpers, "simsimd", FakeSimSIMD):
+        assert helpers.calculate_similarity(a, b) == pytest.approx(expected, abs=1e-6)
+        assert helpers.calculate_similarity(a, [0.0, 0.0, 0.0]) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_similarity_search_applies_score_threshold(tmp_path):
+    """Test results below the score threshold are dropped by the search itself"""
+    from gignova.database.local_vector_manager import LocalVectorManager
+    
+    vector_manager = LocalVectorManager(persist_directory=str(tmp_path))
+    await vector_manager.store_embedding("close", [1.0, 0.1], {"freelancer_id": "f1"})
+    await vector_manager.store_embedding("far", [0.0, 1.0], {"freelancer_id": "f2"})
+    
+    result = await vector_manager.similarity_search([1.0, 0.0], top_k=10, score_threshold=0.7)
+    
+    assert [match["id"] for match in result["results"]] == ["close"]
+
+
+@pytest.mark.asyncio
+async def test_similarity_search_sees_stores_and_deletes(tmp_path):
+    """Test the cached search matrix is rebuilt after the store changes"""
+    from gignova.database.local_vector_manager import LocalVectorManager
+    
+    vector_manager = LocalVectorManager(persist_directory=str(tmp_path))
+    await vector_manager.store_embedding("a", [1.0, 0.0], {})
+    assert [m["id"] for m in (await vector_manager.similarity_search([1.0, 0.0]))["results"]] == ["a"]
+    
+    await vector_manager.store_embedding("b", [1.0, 0.01], {})
+    await vector_manager.delete_embedding("a")
+    assert [m["id"] for m in (await vector_manager.similarity_search([1.0, 0.0]))["results"]] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_similarity_search_ivfpq_matches_exact(tmp_path):
+    """Test the IVF-PQ path returns the exact nearest neighbours on a clustered store"""
+    pytest.importorskip("faiss")
+    from gignova.database import local_vector_manager as lvm
+    
+    rng = np.random.default_rng(0)
+    vector_manager = lvm.LocalVectorManager(persist_directory=str(tmp_path))
+    vector_manager._save_embeddings = lambda: None
+    for i, vector in enumerate(rng.standard_normal((2000, 32)).astype(np.float32)):
+        vector_manager.embeddings[f"v{i}"] = {"embedding": vector.tolist(), "metadata": {}}
+    query = vector_manager.embeddings["v7"]["embedding"]
+    
+    exact = await vector_manager.similarity_search(query, top_k=1)
+    with patch.object(lvm, "ANN_MIN_VECTORS", 1000):
+        vector_manager._invalidate_index()
+        vector_manager.set_nprobe(64)
+        approximate = await vector_manager.similarity_search(query, top_k=1)
+    
+    assert vector_manager._ann_index is not None
+    assert approximate["results"][0]["id"] == exact["results"][0]["id"] == "v7"
+    assert approximate["results"][0]["score"] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_negotiation_closed_form_matches_round_by_round(negotiation_agent):
+    """Test the closed-form negotiation agrees with stepping through each round"""
+    def negotiate_iteratively(client_max, rate, max_rounds):
+        offer, ask, rounds = client_max, rate, 0
+        while abs(offer - ask) / ask > 0.15 and rounds < max_rounds:
+            midpoint = (offer + ask) / 2
+            offer, ask = offer + (midpoint - offer) * 0.7, ask - (ask - midpoint) * 0.3
+            rounds += 1
+        if abs(offer - ask) / ask <= 0.15:
+            return (offer + ask) / 2, rounds, True
+        return None, rounds, False
+    
+    for rate in [1010.0, 1200.0, 1500.0, 1800.0, 2500.0, 4000.0, 9000.0]:
+        result = await negotiation_agent.negotiate((800.0, 1000.0), rate)
+        agreed_rate, rounds, success = negotiate_iteratively(1000.0, rate, 3)
+        
+        assert result["success"] is success
+        assert result["rounds"] == rounds
+        if success:
+            assert result["agreed_rate"] == pytest.approx(agreed_rate)
+        else:
+            assert result["agreed_rate"] is None
+
+
+@pytest.mark.asyncio
+async def test_agent_memory_is_bounded(agent_config):
+    """Test that the in-process outcome memory keeps only the newest entries"""
+    from unittest.mock import AsyncMock
+    from gignova.agents import base
+
+    agent = BaseAgent(AgentType.QA, agent_config, vector_manager=MagicMock(store_outcome=AsyncMock()))
+
+    with patch.object(base.mcp_manager, "analytics_log_event", AsyncMock()):
+        for i in range(base.MEMORY_SIZE + 5):
+            await agent.learn_from_outcome({"type": "qa", "timestamp": i})
+
+    assert len(agent.memory) == base.MEMORY_SIZE
+    assert agent.memory[0]["timestamp"] == 5
+    assert agent.vector_manager.store_outcome.await_count == base.MEMORY_SIZE + 5
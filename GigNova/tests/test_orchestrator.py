@@ -3,28 +3,38 @@
 GigNova: Tests for orchestrator
 """
 
+import asyncio
+
 import pytest
+import pytest_asyncio
 from unittest.mock import patch, AsyncMock, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from gignova.models.base import JobStatus, JobPost, JobMatch, QAResult
-from gignova.orchestrator import GigNovaOrchestrator, mcp_manager
+import numpy as np
 
+from gignova.models.base import JobStatus, JobMatch, QAResult
+from gignova.orchestrator import GigNovaOrchestrator, JobRecord, mcp_manager
+from gignova.database.job_columns import JobColumns, STATUS_CODES
 
-@pytest.fixture
-def mock_agents():
-    """Create mocked agents for testing"""
-    mock_matching = MagicMock()
-    mock_negotiation = MagicMock()
-    mock_qa = MagicMock()
-    mock_payment = MagicMock()
-    
-    return {
-        'matching': mock_matching,
-        'negotiation': mock_negotiation,
-        'qa': mock_qa,
-        'payment': mock_payment
-    }
+
+@pytest_asyncio.fixture(loop_scope="module", autouse=True)
+async def cancel_leftover_tasks():
+    """Stop any event flusher a test left running on the shared module loop"""
+    yield
+    tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.fixture(autouse=True)
+def mock_analytics(monkeypatch):
+    """Replace the analytics MCP calls for each test; monkeypatch restores the originals"""
+    for name in ("analytics_log_event", "analytics_log_events"):
+        monkeypatch.setattr(mcp_manager, name, AsyncMock(return_value={"success": True}))
+    monkeypatch.setattr(
+        mcp_manager, "analytics_get_metrics", AsyncMock(return_value={"success": True, "data": {}})
+    )
 
 
 @patch('gignova.orchestrator.MatchingAgent')
@@ -44,12 +54,9 @@ def test_orchestrator_initialization(mock_payment, mock_qa, mock_negotiation, mo
     assert orchestrator.contracts == {}
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_process_job_posting(sample_job_post):
     """Test job posting processing"""
-    # Mock MCP manager
-    mcp_manager.analytics_log_event = AsyncMock(return_value={"success": True})
-    
     orchestrator = GigNovaOrchestrator()
     
     # Mock vector_manager.store_job_embedding to prevent "Numpy is not available" error
@@ -99,28 +106,15 @@ async def test_process_job_posting(sample_job_post):
     assert orchestrator.jobs[job_id]["status"] == JobStatus.ACTIVE
 
 
-@pytest.mark.asyncio
-async def test_submit_deliverable():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_submit_deliverable(sample_job_post):
     """Test deliverable submission"""
-    # Mock MCP manager
-    mcp_manager.analytics_log_event = AsyncMock(return_value={"success": True})
-    
     orchestrator = GigNovaOrchestrator()
     
     # Setup test job
-    job_post = JobPost(
-        title="Test Job",
-        description="Test description",
-        skills=["python"],
-        budget_min=1000.0,
-        budget_max=2000.0,
-        deadline_days=14,
-        client_id="client123"
-    )
-    
     job_id = "job123"
     orchestrator.jobs[job_id] = {
-        "post": job_post,
+        "post": sample_job_post,
         "status": JobStatus.ACTIVE,
         "created_at": datetime.now(),
         "freelancer_id": "freelancer123"
@@ -157,41 +151,29 @@ async def test_submit_deliverable():
     assert orchestrator.jobs[job_id]["deliverable_hash"] == "ipfs_hash_123"
 
 
-@pytest.mark.asyncio
-async def test_get_performance_metrics():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_get_performance_metrics(sample_job_post):
     """Test performance metrics calculation"""
-    # Mock MCP manager
-    mcp_manager.analytics_log_event = AsyncMock(return_value={"success": True})
-    mcp_manager.analytics_get_metrics = AsyncMock(return_value={"success": True, "data": {"mcp_metric": 0.95}})
+    mcp_manager.analytics_get_metrics.return_value = {"success": True, "data": {"mcp_metric": 0.95}}
     
     orchestrator = GigNovaOrchestrator()
     
     # Setup test jobs
-    job_post = JobPost(
-        title="Test Job",
-        description="Test description",
-        skills=["python"],
-        budget_min=1000.0,
-        budget_max=2000.0,
-        deadline_days=14,
-        client_id="client123"
-    )
-    
     # Add jobs with different statuses
     orchestrator.jobs = {
         "job1": {
-            "post": job_post,
+            "post": sample_job_post,
             "status": JobStatus.POSTED,
             "created_at": datetime.now()
         },
         "job2": {
-            "post": job_post,
+            "post": sample_job_post,
             "status": JobStatus.ACTIVE,
             "created_at": datetime.now(),
             "freelancer_id": "freelancer1"
         },
         "job3": {
-            "post": job_post,
+            "post": sample_job_post,
             "status": JobStatus.COMPLETED,
             "created_at": datetime.now(),
             "freelancer_id": "freelancer2",
@@ -213,3 +195,402 @@ async def test_get_performance_metrics():
     assert metrics["completion_rate"] == 1/3  # 1 out of 3 jobs completed
     assert metrics["avg_qa_score"] == 0.92  # Only one job with QA
     assert metrics["active_jobs"] == 1  # One active job
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_flush_events_sends_queued_batches():
+    """Test queued analytics events are batched and all delivered on flush"""
+    orchestrator = GigNovaOrchestrator()
+    orchestrator.start_event_flusher()
+    
+    with patch("gignova.orchestrator.Settings.ANALYTICS_BATCH_SIZE", 4):
+        for i in range(10):
+            orchestrator._log("test_event", {"i": i})
+        await orchestrator.flush_events()
+    
+    batches = [call.args[0] for call in mcp_manager.analytics_log_events.call_args_list]
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [event["event_data"]["i"] for batch in batches for event in batch] == list(range(10))
+    assert orchestrator._flusher_task is None
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_flush_events_dedupes_identical_events():
+    """Test identical events within a batch are sent once with a count"""
+    orchestrator = GigNovaOrchestrator()
+    orchestrator.start_event_flusher()
+    
+    for _ in range(3):
+        orchestrator._log("qa_failed", {"job_id": "job123", "error": "timeout"})
+    orchestrator._log("qa_failed", {"error": "timeout", "job_id": "job456"})
+    await orchestrator.flush_events()
+    
+    batch = mcp_manager.analytics_log_events.call_args.args[0]
+    assert batch == [
+        {"event_type": "qa_failed", "event_data": {"job_id": "job123", "error": "timeout"}, "count": 3},
+        {"event_type": "qa_failed", "event_data": {"error": "timeout", "job_id": "job456"}}
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_metrics_track_directly_inserted_jobs(sample_job_post):
+    """Test counters follow jobs stored or removed through orchestrator.jobs[...]"""
+    mcp_manager.analytics_get_metrics.return_value = {"success": False}
+    
+    orchestrator = GigNovaOrchestrator()
+    
+    orchestrator.jobs["job123"] = {
+        "post": sample_job_post,
+        "status": JobStatus.ACTIVE,
+        "created_at": datetime.now(),
+        "freelancer_id": "freelancer123"
+    }
+    
+    orchestrator.qa_agent.ipfs_manager = MagicMock()
+    orchestrator.qa_agent.ipfs_manager.store_deliverable = AsyncMock(return_value="ipfs_hash_123")
+    orchestrator.qa_agent.validate_deliverable = AsyncMock(return_value=QAResult(
+        job_id="job123",
+        deliverable_hash="ipfs_hash_123",
+        similarity_score=0.9,
+        passed=True,
+        feedback="Excellent work"
+    ))
+    orchestrator.payment_agent.release_payment = AsyncMock(return_value={"success": True})
+    orchestrator.matching_agent.learn_from_outcome = AsyncMock()
+    
+    result = await orchestrator.submit_deliverable("job123", b"Test deliverable content")
+    assert result["qa_passed"] is True
+    
+    metrics = await orchestrator.get_performance_metrics()
+    assert metrics["total_jobs"] == 1
+    assert metrics["active_jobs"] == 0
+    assert metrics["match_rate"] == 1.0
+    assert metrics["completion_rate"] == 1.0
+    assert metrics["avg_qa_score"] == pytest.approx(0.9)
+    
+    del orchestrator.jobs["job123"]
+    assert orchestrator._counts == {"completed": 0, "matched": 0, "active": 0}
+    assert orchestrator._qa_n == 0
+    assert orchestrator.job_columns.size == 0
+    
+    await orchestrator.flush_events()
+
+
+def test_job_columns_grow_remove_and_outcome_stats():
+    """Test the columnar job mirror keeps rows aligned across growth and removal"""
+    columns = JobColumns(capacity=2)
+    now = datetime.now()
+    
+    columns.add("old", JobStatus.COMPLETED, now - timedelta(days=30))
+    columns.add("a", JobStatus.COMPLETED, now)
+    columns.add("b", JobStatus.ACTIVE, now)
+    columns.add("c", JobStatus.COMPLETED, now)
+    columns.set_qa_score("a", 0.8)
+    columns.set_qa_score("c", 0.6)
+    columns.set_qa_score("old", 0.1)
+    
+    assert columns.size == 4
+    assert len(columns.status) >= 4
+    
+    stats = columns.outcome_stats(now - timedelta(days=7))
+    assert stats["jobs"] == 3
+    assert stats["success_rate"] == pytest.approx(2 / 3)
+    assert stats["avg_qa_score"] == pytest.approx(0.7)
+    
+    # Removing a row moves the last one into its slot without mixing up values
+    columns.remove("a")
+    assert columns.size == 3
+    assert columns.index["c"] == 1
+    assert columns.qa_score[1] == pytest.approx(0.6)
+    
+    stats = columns.outcome_stats(now - timedelta(days=7))
+    assert stats["jobs"] == 2
+    assert stats["success_rate"] == pytest.approx(0.5)
+    assert stats["avg_qa_score"] == pytest.approx(0.6)
+    
+    assert JobColumns().outcome_stats(now) == {"jobs": 0, "success_rate": 0.0, "avg_qa_score": 0.0}
+
+
+def test_outcome_reduce_skips_missing_qa_scores():
+    """Test the outcome reduction counts jobs after the cutoff and ignores NaN QA scores"""
+    from gignova.database import job_columns
+    
+    status = np.array([0, 3, 3, 1, 3], dtype=np.uint8)
+    qa_score = np.array([np.nan, 0.9, np.nan, 0.5, 0.7], dtype=np.float32)
+    created_at = np.array([10, 20, 30, 40, 5], dtype=np.int64)
+    
+    result = job_columns._outcome_reduce(status, qa_score, created_at, 15, 3)
+    
+    assert result == (3, 2, pytest.approx(1.4), 2)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_qa_reuses_requirements_embedding(sample_job_post):
+    """Test QA gets the posting-time embedding of the exact requirements text"""
+    orchestrator = GigNovaOrchestrator()
+    orchestrator.matching_agent.embed_job = AsyncMock(return_value=[1.0, 0.0])
+    orchestrator.matching_agent.vector_manager.store_job_embedding = AsyncMock(return_value={"success": True})
+    orchestrator.matching_agent.find_matches = AsyncMock(return_value=[])
+    orchestrator.qa_agent.embed_requirements = AsyncMock(return_value=[0.0, 1.0])
+    
+    result = await orchestrator.process_job_posting(sample_job_post)
+    job_id = result["job_id"]
+    
+    requirements = f"{sample_job_post.title} {sample_job_post.description}"
+    orchestrator.qa_agent.embed_requirements.assert_awaited_once_with(requirements)
+    orchestrator.matching_agent.find_matches.assert_awaited_once_with(sample_job_post, [1.0, 0.0])
+    
+    orchestrator.qa_agent.ipfs_manager = MagicMock()
+    orchestrator.qa_agent.ipfs_manager.store_deliverable = AsyncMock(return_value="ipfs_hash_123")
+    orchestrator.qa_agent.validate_deliverable = AsyncMock(return_value=QAResult(
+        job_id=job_id,
+        deliverable_hash="ipfs_hash_123",
+        similarity_score=0.4,
+        passed=False,
+        feedback="Needs revision"
+    ))
+    
+    await orchestrator.submit_deliverable(job_id, b"Test deliverable content")
+    
+    orchestrator.qa_agent.validate_deliverable.assert_awaited_once_with(
+        job_id, requirements, "ipfs_hash_123", requirements_embedding=[0.0, 1.0]
+    )
+    await orchestrator.flush_events()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_vectors_sent_as_float32_base64():
+    """Test embeddings are shipped to the vector server as little-endian float32 bytes"""
+    import base64
+    from gignova.mcp.client import _encode_vector
+    
+    vector = [0.1, -2.5, 3.0]
+    decoded = np.frombuffer(base64.b64decode(_encode_vector(vector)), dtype="<f4")
+    np.testing.assert_allclose(decoded, np.asarray(vector, dtype=np.float32))
+    assert _encode_vector(np.asarray(vector)) == _encode_vector(vector)
+    
+    vector_client = MagicMock()
+    vector_client.call_tool = AsyncMock(return_value='{"success": true}')
+    with patch.dict(mcp_manager.clients, {"vector": vector_client}):
+        await mcp_manager.vector_similarity_search(vector, threshold=0.5)
+    
+    tool, payload = vector_client.call_tool.call_args.args
+    assert tool == "similarity_search"
+    assert payload["query_vector_f32_b64"] == _encode_vector(vector)
+    assert "query_vector" not in payload
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_vectors_fall_back_to_float_lists_for_older_servers():
+    """Test a vector server that rejects packed vectors gets JSON float lists from then on"""
+    
+    async def call_tool(tool, payload):
+        if "vector" in payload or "query_vector" in payload:
+            return '{"success": true}'
+        return '{"success": false, "error": "missing field vector"}'
+    
+    vector_client = MagicMock()
+    vector_client.call_tool = AsyncMock(side_effect=call_tool)
+    with patch.dict(mcp_manager.clients, {"vector": vector_client}), \
+         patch.object(mcp_manager, "_vector_packed", True):
+        stored = await mcp_manager.vector_store_embedding("job_1", np.array([0.5, 0.25]))
+        found = await mcp_manager.vector_similarity_search([0.5, 0.25])
+        packed_after_fallback = mcp_manager._vector_packed
+    
+    assert stored == found == {"success": True}
+    assert packed_after_fallback is False
+    payloads = [call.args[1] for call in vector_client.call_tool.call_args_list]
+    assert "vector_f32_b64" in payloads[0]
+    assert payloads[1]["vector"] == [0.5, 0.25]
+    # The search goes straight to the float-list form
+    assert len(payloads) == 3
+    assert payloads[2]["query_vector"] == [0.5, 0.25]
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_initialize_mcp_connections_probes_without_writing():
+    """Test startup probes are read-only and a hung server times out on its own"""
+    
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(60)
+    
+    orchestrator = GigNovaOrchestrator()
+    with patch.object(mcp_manager, "vector_store_embedding", new=AsyncMock()) as store, \
+         patch.object(mcp_manager, "vector_call_tool", new=AsyncMock(return_value={"success": True})) as vector_probe, \
+         patch.object(mcp_manager, "blockchain_call_tool", new=AsyncMock(side_effect=hang)) as blockchain_probe, \
+         patch.object(mcp_manager, "storage_call_tool", new=AsyncMock(side_effect=RuntimeError("down"))), \
+         patch.object(mcp_manager, "load_tool_descriptions", new=AsyncMock(return_value={})) as describe, \
+         patch("gignova.orchestrator._PROBE_TIMEOUT", 0.05):
+        status = await orchestrator.initialize_mcp_connections()
+    
+    assert status == {
+        "vector_mcp": True,
+        "blockchain_mcp": False,
+        "storage_mcp": False,
+        "analytics_mcp": True
+    }
+    vector_probe.assert_awaited_once_with("get_collection_info", {})
+    blockchain_probe.assert_awaited_once_with("get_status", {})
+    store.assert_not_called()
+    describe.assert_awaited_once()
+    await orchestrator.flush_events()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_evolve_agents_isolates_agent_failures():
+    """Test agents evolve concurrently and one failure does not abort the rest"""
+    orchestrator = GigNovaOrchestrator()
+    orchestrator.matching_agent.evolve = AsyncMock(return_value={"accuracy": 0.9})
+    orchestrator.negotiation_agent.evolve = AsyncMock(side_effect=RuntimeError("boom"))
+    orchestrator.qa_agent.evolve = AsyncMock(return_value={"precision": 0.95})
+    orchestrator.payment_agent.evolve = AsyncMock(return_value={})
+    
+    results = await orchestrator.evolve_agents()
+    
+    assert results["matching"] == {"accuracy": 0.9}
+    assert results["negotiation"] == {"error": "RuntimeError('boom')"}
+    assert results["qa"] == {"precision": 0.95}
+    assert results["job_stats"]["jobs"] == 0
+    await orchestrator.flush_events()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_error_logs_carry_job_id(sample_job_post, caplog):
+    """Test orchestrator log records are tagged with the job being processed"""
+    from gignova.utils.helpers import JOB_CTX
+    
+    
+    orchestrator = GigNovaOrchestrator()
+    orchestrator.matching_agent.embed_job = AsyncMock(side_effect=RuntimeError("encoder down"))
+    orchestrator.qa_agent.embed_requirements = AsyncMock(return_value=[0.0, 1.0])
+    
+    with caplog.at_level("ERROR", logger="gignova.orchestrator"):
+        result = await orchestrator.process_job_posting(sample_job_post)
+    
+    record = caplog.records[-1]
+    assert record.getMessage() == "Job processing failed: encoder down"
+    assert record.job_id == result["job_id"]
+    assert JOB_CTX.get() == "-"
+    await orchestrator.flush_events()
+
+
+def test_agents_share_one_vector_manager():
+    """Test the orchestrator hands every agent the same vector manager"""
+    orchestrator = GigNovaOrchestrator()
+    
+    agents = [
+        orchestrator.matching_agent,
+        orchestrator.negotiation_agent,
+        orchestrator.qa_agent,
+        orchestrator.payment_agent
+    ]
+    assert all(agent.vector_manager is orchestrator.vector_manager for agent in agents)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_job_embedding_store_overlaps_escrow(sample_job_post):
+    """Test the job embedding write runs alongside negotiation and escrow"""
+    orchestrator = GigNovaOrchestrator()
+    escrow_started = asyncio.Event()
+    stored = []
+    
+    async def store_job_embedding(job_id, *args, **kwargs):
+        # Only completes once escrow creation is underway
+        await escrow_started.wait()
+        stored.append(job_id)
+    
+    async def create_escrow(contract_data):
+        escrow_started.set()
+        return {"success": True, "contract_address": "0xcontract_123", "escrow_id": "escrow_123"}
+    
+    orchestrator.matching_agent.embed_job = AsyncMock(return_value=[1.0, 0.0])
+    orchestrator.qa_agent.embed_requirements = AsyncMock(return_value=[0.0, 1.0])
+    orchestrator.matching_agent.vector_manager.store_job_embedding = store_job_embedding
+    orchestrator.matching_agent.find_matches = AsyncMock(return_value=[
+        {"freelancer_id": "freelancer123", "score": 0.85}
+    ])
+    orchestrator.negotiation_agent.negotiate = AsyncMock(return_value={
+        "agreed_rate": 1500.0, "rounds": 0, "success": True
+    })
+    orchestrator.payment_agent.create_escrow = create_escrow
+    
+    result = await asyncio.wait_for(orchestrator.process_job_posting(sample_job_post), timeout=2)
+    
+    assert result["status"] == "active"
+    # The store finished before process_job_posting returned
+    assert stored == [result["job_id"]]
+    await orchestrator.flush_events()
+
+
+def test_per_user_job_indexes(sample_job_post_template):
+    """Test the client/freelancer job indexes follow inserts, assignment and removal"""
+    orchestrator = GigNovaOrchestrator()
+    
+    def job_for(client_id):
+        return {
+            "post": sample_job_post_template.model_copy(update={"client_id": client_id}),
+            "status": JobStatus.POSTED,
+            "created_at": datetime.now()
+        }
+    
+    orchestrator.jobs["job1"] = job_for("client1")
+    orchestrator.jobs["job2"] = job_for("client2")
+    orchestrator.jobs["job2"].freelancer_id = "client1"
+    
+    assert orchestrator.user_job_ids("client1") == ["job1", "job2"]
+    assert orchestrator.user_job_ids("client2") == ["job2"]
+    assert orchestrator.user_job_ids("nobody") == []
+    
+    del orchestrator.jobs["job2"]
+    assert orchestrator.user_job_ids("client1") == ["job1"]
+    assert orchestrator.user_job_ids("client2") == []
+
+
+def test_job_table_stores_slotted_records():
+    """Test dicts stored in the job table become JobRecords that still support key access"""
+    orchestrator = GigNovaOrchestrator()
+    orchestrator.jobs["job1"] = {"status": JobStatus.ACTIVE, "freelancer_id": "f1"}
+    
+    job = orchestrator.jobs["job1"]
+    assert isinstance(job, JobRecord)
+    assert not hasattr(job, "__dict__")
+    assert job.status is job["status"] is JobStatus.ACTIVE
+    assert job.get("qa_result") is None and job.get("negotiation_rounds", 0) == 0
+    assert orchestrator.user_job_ids("f1") == ["job1"]
+    
+    with pytest.raises(KeyError):
+        job["unknown_field"] = 1
+
+
+def test_job_record_writes_keep_counters_and_columns_in_step(sample_job_post):
+    """Test direct writes to a stored record update the counters, columns and indexes"""
+    orchestrator = GigNovaOrchestrator()
+    orchestrator.jobs["job1"] = {"post": sample_job_post, "status": JobStatus.POSTED}
+    job = orchestrator.jobs["job1"]
+    row = orchestrator.job_columns.index["job1"]
+    
+    job.status = JobStatus.ACTIVE
+    assert orchestrator._counts == {"completed": 0, "matched": 1, "active": 1}
+    job["status"] = JobStatus.COMPLETED
+    assert orchestrator._counts == {"completed": 1, "matched": 1, "active": 0}
+    assert orchestrator.job_columns.status[row] == STATUS_CODES[JobStatus.COMPLETED]
+    
+    job.match_confidence = 0.8
+    assert orchestrator.job_columns.match_conf[row] == pytest.approx(0.8)
+    
+    job.qa_result = QAResult(job_id="job1", deliverable_hash="h1", similarity_score=0.6,
+                             passed=False, feedback="Needs revision")
+    job["qa_result"] = QAResult(job_id="job1", deliverable_hash="h2", similarity_score=0.9,
+                                passed=True, feedback="Approved")
+    assert (orchestrator._qa_n, orchestrator._qa_sum) == (1, pytest.approx(0.9))
+    assert orchestrator.job_columns.qa_score[row] == pytest.approx(0.9)
+    
+    job.freelancer_id = "f1"
+    job["freelancer_id"] = "f2"
+    assert orchestrator.user_job_ids("f1") == []
+    assert orchestrator.user_job_ids("f2") == ["job1"]
+    
+    # A removed record no longer reports its writes
+    del orchestrator.jobs["job1"]
+    job.status = JobStatus.ACTIVE
+    assert orchestrator._counts == {"completed": 0, "matched": 0, "active": 0}